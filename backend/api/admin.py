@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from django.contrib import admin
 
 from .models import (
@@ -9,9 +11,23 @@ from .models import (
     WeightCategory,
     WeightCategoryEra,
 )
+from .models.history import buffered_history
+
+if TYPE_CHECKING:
+    _AdminBase = admin.ModelAdmin
+else:
+    _AdminBase = object
+
+
+class BufferedHistoryMixin(_AdminBase):
+    """Create the history and audit log rows of bulk actions at once."""
 
+    def response_action(self, request, queryset):
+        with buffered_history():
+            return super().response_action(request, queryset)
 
-class AthleteAdmin(admin.ModelAdmin):
+
+class AthleteAdmin(BufferedHistoryMixin, admin.ModelAdmin):
     search_fields = ("first_name", "last_name")
     readonly_fields = (
         "reference_id",
@@ -21,20 +37,28 @@ class AthleteAdmin(admin.ModelAdmin):
     list_display = ("first_name", "last_name", "yearborn")
 
 
-class CompetitionAdmin(admin.ModelAdmin):
+class CompetitionAdmin(BufferedHistoryMixin, admin.ModelAdmin):
     search_fields = ("name", "location")
     readonly_fields = ("reference_id",)
     list_display = ("date_start", "date_end", "location", "name")
 
 
-class LiftAdmin(admin.ModelAdmin):
+class LiftAdmin(BufferedHistoryMixin, admin.ModelAdmin):
     search_fields = (
         "competition__name",
         "competition__location",
         "athlete__first_name",
         "athlete__last_name",
     )
-    readonly_fields = ("reference_id",)
+    readonly_fields = (
+        "reference_id",
+        "best_snatch",
+        "best_cnj",
+        "total_lifted",
+        "sinclair",
+        "grade",
+        "weight_class",
+    )
     fieldsets = (
         (
             None,
@@ -65,12 +89,25 @@ class LiftAdmin(admin.ModelAdmin):
                 )
             },
         ),
+        (
+            "Results",
+            {
+                "fields": (
+                    "best_snatch",
+                    "best_cnj",
+                    "total_lifted",
+                    "sinclair",
+                    "grade",
+                )
+            },
+        ),
         (
             "Other",
             {
                 "fields": (
                     "bodyweight",
                     "weight_category",
+                    "weight_class",
                     "team",
                     "lottery_number",
                 )
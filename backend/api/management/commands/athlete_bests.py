@@ -0,0 +1,23 @@
+"""Rebuild the athlete personal bests."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import AthleteBest
+
+
+class Command(BaseCommand):
+    help = "Recreate the personal bests of all athletes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Lifts fetched and bests created per query.",
+        )
+
+    def handle(self, *args, **options):
+        created = AthleteBest.objects.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} athlete bests.")
+        )
@@ -0,0 +1,16 @@
+"""Rebuild the competition snapshots."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import Competition, CompetitionSnapshot
+
+
+class Command(BaseCommand):
+    help = "Rebuild the results snapshot of every competition."
+
+    def handle(self, *args, **options):
+        pks = CompetitionSnapshot.objects.expire(
+            Competition.objects.values_list("pk", flat=True), rebuild=False
+        )
+        built = sum(CompetitionSnapshot.objects.build(pk) for pk in pks)
+        self.stdout.write(self.style.SUCCESS(f"Built {built} snapshots."))
@@ -0,0 +1,350 @@
+"""Import lifts from historical results spreadsheets.
+
+One row per lift, the header names the columns:
+
+- competition: `competition`, `location`, `date_start` and `date_end` \
+        (defaults to `date_start`).
+- athlete: `first_name`, `last_name` and `yearborn`.
+- lift: the fields of `LiftBulkSerializer`, e.g. `lottery_number`, \
+        `bodyweight`, `weight_category`, `snatch_first`, \
+        `snatch_first_weight`, ...
+
+Empty cells fall back to the field defaults.
+"""
+
+import csv
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import repeat
+from multiprocessing import get_context
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, connections, transaction
+
+from api.models import (
+    Athlete,
+    AthleteBest,
+    Competition,
+    CompetitionSnapshot,
+    Lift,
+)
+from api.models.caches import (
+    invalidate_counts,
+    invalidate_lift_responses,
+    suppressed_invalidation,
+)
+from api.models.history import buffered_history
+from api.serializers import LiftBulkSerializer
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover
+    openpyxl = None
+
+COMPETITION_COLUMNS = ("competition", "location", "date_start", "date_end")
+ATHLETE_COLUMNS = ("first_name", "last_name", "yearborn")
+
+
+@dataclass
+class SheetReport:
+    """Outcome of importing the lifts of one sheet."""
+
+    path: str
+    imported: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+    # primary keys of the athletes with imported lifts
+    athletes: set[str] = field(default_factory=set)
+
+
+def read_rows(path: Path) -> list[dict]:
+    """Rows of a CSV or XLSX sheet as dicts, without empty cells."""
+    suffix = path.suffix.lower()
+    if suffix == ".xlsx":
+        if openpyxl is None:
+            raise CommandError("Install openpyxl to import .xlsx files.")
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        values = workbook.active.iter_rows(values_only=True)
+        header = [str(cell or "").strip() for cell in next(values, ())]
+        rows = [dict(zip(header, row)) for row in values]
+        workbook.close()
+    elif suffix == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as file:
+            rows = list(csv.DictReader(file))
+    else:
+        raise CommandError(f"{path}: only .csv and .xlsx files are imported.")
+    return [
+        {column: value for column, value in row.items() if value != ""}
+        for row in rows
+    ]
+
+
+def competition_key(row: dict) -> tuple:
+    """Name and start date of the competition of `row`."""
+    date_start = Competition._meta.get_field("date_start").to_python(
+        row["date_start"]
+    )
+    return str(row["competition"]).strip(), date_start
+
+
+def athlete_key(row: dict) -> tuple:
+    """Names and year of birth of the athlete of `row`."""
+    return (
+        str(row["first_name"]).strip(),
+        str(row["last_name"]).strip(),
+        int(row["yearborn"]),
+    )
+
+
+def format_errors(errors: dict) -> str:
+    """Serializer errors of a lift on one line."""
+    return "; ".join(
+        message if name == "non_field_errors" else f"{name}: {message}"
+        for name, messages in errors.items()
+        for message in messages
+    )
+
+
+def import_sheet(
+    path, rows, competitions, athletes, batch_size
+) -> SheetReport:
+    """Validate and bulk create the lifts of a sheet, chunk by chunk.
+
+    Invalid lifts are reported and skipped, each chunk is created in its own \
+            transaction. Athlete bests are not refreshed.
+
+    Args:
+        path (str): Sheet the rows are read from, for the report.
+        rows (list[dict]): Rows of the sheet.
+        competitions (dict[tuple, str]): Primary keys by `competition_key()`.
+        athletes (dict[tuple, str]): Primary keys by `athlete_key()`, rows \
+                of missing competitions or athletes are skipped.
+        batch_size (int): Lifts validated and created at once.
+    """
+    started = time.perf_counter()
+    report = SheetReport(path=str(path))
+    by_competition: dict[str, list] = {}
+    for line, row in enumerate(rows, start=2):
+        try:
+            competition = competitions[competition_key(row)]
+            athlete = athletes[athlete_key(row)]
+        except (KeyError, ValueError, ValidationError):
+            # reported when resolving competitions and athletes
+            continue
+        lift = {
+            column: value
+            for column, value in row.items()
+            if column not in COMPETITION_COLUMNS + ATHLETE_COLUMNS
+        }
+        lift["athlete"] = athlete
+        by_competition.setdefault(competition, []).append((line, lift))
+
+    for pk, competition in Competition.objects.in_bulk(
+        list(by_competition)
+    ).items():
+        lifts = by_competition[str(pk)]
+        for start in range(0, len(lifts), batch_size):
+            chunk = lifts[start : start + batch_size]
+            validated = _validate(chunk, competition, report)
+            if not validated:
+                continue
+            try:
+                created = Lift.objects.create_many(
+                    [
+                        Lift(competition=competition, **attrs)
+                        for attrs in validated
+                    ],
+                    batch_size=batch_size,
+                    athlete_bests=False,
+                )
+            except IntegrityError as exc:
+                # e.g. another sheet of the same competition
+                lines = f"{chunk[0][0]}-{chunk[-1][0]}"
+                report.errors.append(f"{path}:{lines}: {exc}")
+                continue
+            report.imported += len(created)
+            report.athletes.update(str(lift.athlete_id) for lift in created)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _validate(chunk, competition, report) -> list[dict]:
+    """Validated data of the valid lifts in `chunk`, errors are reported.
+
+    Lifts are validated again without the invalid ones, as the checks of a \
+            lift depend on the others.
+    """
+    while chunk:
+        serializer = LiftBulkSerializer(
+            data=[lift for _, lift in chunk],
+            many=True,
+            context={"competition": competition},
+        )
+        if serializer.is_valid():
+            return serializer.validated_data
+        valid = []
+        for (line, lift), errors in zip(chunk, serializer.errors):
+            if errors:
+                report.errors.append(
+                    f"{report.path}:{line}: {format_errors(errors)}"
+                )
+            else:
+                valid.append((line, lift))
+        chunk = valid
+    return []
+
+
+class Command(BaseCommand):
+    help = (
+        "Import lifts from CSV or XLSX results sheets, one row per lift. "
+        "Athletes are matched by name similarity and year of birth, "
+        "competitions by name and start date, missing ones are created."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="+", type=Path)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes importing sheets in parallel, one sheet each.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Lifts validated and created per transaction.",
+        )
+        parser.add_argument(
+            "--similarity",
+            type=float,
+            default=0.6,
+            help="Minimum name similarity (0-1) to match an athlete.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and report in one process, then roll back.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        for path in options["files"]:
+            if not path.is_file():
+                raise CommandError(f"{path} does not exist.")
+        sheets = {path: read_rows(path) for path in options["files"]}
+        if options["dry_run"]:
+            with suppressed_invalidation(), transaction.atomic():
+                reports = self._import(sheets, **{**options, "workers": 1})
+                transaction.set_rollback(True)
+        else:
+            reports = self._import(sheets, **options)
+
+        for report in reports:
+            for error in report.errors:
+                self.stdout.write(self.style.WARNING(error))
+            self.stdout.write(
+                f"{report.path}: {report.imported} lifts in "
+                f"{report.seconds:.1f}s "
+                f"({report.imported / max(report.seconds, 1e-6):.0f} "
+                f"lifts/s), {len(report.errors)} errors."
+            )
+        imported = sum(report.imported for report in reports)
+        seconds = time.perf_counter() - started
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {imported} lifts from {len(reports)} files in "
+                f"{seconds:.1f}s ({imported / seconds:.0f} lifts/s)."
+            )
+        )
+
+    def _import(self, sheets, workers, batch_size, similarity, **options):
+        """Resolve competitions and athletes once, then import each sheet.
+
+        Resolving first keeps parallel workers from creating an athlete or \
+                competition twice. Their history is created at once.
+        """
+        errors: dict[Path, list[str]] = {path: [] for path in sheets}
+        competitions: dict[tuple, str] = {}
+        athletes: dict[tuple, str] = {}
+        with buffered_history(batch_size=batch_size):
+            for path, rows in sheets.items():
+                for line, row in enumerate(rows, start=2):
+                    try:
+                        key = competition_key(row)
+                        if key not in competitions:
+                            competitions[key] = self._competition(key, row)
+                        key = athlete_key(row)
+                        if key not in athletes:
+                            athletes[key] = self._athlete(key, similarity)
+                    except KeyError as exc:
+                        errors[path].append(f"{path}:{line}: missing {exc}.")
+                    except (ValueError, ValidationError) as exc:
+                        errors[path].append(f"{path}:{line}: {exc}")
+
+        args = (
+            list(sheets),
+            list(sheets.values()),
+            repeat(competitions),
+            repeat(athletes),
+            repeat(batch_size),
+        )
+        if workers > 1 and len(sheets) > 1:
+            # forked workers open their own connections
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(sheets)),
+                mp_context=get_context("fork"),
+            ) as executor:
+                reports = list(executor.map(import_sheet, *args))
+        else:
+            reports = list(map(import_sheet, *args))
+
+        for report, path in zip(reports, sheets):
+            report.errors[:0] = errors[path]
+        AthleteBest.objects.refresh_athletes(
+            Athlete.objects.filter(
+                pk__in={pk for report in reports for pk in report.athletes}
+            )
+        )
+        # `bulk_create()` sends no `post_save` to expire them
+        transaction.on_commit(invalidate_counts)
+        transaction.on_commit(
+            partial(invalidate_lift_responses, competitions.values())
+        )
+        CompetitionSnapshot.objects.expire(competitions.values())
+        return reports
+
+    def _competition(self, key: tuple, row: dict) -> str:
+        name, date_start = key
+        competition = Competition.objects.filter(
+            name=name, date_start=date_start
+        ).first()
+        if competition is None:
+            competition = Competition(
+                name=name,
+                location=str(row.get("location", "")).strip(),
+                date_start=date_start,
+                date_end=row.get("date_end", date_start),
+            )
+            competition.full_clean()
+            competition.save()
+        return str(competition.pk)
+
+    def _athlete(self, key: tuple, similarity: float) -> str:
+        first_name, last_name, yearborn = key
+        athlete = Athlete.objects.match(
+            first_name, last_name, yearborn, similarity=similarity
+        )
+        if athlete is None:
+            athlete = Athlete(
+                first_name=first_name, last_name=last_name, yearborn=yearborn
+            )
+            athlete.full_clean()
+            athlete.save()
+        return str(athlete.pk)
@@ -0,0 +1,80 @@
+"""Backfill or verify the stored results on lifts."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import AthleteBest, CompetitionSnapshot, Lift, Ranking
+from api.models.caches import invalidate_all_responses, invalidate_counts
+from api.models.managers.lifts import RESULT_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Recalculate the stored lift results (best lifts, total, sinclair, grade)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report lifts with stale results instead of updating them.",
+        )
+        parser.add_argument(
+            "--grades",
+            action="store_true",
+            help="Only regrade lifts from their stored totals.",
+        )
+        parser.add_argument(
+            "--sinclairs",
+            action="store_true",
+            help="Only recalculate the sinclair from the stored totals.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Lifts fetched and updated per query.",
+        )
+
+    def handle(self, *args, **options):
+        if options["verify"]:
+            self._verify(batch_size=options["batch_size"])
+            return
+        if options["grades"]:
+            regraded = Lift.objects.refresh_grades()
+            message = f"Regraded {regraded} lifts."
+        elif options["sinclairs"]:
+            refreshed = Lift.objects.refresh_sinclairs(
+                batch_size=options["batch_size"]
+            )
+            message = f"Refreshed {refreshed} sinclairs."
+        else:
+            refreshed = Lift.objects.refresh_results(
+                batch_size=options["batch_size"]
+            )
+            message = f"Refreshed {refreshed} lifts."
+        self._refresh_copies(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(message))
+
+    def _refresh_copies(self, batch_size: int) -> None:
+        """Refresh the copies of the results, `bulk_update()` bypasses them."""
+        Ranking.objects.rebuild(batch_size=batch_size)
+        AthleteBest.objects.rebuild(batch_size=batch_size)
+        CompetitionSnapshot.objects.expire_all()
+        # no `post_save` is sent to expire them
+        invalidate_counts()
+        invalidate_all_responses()
+
+    def _verify(self, batch_size: int) -> None:
+        stale = 0
+        lifts = Lift.objects.select_related("athlete", "competition")
+        for lift in lifts.iterator(chunk_size=batch_size):
+            stored = {field: getattr(lift, field) for field in RESULT_FIELDS}
+            lift.update_results()
+            for field in RESULT_FIELDS:
+                if stored[field] != getattr(lift, field):
+                    stale += 1
+                    self.stdout.write(
+                        f"{lift.reference_id}: {field} is {stored[field]}, "
+                        f"expected {getattr(lift, field)}"
+                    )
+        if stale > 0:
+            raise CommandError(f"{stale} stale results found.")
+        self.stdout.write(self.style.SUCCESS("All lift results are current."))
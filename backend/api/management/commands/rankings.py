@@ -0,0 +1,21 @@
+"""Rebuild the ranking summary table."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import Ranking
+
+
+class Command(BaseCommand):
+    help = "Recreate the rankings of all lifts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Lifts fetched and rankings created per query.",
+        )
+
+    def handle(self, *args, **options):
+        created = Ranking.objects.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Created {created} rankings."))
@@ -0,0 +1,25 @@
+"""Rebuild the search documents."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = "Recreate the search documents of all athletes, competitions and lifts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Documents fetched and created per query.",
+        )
+
+    def handle(self, *args, **options):
+        created = SearchDocument.objects.rebuild(
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} search documents.")
+        )
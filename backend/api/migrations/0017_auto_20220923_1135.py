@@ -5,11 +5,12 @@ from datetime import datetime
 
 from django.db import migrations
 
-from api.models import AgeCategory, AgeCategoryEra
 from api.tests.test_models.test_support.conftest import AgeCategoryMock
 
 
 def create_age_categories(apps, schema_editor):
+    AgeCategoryEra = apps.get_model("api", "AgeCategoryEra")
+    AgeCategory = apps.get_model("api", "AgeCategory")
     era = AgeCategoryEra.objects.create(
         date_start=datetime(1970, 1, 1), description="Age categories"
     )
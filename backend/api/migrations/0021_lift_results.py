@@ -0,0 +1,203 @@
+# Generated by Django 4.1.1 on 2026-10-18 07:17
+
+import math
+from decimal import Decimal
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+RESULT_FIELDS = [
+    "best_snatch",
+    "best_cnj",
+    "total_lifted",
+    "sinclair",
+    "grade",
+]
+
+# frozen copies of `api.models.utils` as of this migration
+SINCLAIR_CONSTANTS = {
+    "M": (Decimal(0.751945030), Decimal(175.508)),
+    "W": (Decimal(0.783497476), Decimal(153.655)),
+}
+GRADES = ("Elite", "International", "A", "B", "C", "D", "E")
+# minimum total of each of `GRADES`, by weight category
+STANDARDS = {
+    "M49": (None, None, 188, 171, 152, 135, 124),
+    "M55": (245, 226, 206, 187, 168, 148, 136),
+    "M62": (264, 243, 222, 202, 181, 160, 146),
+    "M67": (281, 259, 237, 214, 192, 170, 156),
+    "M73": (296, 273, 249, 226, 203, 179, 164),
+    "M81": (313, 288, 264, 239, 214, 190, 173),
+    "M89": (327, 301, 276, 250, 224, 198, 181),
+    "M96": (338, 311, 285, 258, 231, 205, 187),
+    "M102": (346, 318, 291, 264, 237, 209, 191),
+    "M102+": (None, None, 298, 270, 242, 214, 195),
+    "M109": (353, 325, 298, 270, 242, 214),
+    "M109+": (374, 345, 315, 286, 256, 227),
+    "W40": (None, None, 114, 103, 92, 81, 70),
+    "W45": (150, 138, 126, 114, 102, 90, 78),
+    "W49": (161, 148, 135, 122, 109, 97, 84),
+    "W55": (175, 161, 147, 133, 119, 105, 91),
+    "W59": (183, 169, 154, 139, 125, 110, 96),
+    "W64": (193, 178, 162, 147, 131, 116, 101),
+    "W71": (205, 188, 172, 155, 139, 123, 107),
+    "W76": (212, 195, 178, 161, 144, 127, 110),
+    "W81": (218, 201, 183, 166, 148, 131, 114),
+    "W81+": (None, None, 189, 171, 153, 135, 117),
+    "W87": (224, 207, 189, 171, 153, 135),
+    "W87+": (235, 216, 198, 179, 160, 141),
+}
+
+
+def best_lift(lift, lift_type):
+    return max(
+        (
+            getattr(lift, f"{lift_type}_{attempt}_weight")
+            for attempt in ("first", "second", "third")
+            if getattr(lift, f"{lift_type}_{attempt}") == "LIFT"
+        ),
+        default=0,
+    )
+
+
+def calculate_sinclair(bodyweight, total_lifted, weight_category):
+    a, b = SINCLAIR_CONSTANTS[weight_category[0]]
+    coefficient = Decimal(1)
+    if bodyweight <= b:
+        x = Decimal(math.log10(Decimal(bodyweight) / b))
+        coefficient = Decimal(10) ** (x**2 * a)
+    return round(total_lifted * coefficient, 3)
+
+
+def determine_grade(total_lifted, weight_category):
+    for grade, minimum in zip(GRADES, STANDARDS.get(weight_category, ())):
+        if minimum is not None and total_lifted >= minimum:
+            return grade
+    return None
+
+
+def calculate_lift_results(apps, schema_editor):
+    Lift = apps.get_model("api", "Lift")
+    batch = []
+    for lift in Lift.objects.iterator(chunk_size=BATCH_SIZE):
+        lift.best_snatch = best_lift(lift, "snatch")
+        lift.best_cnj = best_lift(lift, "cnj")
+        # a total needs a snatch and a clean and jerk
+        lift.total_lifted = (
+            lift.best_snatch + lift.best_cnj
+            if lift.best_snatch and lift.best_cnj
+            else 0
+        )
+        lift.sinclair = calculate_sinclair(
+            bodyweight=lift.bodyweight,
+            total_lifted=lift.total_lifted,
+            weight_category=lift.weight_category,
+        )
+        lift.grade = determine_grade(
+            total_lifted=lift.total_lifted,
+            weight_category=lift.weight_category,
+        )
+        batch.append(lift)
+        if len(batch) == BATCH_SIZE:
+            Lift.objects.bulk_update(batch, RESULT_FIELDS)
+            batch = []
+    Lift.objects.bulk_update(batch, RESULT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0020_historicallift_historicalathlete"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicallift",
+            name="best_cnj",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicallift",
+            name="best_snatch",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicallift",
+            name="grade",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=16,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicallift",
+            name="sinclair",
+            field=models.DecimalField(
+                db_index=True,
+                decimal_places=3,
+                default=0,
+                editable=False,
+                max_digits=7,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicallift",
+            name="total_lifted",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="best_cnj",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="best_snatch",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="grade",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=16,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="sinclair",
+            field=models.DecimalField(
+                db_index=True,
+                decimal_places=3,
+                default=0,
+                editable=False,
+                max_digits=7,
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="total_lifted",
+            field=models.IntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.RunPython(
+            calculate_lift_results, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,147 @@
+# Generated by Django 4.1.1 on 2026-10-18 07:25
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+import hashid_field.field
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+# frozen copy of `api.models.managers.search.SEARCH_FIELDS`: fields indexed
+# for each searchable model, follows relations with `__`
+SEARCH_FIELDS = {
+    "athlete": ("first_name", "last_name"),
+    "competition": ("name", "location"),
+    "lift": ("athlete__first_name", "athlete__last_name"),
+}
+
+
+def document_text(instance):
+    """Text of the search document of `instance`."""
+    values = []
+    for field in SEARCH_FIELDS[instance._meta.model_name]:
+        value = instance
+        for attribute in field.split("__"):
+            value = getattr(value, attribute)
+        if value:
+            values.append(str(value))
+    return " ".join(values)
+
+
+def create_search_documents(apps, schema_editor):
+    SearchDocument = apps.get_model("api", "SearchDocument")
+    documents = []
+    for model_name in SEARCH_FIELDS:
+        model = apps.get_model("api", model_name)
+        instances = model.objects.all()
+        if model_name == "lift":
+            instances = instances.select_related("athlete")
+        for instance in instances:
+            documents.append(
+                SearchDocument(
+                    **{model_name: instance}, text=document_text(instance)
+                )
+            )
+    SearchDocument.objects.bulk_create(documents, batch_size=500)
+    SearchDocument.objects.update(vector=SearchVector("text"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0021_lift_results"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "reference_id",
+                    hashid_field.field.HashidAutoField(
+                        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890",
+                        min_length=7,
+                        prefix="",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("text", models.TextField(blank=True)),
+                (
+                    "vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        null=True
+                    ),
+                ),
+                (
+                    "athlete",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.athlete",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.competition",
+                    ),
+                ),
+                (
+                    "lift",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.lift",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="searchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["vector"], name="searchdocument_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchdocument",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "text", name="gin_trgm_ops"
+                ),
+                name="searchdocument_text_trgm_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="searchdocument",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(
+                        ("athlete__isnull", False),
+                        ("competition__isnull", True),
+                        ("lift__isnull", True),
+                    ),
+                    models.Q(
+                        ("athlete__isnull", True),
+                        ("competition__isnull", False),
+                        ("lift__isnull", True),
+                    ),
+                    models.Q(
+                        ("athlete__isnull", True),
+                        ("competition__isnull", True),
+                        ("lift__isnull", False),
+                    ),
+                    _connector="OR",
+                ),
+                name="searchdocument_single_instance",
+            ),
+        ),
+        migrations.RunPython(
+            create_search_documents, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 4.1.1 on 2026-10-18 07:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+# frozen copy of the names searched, see `SEARCH_FIELDS` of 0022
+SEARCH_FIELDS = {
+    "athlete": ("first_name", "last_name"),
+    "competition": ("name", "location"),
+}
+
+
+def calculate_search_vectors(apps, schema_editor):
+    Athlete = apps.get_model("api", "Athlete")
+    Competition = apps.get_model("api", "Competition")
+    Lift = apps.get_model("api", "Lift")
+    Athlete.objects.update(
+        search_vector=SearchVector(*SEARCH_FIELDS["athlete"])
+    )
+    Competition.objects.update(
+        search_vector=SearchVector(*SEARCH_FIELDS["competition"])
+    )
+    Lift.objects.update(
+        search_vector=Subquery(
+            Athlete.objects.filter(pk=OuterRef("athlete")).values(
+                "search_vector"
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0022_searchdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="athlete",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="athlete",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="athlete_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="athlete",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "first_name", name="gin_trgm_ops"
+                ),
+                name="athlete_first_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="athlete",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "last_name", name="gin_trgm_ops"
+                ),
+                name="athlete_last_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competition",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="competition_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competition",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "name", name="gin_trgm_ops"
+                ),
+                name="competition_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competition",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    "location", name="gin_trgm_ops"
+                ),
+                name="competition_location_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="lift",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="lift_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(
+            calculate_search_vectors, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.1.1 on 2026-10-18 07:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0023_search_vectors"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="athlete",
+            index=models.Index(
+                fields=["last_name", "first_name", "reference_id"],
+                name="athlete_ordering_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competition",
+            index=models.Index(
+                fields=["-date_start", "name", "reference_id"],
+                name="competition_ordering_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="lift",
+            index=models.Index(
+                fields=[
+                    "competition",
+                    "weight_category",
+                    "lottery_number",
+                    "reference_id",
+                ],
+                name="lift_ordering_idx",
+            ),
+        ),
+    ]
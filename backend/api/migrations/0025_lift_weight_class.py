@@ -0,0 +1,187 @@
+# Generated by Django 4.1.1 on 2026-10-18 07:47
+
+from datetime import date
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+# frozen copy of the weight category choices of `api.models.utils`
+ERAS = [
+    (
+        date(1998, 1, 1),
+        "Weightclasses 1998 - 2018",
+        [
+            "W44",
+            "W48",
+            "W53",
+            "W58",
+            "W63",
+            "W69",
+            "W75",
+            "W75+",
+            "W90",
+            "W90+",
+            "M50",
+            "M56",
+            "M62",
+            "M69",
+            "M77",
+            "M85",
+            "M94",
+            "M94+",
+            "M105",
+            "M105+",
+        ],
+    ),
+    (
+        date(2018, 11, 1),
+        "Current weightclasses",
+        [
+            "W45",
+            "W49",
+            "W55",
+            "W59",
+            "W64",
+            "W71",
+            "W76",
+            "W81",
+            "W40",
+            "W81+",
+            "W87",
+            "W87+",
+            "M55",
+            "M61",
+            "M67",
+            "M73",
+            "M81",
+            "M89",
+            "M96",
+            "M102",
+            "M49",
+            "M102+",
+            "M109",
+            "M109+",
+        ],
+    ),
+]
+
+
+def parse_weight_category(name):
+    """Sex, weight and whether it is a plus category, e.g. of "M109+"."""
+    return name[0], int(name[1:].replace("+", "")), name.endswith("+")
+
+
+def create_weight_categories(apps, schema_editor):
+    """Weight categories of the choices, unless eras are already set up."""
+    WeightCategoryEra = apps.get_model("api", "WeightCategoryEra")
+    WeightCategory = apps.get_model("api", "WeightCategory")
+    if WeightCategoryEra.objects.exists():
+        return
+    for date_start, description, weight_categories in ERAS:
+        era = WeightCategoryEra.objects.create(
+            date_start=date_start, description=description
+        )
+        for name in weight_categories:
+            sex, weight, is_plus = parse_weight_category(name)
+            WeightCategory.objects.create(
+                era=era, sex=sex, weight=weight, is_plus=is_plus
+            )
+
+
+def link_weight_classes(apps, schema_editor):
+    WeightCategoryEra = apps.get_model("api", "WeightCategoryEra")
+    WeightCategory = apps.get_model("api", "WeightCategory")
+    Lift = apps.get_model("api", "Lift")
+    eras = list(WeightCategoryEra.objects.order_by("-date_start"))
+    weight_classes = {
+        (
+            int(weight_class.era_id),
+            weight_class.sex,
+            weight_class.weight,
+            weight_class.is_plus,
+        ): weight_class
+        for weight_class in WeightCategory.objects.all()
+    }
+    lifts = (
+        Lift.objects.exclude(weight_category="")
+        .select_related("competition")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    for lift in lifts:
+        era = next(
+            (
+                era
+                for era in eras
+                if era.date_start <= lift.competition.date_start
+            ),
+            None,
+        )
+        if era is None:
+            continue
+        lift.weight_class = weight_classes.get(
+            (int(era.pk), *parse_weight_category(lift.weight_category))
+        )
+        batch.append(lift)
+        if len(batch) == BATCH_SIZE:
+            Lift.objects.bulk_update(batch, ["weight_class"])
+            batch = []
+    Lift.objects.bulk_update(batch, ["weight_class"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0024_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="weightcategory",
+            name="era_sex_weight_unique_combination",
+        ),
+        migrations.AddField(
+            model_name="historicallift",
+            name="weight_class",
+            field=models.ForeignKey(
+                blank=True,
+                db_constraint=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="api.weightcategory",
+            ),
+        ),
+        migrations.AddField(
+            model_name="lift",
+            name="weight_class",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                to="api.weightcategory",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="weightcategory",
+            index=models.Index(
+                fields=["-sex", "is_plus", "weight"],
+                name="weight_category_order_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="weightcategory",
+            constraint=models.UniqueConstraint(
+                fields=("era", "sex", "weight", "is_plus"),
+                name="era_sex_weight_plus_unique_combination",
+            ),
+        ),
+        migrations.RunPython(
+            create_weight_categories, migrations.RunPython.noop
+        ),
+        migrations.RunPython(link_weight_classes, migrations.RunPython.noop),
+    ]
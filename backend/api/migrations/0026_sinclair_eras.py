@@ -0,0 +1,85 @@
+import math
+from bisect import bisect_right
+from decimal import Decimal
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+# frozen copy of `api.models.utils.sinclair.SINCLAIR_ERAS`: first year of
+# each Olympic cycle and its constants `a` and `b` by sex
+SINCLAIR_ERAS = [
+    (
+        2009,
+        {
+            "M": (Decimal(0.784780654), Decimal(173.961)),
+            "W": (Decimal(1.056683941), Decimal(125.441)),
+        },
+    ),
+    (
+        2013,
+        {
+            "M": (Decimal(0.794358141), Decimal(174.393)),
+            "W": (Decimal(0.897260740), Decimal(148.026)),
+        },
+    ),
+    (
+        2017,
+        {
+            "M": (Decimal(0.751945030), Decimal(175.508)),
+            "W": (Decimal(0.783497476), Decimal(153.655)),
+        },
+    ),
+    (
+        2021,
+        {
+            "M": (Decimal(0.722762521), Decimal(193.609)),
+            "W": (Decimal(0.787004341), Decimal(153.757)),
+        },
+    ),
+]
+ERA_YEARS = [year for year, _ in SINCLAIR_ERAS]
+
+
+def calculate_sinclair(bodyweight, total_lifted, sex, lift_year):
+    """Sinclair with the constants of the era of `lift_year`."""
+    era_idx = max(bisect_right(ERA_YEARS, lift_year) - 1, 0)
+    a, b = SINCLAIR_ERAS[era_idx][1][sex]
+    coefficient = Decimal(1)
+    if bodyweight <= b:
+        x = Decimal(math.log10(Decimal(bodyweight) / b))
+        coefficient = Decimal(10) ** (x**2 * a)
+    return round(total_lifted * coefficient, 3)
+
+
+def refresh_sinclairs(apps, schema_editor):
+    Lift = apps.get_model("api", "Lift")
+    lifts = (
+        Lift.objects.exclude(weight_category="")
+        .select_related("competition")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    for lift in lifts:
+        lift.sinclair = calculate_sinclair(
+            bodyweight=lift.bodyweight,
+            total_lifted=lift.total_lifted,
+            sex=lift.weight_category[0],
+            lift_year=lift.competition.date_start.year,
+        )
+        batch.append(lift)
+        if len(batch) == BATCH_SIZE:
+            Lift.objects.bulk_update(batch, ["sinclair"])
+            batch = []
+    Lift.objects.bulk_update(batch, ["sinclair"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0025_lift_weight_class"),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_sinclairs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,185 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:17
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import hashid_field.field
+from django.db import migrations, models
+
+# frozen copy of `api.models.managers.rankings.DISCIPLINES`
+DISCIPLINES = {
+    "snatch": "best_snatch",
+    "cnj": "best_cnj",
+    "total": "total_lifted",
+    "sinclair": "sinclair",
+}
+
+
+def lift_age_categories(lift):
+    """Frozen copy of `lift_age_categories()` of the ranking manager."""
+    age = lift.competition.date_start.year - lift.athlete.yearborn
+    if age < 0:
+        return []
+    flags = {
+        "youth": 13 <= age <= 17,
+        "junior": 15 <= age <= 20,
+        "senior": age >= 15,
+        "master": age >= 35,
+        "master_35_39": 35 <= age <= 39,
+        "master_40_44": 40 <= age <= 44,
+        "master_45_49": 45 <= age <= 49,
+        "master_50_54": 50 <= age <= 54,
+        "master_55_59": 55 <= age <= 59,
+        "master_60_64": 60 <= age <= 64,
+        "master_65_69": 65 <= age <= 39,
+        "master_70": age >= 70,
+    }
+    return [name for name, flag in flags.items() if flag]
+
+
+def ranking_values(lift):
+    """Frozen copy of `api.models.managers.rankings.ranking_values()`."""
+    if not lift.weight_category:
+        return []
+    age_categories = lift_age_categories(lift)
+    return [
+        {
+            "lift_id": lift.pk,
+            "athlete_id": lift.athlete_id,
+            "competition_id": lift.competition_id,
+            "discipline": discipline,
+            "value": getattr(lift, field),
+            "sex": lift.weight_category[0],
+            "weight_category": lift.weight_category,
+            "year": lift.competition.date_start.year,
+            "age_categories": age_categories,
+        }
+        for discipline, field in DISCIPLINES.items()
+        if getattr(lift, field) > 0
+    ]
+
+
+def create_rankings(apps, schema_editor):
+    Lift = apps.get_model("api", "Lift")
+    Ranking = apps.get_model("api", "Ranking")
+    rankings = [
+        Ranking(**values)
+        for lift in Lift.objects.select_related("athlete", "competition")
+        for values in ranking_values(lift)
+    ]
+    Ranking.objects.bulk_create(rankings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0026_sinclair_eras"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Ranking",
+            fields=[
+                (
+                    "reference_id",
+                    hashid_field.field.HashidAutoField(
+                        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890",
+                        min_length=7,
+                        prefix="",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "discipline",
+                    models.CharField(
+                        choices=[
+                            ("snatch", "Snatch"),
+                            ("cnj", "Clean and Jerk"),
+                            ("total", "Total"),
+                            ("sinclair", "Sinclair"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("value", models.DecimalField(decimal_places=3, max_digits=7)),
+                (
+                    "sex",
+                    models.CharField(
+                        choices=[("M", "Men's"), ("W", "Women's")],
+                        max_length=1,
+                    ),
+                ),
+                ("weight_category", models.CharField(max_length=5)),
+                ("year", models.IntegerField()),
+                (
+                    "age_categories",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=16),
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                (
+                    "athlete",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.athlete",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="api.competition",
+                    ),
+                ),
+                (
+                    "lift",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rankings",
+                        to="api.lift",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-value"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(
+                fields=["discipline", "-value", "reference_id"],
+                name="ranking_discipline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(
+                fields=["discipline", "sex", "year", "-value"],
+                name="ranking_sex_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(
+                fields=["discipline", "weight_category", "year", "-value"],
+                name="ranking_weight_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ranking",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["age_categories"], name="ranking_age_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="ranking",
+            constraint=models.UniqueConstraint(
+                fields=("lift", "discipline"),
+                name="ranking_lift_discipline_unique_combination",
+            ),
+        ),
+        migrations.RunPython(create_rankings, migrations.RunPython.noop),
+    ]
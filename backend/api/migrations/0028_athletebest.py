@@ -0,0 +1,160 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:20
+
+import django.db.models.deletion
+import hashid_field.field
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+# frozen copy of `api.models.managers.rankings.DISCIPLINES`
+DISCIPLINES = {
+    "snatch": "best_snatch",
+    "cnj": "best_cnj",
+    "total": "total_lifted",
+    "sinclair": "sinclair",
+}
+
+
+def lift_age_categories(lift):
+    """Frozen copy of `lift_age_categories()` of the ranking manager."""
+    age = lift.competition.date_start.year - lift.athlete.yearborn
+    if age < 0:
+        return []
+    flags = {
+        "youth": 13 <= age <= 17,
+        "junior": 15 <= age <= 20,
+        "senior": age >= 15,
+        "master": age >= 35,
+        "master_35_39": 35 <= age <= 39,
+        "master_40_44": 40 <= age <= 44,
+        "master_45_49": 45 <= age <= 49,
+        "master_50_54": 50 <= age <= 54,
+        "master_55_59": 55 <= age <= 59,
+        "master_60_64": 60 <= age <= 64,
+        "master_65_69": 65 <= age <= 39,
+        "master_70": age >= 70,
+    }
+    return [name for name, flag in flags.items() if flag]
+
+
+def best_values(lifts):
+    """Frozen copy of `api.models.managers.athlete_bests.best_values()`."""
+    bests = {}
+    for lift in lifts:
+        for age_category in lift_age_categories(lift):
+            for discipline, field in DISCIPLINES.items():
+                weight_category = (
+                    "" if discipline == "sinclair" else lift.weight_category
+                )
+                key = (
+                    lift.athlete_id,
+                    age_category,
+                    weight_category,
+                    discipline,
+                )
+                value = getattr(lift, field)
+                current = bests.get(key)
+                if current is None or value >= current[0]:
+                    bests[key] = (value, lift.pk)
+    return [
+        {
+            "athlete_id": athlete_id,
+            "age_category": age_category,
+            "weight_category": weight_category,
+            "discipline": discipline,
+            "value": value,
+            "lift_id": lift_id,
+        }
+        for (
+            athlete_id,
+            age_category,
+            weight_category,
+            discipline,
+        ), (value, lift_id) in bests.items()
+    ]
+
+
+def create_athlete_bests(apps, schema_editor):
+    Lift = apps.get_model("api", "Lift")
+    AthleteBest = apps.get_model("api", "AthleteBest")
+    lifts = (
+        Lift.objects.select_related("athlete", "competition")
+        .order_by("-competition__date_start", "-pk")
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    AthleteBest.objects.bulk_create(
+        [AthleteBest(**values) for values in best_values(lifts)],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0027_ranking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AthleteBest",
+            fields=[
+                (
+                    "reference_id",
+                    hashid_field.field.HashidAutoField(
+                        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890",
+                        min_length=7,
+                        prefix="",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("age_category", models.CharField(max_length=16)),
+                (
+                    "weight_category",
+                    models.CharField(blank=True, max_length=5),
+                ),
+                (
+                    "discipline",
+                    models.CharField(
+                        choices=[
+                            ("snatch", "Snatch"),
+                            ("cnj", "Clean and Jerk"),
+                            ("total", "Total"),
+                            ("sinclair", "Sinclair"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("value", models.DecimalField(decimal_places=3, max_digits=7)),
+                (
+                    "athlete",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="bests",
+                        to="api.athlete",
+                    ),
+                ),
+                (
+                    "lift",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="api.lift",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="athletebest",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "athlete",
+                    "age_category",
+                    "weight_category",
+                    "discipline",
+                ),
+                name="athletebest_key_unique_combination",
+            ),
+        ),
+        migrations.RunPython(create_athlete_bests, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:44
+
+import django.db.models.deletion
+import hashid_field.field
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0028_athletebest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompetitionSnapshot",
+            fields=[
+                (
+                    "reference_id",
+                    hashid_field.field.HashidAutoField(
+                        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890",
+                        min_length=7,
+                        prefix="",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("version", models.PositiveIntegerField(default=1)),
+                ("built_version", models.PositiveIntegerField(default=0)),
+                ("data", models.JSONField(null=True)),
+                ("built_at", models.DateTimeField(null=True)),
+                (
+                    "competition",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="snapshot",
+                        to="api.competition",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,13 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # the live models are audited, see `api.models.history`: later
+    # migrations saving them need the `auditlog_logentry` table
+    dependencies = [
+        ("api", "0029_competitionsnapshot"),
+        ("auditlog", "0010_alter_logentry_timestamp"),
+    ]
+
+    operations = []
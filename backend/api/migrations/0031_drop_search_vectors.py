@@ -0,0 +1,53 @@
+# Generated by Django 4.1.1 on 2026-10-18 09:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0030_auditlog_dependency"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="athlete",
+            name="athlete_search_vector_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="athlete",
+            name="athlete_first_name_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="athlete",
+            name="athlete_last_name_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="competition",
+            name="competition_search_vector_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="competition",
+            name="competition_name_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="competition",
+            name="competition_location_trgm_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="lift",
+            name="lift_search_vector_idx",
+        ),
+        migrations.RemoveField(
+            model_name="athlete",
+            name="search_vector",
+        ),
+        migrations.RemoveField(
+            model_name="competition",
+            name="search_vector",
+        ),
+        migrations.RemoveField(
+            model_name="lift",
+            name="search_vector",
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.1 on 2026-10-18 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0031_drop_search_vectors"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(
+                fields=["discipline", "athlete", "-value"],
+                name="ranking_athlete_idx",
+            ),
+        ),
+    ]
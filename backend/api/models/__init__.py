@@ -1,9 +1,13 @@
 """Model."""
 
 
+from .athlete_bests import AthleteBest
 from .athletes import Athlete
 from .competitions import Competition
 from .lifts import Lift
+from .rankings import Ranking
+from .search import SearchDocument
+from .snapshots import CompetitionSnapshot
 from .support import (
     AgeCategory,
     AgeCategoryEra,
@@ -13,8 +17,12 @@ from .support import (
 
 __all__ = [
     "Athlete",
+    "AthleteBest",
     "Competition",
+    "CompetitionSnapshot",
     "Lift",
+    "Ranking",
+    "SearchDocument",
     "AgeCategory",
     "AgeCategoryEra",
     "WeightCategory",
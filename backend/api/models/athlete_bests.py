@@ -0,0 +1,54 @@
+"""Athlete best model."""
+
+from django.db import models
+from hashid_field import HashidAutoField
+
+from config.settings import HASHID_FIELD_SALT
+
+from .managers import AthleteBestManager
+from .rankings import DISCIPLINE_CHOICES
+
+
+class AthleteBest(models.Model):
+    """Personal best of an athlete.
+
+    One row per athlete, age category, weight category and discipline, \
+            pointing at the best lift. Sinclairs are compared across weight \
+            categories and have a blank `weight_category`. Kept current by \
+            the `save()` of lifts, athletes and competitions and on lift \
+            delete, see `api.signals`.
+    """
+
+    reference_id = HashidAutoField(
+        primary_key=True,
+        salt=f"athletebestmodel_reference_id_{HASHID_FIELD_SALT}",
+    )
+    athlete = models.ForeignKey(
+        "api.Athlete", related_name="bests", on_delete=models.CASCADE
+    )
+    # e.g. "senior", name of `AgeCategories` without `is_`
+    age_category = models.CharField(max_length=16)
+    weight_category = models.CharField(max_length=5, blank=True)
+    discipline = models.CharField(max_length=8, choices=DISCIPLINE_CHOICES)
+    value = models.DecimalField(max_digits=7, decimal_places=3)
+    lift = models.ForeignKey(
+        "api.Lift", related_name="+", on_delete=models.CASCADE
+    )
+
+    objects = AthleteBestManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "athlete",
+                    "age_category",
+                    "weight_category",
+                    "discipline",
+                ],
+                name="athletebest_key_unique_combination",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_discipline_display()}: {self.value}"
@@ -7,16 +7,18 @@ from datetime import datetime
 from typing import Any
 
 from auditlog.models import AuditlogHistoryField
-from auditlog.registry import auditlog
 from django.core.exceptions import ValidationError
 from django.db import models
 from hashid_field import HashidAutoField
-from simple_history.models import HistoricalRecords
 
 # from config.settings import DISABLE_FAKE_NAMES, HASHID_FIELD_SALT, faker
 from config.settings import HASHID_FIELD_SALT
 
+from .athlete_bests import AthleteBest
+from .history import BufferedHistoricalRecords, auditlog
 from .managers import AthleteManager
+from .rankings import Ranking
+from .search import SearchDocument
 from .utils import age_category
 from .utils.types import AgeCategories
 
@@ -44,16 +46,22 @@ class Athlete(models.Model):
     yearborn = models.IntegerField(default=1900, validators=[check_yearborn])
 
     history = AuditlogHistoryField(pk_indexable=False)
-    history_record = HistoricalRecords(
+    history_record = BufferedHistoricalRecords(
         history_id_field=HashidAutoField(
             salt=f"athlete_history_id_{HASHID_FIELD_SALT}"
-        )
+        ),
     )
 
     objects = AthleteManager()
 
     class Meta:
         ordering = ["last_name", "first_name"]
+        indexes = [
+            models.Index(
+                fields=["last_name", "first_name", "reference_id"],
+                name="athlete_ordering_idx",
+            ),
+        ]
 
     @property
     def full_name(self) -> str:
@@ -71,6 +79,15 @@ class Athlete(models.Model):
         """Age category of the athlete at the time of the lift."""
         return age_category(yearborn=self.yearborn)
 
+    def save(self, *args, **kwargs):
+        """Refresh the search documents, rankings and bests after saving."""
+        super().save(*args, **kwargs)
+        SearchDocument.objects.refresh(self)
+        Ranking.objects.refresh(self.lift_set.all())
+        AthleteBest.objects.refresh_athletes(
+            Athlete.objects.filter(pk=self.pk)
+        )
+
     def __str__(self) -> str:
         return self.full_name
 
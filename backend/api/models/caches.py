@@ -0,0 +1,134 @@
+"""Versions of the cached counts and responses.
+
+Cached values are keyed by a version, bumped by the `post_save`/`post_delete` \
+        receivers in `api.signals` when the models they depend on change. \
+        Call the invalidations after `update()` or `bulk_create()`, which \
+        send no signals.
+
+Responses have a version per athlete and competition, for their details, and \
+        one per model for the lists. A change bumps the versions of what it \
+        is shown in only, see `invalidate_lift_responses()`.
+
+Nothing is invalidated within `suppressed_invalidation()`.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import uuid4
+
+from django.apps import apps
+from django.core.cache import cache
+
+COUNT_VERSION_KEY = "pagination_count_version"
+# part of every response version, see `invalidate_all_responses()`
+RESPONSE_VERSION_KEY = "response_version"
+
+_suppressed: ContextVar[bool] = ContextVar(
+    "suppressed_invalidation", default=False
+)
+
+
+@contextmanager
+def suppressed_invalidation():
+    """Keep the cached counts, responses and snapshots of the block.
+
+    For blocks that are rolled back, e.g. a dry run. Their changes are \
+            never seen, but the `post_save` receivers would expire the \
+            caches of the data they change all the same.
+    """
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def invalidation_suppressed() -> bool:
+    """Whether the caller runs within `suppressed_invalidation()`."""
+    return _suppressed.get()
+
+
+def invalidate_counts() -> None:
+    """Expire every cached count, call when counted models change."""
+    if invalidation_suppressed():
+        return
+    cache.set(COUNT_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def count_version() -> str:
+    """Current version of the cached counts."""
+    return cache.get_or_set(
+        COUNT_VERSION_KEY, lambda: uuid4().hex, timeout=None
+    )
+
+
+def response_version_key(model_name: str, pk=None) -> str:
+    """Version key of the detail of `model_name` `pk`, the lists without.
+
+    `pk` is the hashid, as in the urls.
+    """
+    if pk is None:
+        return f"{RESPONSE_VERSION_KEY}_{model_name}"
+    return f"{RESPONSE_VERSION_KEY}_{model_name}_{pk}"
+
+
+def invalidate_responses(model_name: str, pks=(), lists: bool = True) -> None:
+    """Expire cached responses showing `model_name`.
+
+    Args:
+        model_name (str): Model changed, e.g. "athlete".
+        pks (Iterable): Primary keys of the changed instances, their \
+                details expire.
+        lists (bool): Expire the lists of `model_name` too.
+    """
+    if invalidation_suppressed():
+        return
+    keys = [response_version_key(model_name, pk) for pk in {*map(str, pks)}]
+    if lists:
+        keys.append(response_version_key(model_name))
+    cache.set_many({key: uuid4().hex for key in keys}, timeout=None)
+
+
+def invalidate_lift_responses(competitions, athletes=()) -> None:
+    """Expire cached responses showing the lifts of `competitions`.
+
+    Placings are ranked across a competition, so the details of the \
+            competitions and of every athlete who lifted in them expire.
+
+    Args:
+        competitions (Iterable): Primary keys of the competitions.
+        athletes (Iterable): Primary keys of more athletes, e.g. of a \
+                deleted lift.
+    """
+    if invalidation_suppressed():
+        return
+    competitions = {str(pk) for pk in competitions if pk is not None}
+    Lift = apps.get_model("api", "Lift")
+    lifters = (
+        Lift.objects.filter(competition__in=competitions)
+        .values_list("athlete", flat=True)
+        .distinct()
+    )
+    invalidate_responses("lift")
+    invalidate_responses("competition", competitions, lists=False)
+    invalidate_responses("athlete", [*athletes, *lifters], lists=False)
+
+
+def invalidate_all_responses() -> None:
+    """Expire every cached response, e.g. after lifts were `update()`d."""
+    if invalidation_suppressed():
+        return
+    cache.set(RESPONSE_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def response_versions(keys: list[str]) -> list[str]:
+    """Current versions of `keys`, new ones for those never bumped.
+
+    The version of `invalidate_all_responses()` is included first.
+    """
+    keys = [RESPONSE_VERSION_KEY, *keys]
+    versions = cache.get_many(keys)
+    for key in set(keys) - set(versions):
+        versions[key] = uuid4().hex
+        cache.add(key, versions[key], timeout=None)
+    return [versions[key] for key in keys]
@@ -1,15 +1,17 @@
 """Competition Models."""
 
 from auditlog.models import AuditlogHistoryField
-from auditlog.registry import auditlog
 from django.core.exceptions import ValidationError
 from django.db import models
 from hashid_field import HashidAutoField
-from simple_history.models import HistoricalRecords
 
 from config.settings import HASHID_FIELD_SALT
 
+from .athlete_bests import AthleteBest
+from .history import BufferedHistoricalRecords, auditlog
 from .managers import CompetitionManager
+from .rankings import Ranking
+from .search import SearchDocument
 
 
 class Competition(models.Model):
@@ -36,10 +38,10 @@ class Competition(models.Model):
     # classify status of the competition e.g club, record breaking
 
     history = AuditlogHistoryField(pk_indexable=False)
-    history_record = HistoricalRecords(
+    history_record = BufferedHistoricalRecords(
         history_id_field=HashidAutoField(
             salt=f"competition_history_id_{HASHID_FIELD_SALT}"
-        )
+        ),
     )
 
     objects = CompetitionManager()
@@ -48,6 +50,12 @@ class Competition(models.Model):
         """Competition model setting."""
 
         ordering = ["-date_start", "name"]
+        indexes = [
+            models.Index(
+                fields=["-date_start", "name", "reference_id"],
+                name="competition_ordering_idx",
+            ),
+        ]
 
     def __str__(self):
         """Representation of string."""
@@ -71,9 +79,16 @@ class Competition(models.Model):
         super().clean(*args, **kwargs)
 
     def save(self, *args, **kwargs):
-        """Enforce custom validation."""
+        """Enforce custom validation.
+
+        The search document, rankings and the bests of its athletes are \
+                refreshed after saving.
+        """
         self.full_clean()
         super().save(*args, **kwargs)
+        SearchDocument.objects.refresh(self)
+        Ranking.objects.refresh(self.lift_set.all())
+        AthleteBest.objects.refresh_athletes(self.lift_set.values("athlete"))
 
 
 auditlog.register(Competition)
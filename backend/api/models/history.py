@@ -0,0 +1,279 @@
+"""Buffered history and audit log records.
+
+Every `save()` and `delete()` of a tracked model writes a historical record \
+        (simple history) and a log entry (auditlog), one query each. Within \
+        `buffered_history()` they are kept in memory and created with one \
+        `bulk_create()` per model when the block exits, in its transaction.
+
+`HISTORY_SYSTEMS` in the settings chooses the systems per model. The models \
+        are audited through `auditlog` below rather than the registry of \
+        auditlog, which excludes `api`.
+"""
+
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from auditlog.diff import get_field_value, get_fields_in_model
+from auditlog.models import LogEntry
+from auditlog.registry import AuditlogModelRegistry
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+from django.utils.encoding import smart_str
+from simple_history.models import HistoricalRecords
+from simple_history.utils import (
+    get_change_reason_from_object,
+    get_history_manager_for_model,
+)
+
+SIMPLE_HISTORY = "simple_history"
+AUDITLOG = "auditlog"
+DEFAULT_HISTORY_SYSTEMS = (SIMPLE_HISTORY, AUDITLOG)
+
+_buffer: ContextVar["HistoryBuffer | None"] = ContextVar(
+    "history_buffer", default=None
+)
+
+
+def history_systems(model) -> tuple[str, ...]:
+    """Systems recording the changes of `model`, both by default."""
+    return settings.HISTORY_SYSTEMS.get(
+        model._meta.label, DEFAULT_HISTORY_SYSTEMS
+    )
+
+
+class HistoryBuffer:
+    """Historical records and log entries waiting to be created."""
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self.records: list = []
+        self.log_entries: list[LogEntry] = []
+
+    def add_record(self, instance, history_type: str, user=None):
+        """Keep a historical record of `instance` as it is now.
+
+        Args:
+            instance (Model): Tracked instance.
+            history_type (str): `"+"` created, `"~"` changed, `"-"` deleted.
+            user (User | None): History user.
+        """
+        if SIMPLE_HISTORY not in history_systems(instance):
+            return
+        model = get_history_manager_for_model(type(instance)).model
+        self.records.append(
+            model(
+                history_date=getattr(
+                    instance, "_history_date", timezone.now()
+                ),
+                history_user=user,
+                history_change_reason=get_change_reason_from_object(instance),
+                history_type=history_type,
+                **{
+                    field.attname: getattr(instance, field.attname)
+                    for field in instance._meta.fields
+                    if field.name not in model._history_excluded_fields
+                },
+            )
+        )
+
+    def add_log_entry(
+        self, instance, action, changes, actor=None, remote_addr=None
+    ):
+        """Keep a log entry of `instance` as it is now.
+
+        Without an `actor`, the actor and address of `set_actor()` are \
+                recorded, as the `AuditlogMiddleware` does on `save()`.
+
+        Args:
+            instance (Model): Tracked instance.
+            action (LogEntry.Action): Action logged.
+            changes (dict): Diff of `model_instance_diff()`.
+            actor (User | None): Audit log actor.
+            remote_addr (str | None): Address recorded in the audit log.
+        """
+        if AUDITLOG not in history_systems(instance):
+            return
+        entry = LogEntry(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_pk=instance.pk,
+            object_id=instance.pk if isinstance(instance.pk, int) else None,
+            object_repr=smart_str(instance),
+            action=action,
+            changes=json.dumps(changes),
+            actor=actor,
+            remote_addr=remote_addr,
+        )
+        if actor is None:
+            pre_save.send(
+                sender=LogEntry,
+                instance=entry,
+                raw=False,
+                using=None,
+                update_fields=None,
+            )
+        self.log_entries.append(entry)
+
+    def flush(self) -> int:
+        """Create the kept rows, one query per model and batch.
+
+        Returns:
+            int: Number of rows created.
+        """
+        by_model: dict = {}
+        for record in self.records:
+            by_model.setdefault(type(record), []).append(record)
+        by_model[LogEntry] = self.log_entries
+        self.records, self.log_entries = [], []
+        return sum(
+            len(model.objects.bulk_create(rows, batch_size=self.batch_size))
+            for model, rows in by_model.items()
+        )
+
+
+@contextmanager
+def buffered_history(batch_size: int = 500):
+    """Buffer historical records and log entries of the block.
+
+    The block runs in a transaction, rows are created right before it \
+            commits. Nested blocks share the buffer of the outermost one, \
+            rows of a nested block are dropped when it raises. Use as a \
+            decorator too, e.g. on admin actions or backfills.
+
+    Buffered historical records send no `pre_create_historical_record` or \
+            `post_create_historical_record`.
+
+    Args:
+        batch_size (int): Rows created per query.
+
+    Yields:
+        HistoryBuffer: Buffer to add rows of e.g. `bulk_create()` to.
+    """
+    buffer = _buffer.get()
+    if buffer is not None:
+        records, log_entries = len(buffer.records), len(buffer.log_entries)
+        try:
+            with transaction.atomic():
+                yield buffer
+        except BaseException:
+            del buffer.records[records:]
+            del buffer.log_entries[log_entries:]
+            raise
+        return
+
+    buffer = HistoryBuffer(batch_size=batch_size)
+    token = _buffer.set(buffer)
+    try:
+        with transaction.atomic():
+            yield buffer
+            buffer.flush()
+    finally:
+        _buffer.reset(token)
+
+
+class BufferedHistoricalRecords(HistoricalRecords):
+    """`HistoricalRecords` honouring `HISTORY_SYSTEMS` and the buffer."""
+
+    def create_historical_record(self, instance, history_type, using=None):
+        if SIMPLE_HISTORY not in history_systems(instance):
+            return
+        buffer = _buffer.get()
+        if buffer is None:
+            return super().create_historical_record(
+                instance, history_type, using=using
+            )
+        buffer.add_record(
+            instance, history_type, user=self.get_history_user(instance)
+        )
+
+
+def instance_diff(old, new, fields_to_check=None) -> dict | None:
+    """Changed fields of `old` to `new`, `None` without changes.
+
+    As `model_instance_diff()` of auditlog, which reads the fields from the \
+            registry of auditlog. Models of `auditlog` below are registered \
+            without field options.
+    """
+    if old is not None and new is not None:
+        fields = set(old._meta.fields + new._meta.fields)
+    else:
+        fields = set(get_fields_in_model(new if old is None else old))
+    if fields_to_check:
+        fields = {field for field in fields if field.name in fields_to_check}
+    diff = {}
+    for field in fields:
+        old_value = get_field_value(old, field)
+        new_value = get_field_value(new, field)
+        if old_value != new_value:
+            diff[field.name] = (smart_str(old_value), smart_str(new_value))
+    return diff or None
+
+
+def log_change(instance, action, changes) -> None:
+    """Log `changes` of `instance`, into the buffer if there is one."""
+    buffer = _buffer.get()
+    if buffer is None:
+        LogEntry.objects.log_create(
+            instance, action=action, changes=json.dumps(changes)
+        )
+    else:
+        buffer.add_log_entry(instance, action, changes)
+
+
+def log_create(sender, instance, created, **kwargs):
+    """Auditlog `log_create()` honouring `HISTORY_SYSTEMS` and the buffer."""
+    if created and AUDITLOG in history_systems(sender):
+        log_change(
+            instance, LogEntry.Action.CREATE, instance_diff(None, instance)
+        )
+
+
+def log_update(sender, instance, **kwargs):
+    """Auditlog `log_update()` honouring `HISTORY_SYSTEMS` and the buffer."""
+    if instance.pk is None or AUDITLOG not in history_systems(sender):
+        return
+    old = sender.objects.filter(pk=instance.pk).first()
+    if old is None:
+        return
+    changes = instance_diff(
+        old, instance, fields_to_check=kwargs.get("update_fields")
+    )
+    if changes:
+        log_change(instance, LogEntry.Action.UPDATE, changes)
+
+
+def log_delete(sender, instance, **kwargs):
+    """Auditlog `log_delete()` honouring `HISTORY_SYSTEMS` and the buffer."""
+    if instance.pk is not None and AUDITLOG in history_systems(sender):
+        log_change(
+            instance, LogEntry.Action.DELETE, instance_diff(instance, None)
+        )
+
+
+# registry of the audited models of `api`, connected to the receivers above
+auditlog = AuditlogModelRegistry(
+    create=False,
+    update=False,
+    delete=False,
+    m2m=False,
+    custom={
+        post_save: log_create,
+        pre_save: log_update,
+        post_delete: log_delete,
+    },
+)
+
+
+def check_history_systems() -> None:
+    """Reject unknown systems in `HISTORY_SYSTEMS`, once the apps are ready."""
+    for label, systems in settings.HISTORY_SYSTEMS.items():
+        unknown = set(systems) - set(DEFAULT_HISTORY_SYSTEMS)
+        if unknown:
+            raise ImproperlyConfigured(
+                f"HISTORY_SYSTEMS['{label}']: unknown {sorted(unknown)}, "
+                f"choose from {DEFAULT_HISTORY_SYSTEMS}."
+            )
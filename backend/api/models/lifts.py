@@ -1,19 +1,18 @@
 """Lift model."""
 
-from decimal import Decimal
+from functools import partial
 
 from auditlog.models import AuditlogHistoryField
-from auditlog.registry import auditlog
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 from hashid_field import HashidAutoField
-from simple_history.models import HistoricalRecords
 
-from api.models.utils import calculate_sinclair, determine_grade
 from config.settings import HASHID_FIELD_SALT
 
+from .history import BufferedHistoricalRecords, auditlog
 from .managers import LiftManager
+from .support import WeightCategory
 from .utils import (
     CURRENT_FEMALE_WEIGHT_CATEGORIES,
     CURRENT_MALE_WEIGHT_CATEGORIES,
@@ -23,6 +22,7 @@ from .utils import (
     OLD_1998_2018_MALE_WEIGHT_CATEGORIES,
     age_category,
     best_lift,
+    lift_results,
     ranking_suffixer,
     validate_attempts,
 )
@@ -90,6 +90,14 @@ class Lift(models.Model):
     weight_category = models.CharField(
         max_length=5, choices=ALL_WEIGHT_CATEGORIES, blank=True
     )
+    # `weight_category` in the era of the competition, set on `clean()`
+    weight_class = models.ForeignKey(
+        "api.WeightCategory",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.PROTECT,
+    )
     # TODO: if `team` is "GUEST", then lifter is a guest
     team = models.CharField(max_length=128, blank=True, default="IND")
 
@@ -140,17 +148,46 @@ class Lift(models.Model):
     )
     cnj_third_weight = models.IntegerField(blank=True, default=0)
 
+    # results fields
+    # calculated from the attempts on `save()`, see `update_results()`
+    best_snatch = models.IntegerField(default=0, editable=False, db_index=True)
+    best_cnj = models.IntegerField(default=0, editable=False, db_index=True)
+    total_lifted = models.IntegerField(
+        default=0, editable=False, db_index=True
+    )
+    sinclair = models.DecimalField(
+        max_digits=7,
+        decimal_places=3,
+        default=0,
+        editable=False,
+        db_index=True,
+    )
+    grade = models.CharField(
+        max_length=16, null=True, blank=True, editable=False, db_index=True
+    )
+
     history = AuditlogHistoryField(pk_indexable=False)
-    history_record = HistoricalRecords(
+    history_record = BufferedHistoricalRecords(
         history_id_field=HashidAutoField(
             salt=f"lift_history_id_{HASHID_FIELD_SALT}"
-        )
+        ),
     )
 
     objects = LiftManager()
 
     class Meta:
         ordering = ["weight_category", "lottery_number"]
+        indexes = [
+            models.Index(
+                fields=[
+                    "competition",
+                    "weight_category",
+                    "lottery_number",
+                    "reference_id",
+                ],
+                name="lift_ordering_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["competition", "lottery_number", "weight_category"],
@@ -222,27 +259,6 @@ class Lift(models.Model):
         """Best clean and jerk returned."""
         return best_lift(self.cnjs)
 
-    @property
-    def total_lifted(self) -> int:
-        """Calculate total."""
-        total_lifted = 0
-        snatch_lifts = [
-            self.snatch_first,
-            self.snatch_second,
-            self.snatch_third,
-        ]
-        cnj_lifts = [
-            self.cnj_first,
-            self.cnj_second,
-            self.cnj_third,
-        ]
-        # must have at least a snatch lift and cnj to total
-        snatch_made = any([lift == "LIFT" for lift in snatch_lifts])
-        cnj_made = any([lift == "LIFT" for lift in cnj_lifts])
-        if all([snatch_made, cnj_made]):
-            total_lifted = self.best_snatch_weight[1] + self.best_cnj_weight[1]
-        return total_lifted
-
     @property
     def age_categories(self) -> AgeCategories:
         """Age category of the athlete at the time of the lift."""
@@ -251,24 +267,23 @@ class Lift(models.Model):
             competition_year=self.competition.date_start.year,
         )
 
-    @property
-    def sinclair(self) -> Decimal:
-        """Calculate sinclair for a lift."""
-        return calculate_sinclair(
+    def update_results(self) -> None:
+        """Recalculate the stored results from the attempts.
+
+        Called on `save()`. Lifts changed through `QuerySet.update()` or \
+                `bulk_update()` must be refreshed with \
+                `Lift.objects.refresh_results()`.
+        """
+        results = lift_results(
+            snatches=self.snatches,
+            cnjs=self.cnjs,
             bodyweight=self.bodyweight,
-            total_lifted=self.total_lifted,
             weight_category=self.weight_category,
             yearborn=self.athlete.yearborn,
             lift_year=self.competition.date_start.year,
         )
-
-    @property
-    def grade(self) -> str:
-        """Determine the grade of the lift."""
-        return determine_grade(
-            total_lifted=self.total_lifted,
-            weight_category=self.weight_category,
-        )
+        for field, value in results.items():
+            setattr(self, field, value)
 
     @cached_property
     # TODO: placings for junior, senior etc
@@ -282,40 +297,33 @@ class Lift(models.Model):
         2. Lowest clean and jerk
         3. Least number of attempts
         4. Lowest lottery number
+
+        Querysets annotated with `Lift.objects.with_placing()` or \
+                `with_placing_subquery()` provide `placing_rank`, otherwise \
+                the rank is queried for this lift.
         """
         if self.total_lifted == 0:
             return "-"
-        query = Lift.objects.filter(
-            competition=self.competition, weight_category=self.weight_category
-        )
-        lifts = [
-            {
-                "reference_id": q.reference_id,
-                "best_cnj_weight": q.best_cnj_weight,
-                "total_lifted": q.total_lifted,
-                "lottery_number": q.lottery_number,
-            }
-            for q in query
-            if q.total_lifted > 0  # ensures sorted lifts have a total
-        ]
-        sorted_lifts = sorted(
-            lifts,
-            key=lambda x: (
-                -x["total_lifted"],
-                x["best_cnj_weight"][1],
-                x["best_cnj_weight"][0],
-                x["lottery_number"],
-            ),
-        )
-        sorted_lifts_ids = [lift["reference_id"] for lift in sorted_lifts]
-        return ranking_suffixer(sorted_lifts_ids.index(self.reference_id) + 1)
+        placing_rank = getattr(self, "placing_rank", None)
+        if placing_rank is None:
+            placing_rank = (
+                Lift.objects.filter(pk=self.pk)
+                .with_placing_subquery()
+                .values_list("placing_rank", flat=True)
+                .get()
+            )
+        return ranking_suffixer(placing_rank)
 
     def clean(self, *args, **kwargs):
         """Customise validation.
 
         0. Validation attempts to ensure they are increasing depending on the
         current lift status.
-        1. Weightclasses are relevant to the date of the competition.
+        1. Weightclasses are relevant to the date of the competition, when \
+                weight category eras are set up. `weight_class` is linked. \
+                Lifts before the first era are not validated, nor saved \
+                lifts whose weight category and competition are unchanged, \
+                e.g. of categories no era was seeded with.
         """
         errors = []
         # 0. lift validation
@@ -327,17 +335,21 @@ class Lift(models.Model):
         )
 
         # 1. Weightclass validation
-        # CATEGORY is list of tuples e.g. `[..., ('M102+', 'M102+'), ...]`
-        # if (
-        #     self.competition.date_start.year >= 2018
-        #     and self.weight_category
-        #     not in (w[0] for w in CURRENT_WEIGHT_CATEGORIES)
-        # ) or (
-        #     self.competition.date_start.year <= 2018
-        #     and self.weight_category
-        #     not in (w[0] for w in OLD_WEIGHT_CATEGORIES)
-        # ):
-        #     errors.append("Weightclass from wrong era.")
+        self.weight_class = None
+        competition_id = Lift.competition.field.value_from_object(self)
+        if self.weight_category and competition_id is not None:
+            try:
+                self.weight_class = WeightCategory.objects.resolve(
+                    self.weight_category, self.competition.date_start
+                )
+            except WeightCategory.DoesNotExist:
+                # legacy lifts keep their weight category, unlinked
+                if (
+                    self._state.adding
+                    or self.weight_category != self._loaded_weight_category
+                    or competition_id != self._loaded_competition_id
+                ):
+                    errors.append("Weightclass from wrong era.")
         if len(errors) > 0:
             error_msg = "\n".join(errors)
             raise ValidationError(
@@ -350,14 +362,41 @@ class Lift(models.Model):
 
         super().clean(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the competition and athlete the lift was loaded with.
+
+        The caches and snapshots of both expire when the lift moves, see \
+                `api.signals`.
+        """
+        lift: Lift = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        lift._loaded_competition_id = loaded.get("competition_id")
+        lift._loaded_athlete_id = loaded.get("athlete_id")
+        lift._loaded_weight_category = loaded.get("weight_category")
+        return lift
+
     def save(self, *args, **kwargs):
-        """Necessary to enact custom validation in `clean()` method."""
+        """Necessary to enact custom validation in `clean()` method.
+
+        Stored results are recalculated before saving. The search document, \
+                rankings and athlete bests are refreshed once the \
+                transaction commits, see `LiftManager.refresh_derived()`.
+        """
         self.full_clean()
+        self.update_results()
         super().save(*args, **kwargs)
+        # loaded by `update_results()`
+        self._loaded_competition_id = self.competition.pk
+        self._loaded_athlete_id = self.athlete.pk
+        self._loaded_weight_category = self.weight_category
+        transaction.on_commit(partial(Lift.objects.refresh_derived, self.pk))
 
     def __str__(self):
         """__str__."""
         return f"{self.athlete} - {self.competition} {self.competition.date_start.year}"
 
 
+auditlog.register(Session)
+auditlog.register(Team)
 auditlog.register(Lift)
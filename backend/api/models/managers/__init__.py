@@ -1,7 +1,23 @@
 """Managers."""
 
+from .athlete_bests import AthleteBestManager
 from .athletes import AthleteManager
 from .competitions import CompetitionManager
+from .eras import EraManager
 from .lifts import LiftManager
+from .rankings import RankingManager
+from .search import SearchDocumentManager
+from .snapshots import CompetitionSnapshotManager
+from .weight_categories import WeightCategoryManager
 
-__all__ = ["LiftManager", "CompetitionManager", "AthleteManager"]
+__all__ = [
+    "LiftManager",
+    "CompetitionManager",
+    "AthleteManager",
+    "AthleteBestManager",
+    "CompetitionSnapshotManager",
+    "SearchDocumentManager",
+    "RankingManager",
+    "WeightCategoryManager",
+    "EraManager",
+]
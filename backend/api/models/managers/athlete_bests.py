@@ -0,0 +1,150 @@
+"""Custom manager for AthleteBest model."""
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Q
+
+from .rankings import DISCIPLINES, lift_age_categories
+
+
+def best_values(lifts) -> list[dict]:
+    """Best lift of each athlete, age category, weight category and discipline.
+
+    Sinclairs are compared across weight categories, their weight category \
+            is blank.
+
+    Args:
+        lifts (Iterable[Lift]): Lifts with their athlete and competition, \
+                most recent first. Of equal results the earliest lift is best.
+
+    Returns:
+        list[dict]: Field values of the `AthleteBest` rows.
+    """
+    bests: dict = {}
+    for lift in lifts:
+        for age_category in lift_age_categories(lift):
+            for discipline, field in DISCIPLINES.items():
+                weight_category = (
+                    "" if discipline == "sinclair" else lift.weight_category
+                )
+                key = (
+                    lift.athlete_id,
+                    age_category,
+                    weight_category,
+                    discipline,
+                )
+                value = getattr(lift, field)
+                current = bests.get(key)
+                if current is None or value >= current[0]:
+                    bests[key] = (value, lift.pk)
+    return [
+        {
+            "athlete_id": athlete_id,
+            "age_category": age_category,
+            "weight_category": weight_category,
+            "discipline": discipline,
+            "value": value,
+            "lift_id": lift_id,
+        }
+        for (
+            athlete_id,
+            age_category,
+            weight_category,
+            discipline,
+        ), (value, lift_id) in bests.items()
+    ]
+
+
+class AthleteBestManager(models.Manager):
+    """Manager for the AthleteBest Model."""
+
+    def _lifts(self, **filters):
+        Lift = apps.get_model("api", "Lift")
+        return (
+            Lift.objects.filter(**filters)
+            .select_related("athlete", "competition")
+            .order_by("-competition__date_start", "-pk")
+        )
+
+    def refresh(self, keys) -> int:
+        """Recreate the bests of athletes in some age categories.
+
+        Args:
+            keys (Iterable[tuple]): `(athlete_id, age_category)` to refresh.
+
+        Returns:
+            int: Number of rows created.
+        """
+        ages_by_athlete: dict = {}
+        for athlete_id, age_category in keys:
+            ages_by_athlete.setdefault(athlete_id, set()).add(age_category)
+        if not ages_by_athlete:
+            return 0
+        bests = [
+            self.model(**values)
+            for values in best_values(
+                self._lifts(athlete__in=list(ages_by_athlete))
+            )
+            if values["age_category"]
+            in ages_by_athlete.get(values["athlete_id"], ())
+        ]
+        stale = Q()
+        for athlete_id, ages in ages_by_athlete.items():
+            stale |= Q(athlete=athlete_id, age_category__in=ages)
+        with transaction.atomic():
+            self.filter(stale).delete()
+            return len(self.bulk_create(bests))
+
+    def refresh_lift(self, lift) -> int:
+        """Recreate the bests `lift` was or is a candidate for.
+
+        Rows pointing at the lift cover its previous athlete, age and weight \
+                categories, the lift itself covers the current ones.
+        """
+        keys = set(
+            self.filter(lift=lift.pk).values_list("athlete", "age_category")
+        )
+        keys |= {
+            (lift.athlete_id, age_category)
+            for age_category in lift_age_categories(lift)
+        }
+        return self.refresh(keys)
+
+    def refresh_athletes(self, athletes) -> int:
+        """Recreate every best of `athletes`, e.g. after `yearborn` changed.
+
+        Args:
+            athletes (QuerySet[Athlete]): Athletes to refresh.
+
+        Returns:
+            int: Number of rows created.
+        """
+        bests = [
+            self.model(**values)
+            for values in best_values(self._lifts(athlete__in=athletes))
+        ]
+        with transaction.atomic():
+            self.filter(athlete__in=athletes).delete()
+            return len(self.bulk_create(bests))
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        """Recreate every best.
+
+        Use after `update()`, `bulk_update()`, `bulk_create()` or data \
+                migrations, which bypass `save()`.
+
+        Args:
+            batch_size (int): Lifts fetched and rows created per query.
+
+        Returns:
+            int: Number of rows created.
+        """
+        bests = [
+            self.model(**values)
+            for values in best_values(
+                self._lifts().iterator(chunk_size=batch_size)
+            )
+        ]
+        with transaction.atomic():
+            self.all().delete()
+            return len(self.bulk_create(bests, batch_size=batch_size))
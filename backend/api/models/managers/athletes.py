@@ -1,47 +1,170 @@
 """Custom manager for Athlete model."""
 
-from django.contrib.postgres.search import (
-    SearchHeadline,
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
+from datetime import datetime
+
+from django.apps import apps
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import models
-from django.db.models import Q
+from django.db.models import (
+    Case,
+    Count,
+    Max,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Value,
+    When,
+)
 
+GRADE_ORDER = ("Elite", "International", "A", "B", "C", "D", "E")
+
+# columns of `for_export()`
+EXPORT_FIELDS = (
+    "reference_id",
+    "first_name",
+    "last_name",
+    "yearborn",
+    "lifts_count",
+    "best_total",
+    "best_sinclair",
+)
 
-class AthleteManager(models.Manager):
-    """Manager for the Athlete Model."""
+
+class AthleteQuerySet(models.QuerySet):
+    """QuerySet for the Athlete Model."""
 
     def search(self, query=None):
-        """Search along name and location."""
-        qs = self.get_queryset()
-        if query is not None:
-            refined_query = SearchQuery(query)
-            vector = SearchVector("first_name", "last_name")
-            rank = SearchRank(vector, refined_query)
-            first_name_headline = SearchHeadline(
-                "first_name",
-                refined_query,
+        """Search along the names, see `SearchDocument`."""
+        if query is None:
+            return self
+        SearchDocument = apps.get_model("api", "SearchDocument")
+        return SearchDocument.objects.search_instances(self, query)
+
+    def with_summary(self):
+        """Annotate and prefetch what `AthleteSerializer` reads.
+
+        Annotations:
+            - `lifts_count`
+            - `current_grade`: best grade this year.
+            - `athlete_last_edited`
+            - `lift_last_edited`
+
+        Prefetch:
+            - `recent_lifts`: list with the most recent lift.
+        """
+        Lift = apps.get_model("api", "Lift")
+        HistoricalAthlete = apps.get_model("api", "HistoricalAthlete")
+        HistoricalLift = apps.get_model("api", "HistoricalLift")
+
+        current_grade = (
+            Lift.objects.filter(
+                athlete=OuterRef("pk"),
+                competition__date_start__year=datetime.now().year,
+                grade__isnull=False,
             )
-            last_name_headline = SearchHeadline(
-                "last_name",
-                refined_query,
+            .annotate(
+                grade_order=Case(
+                    *[
+                        When(grade=grade, then=Value(idx))
+                        for idx, grade in enumerate(GRADE_ORDER)
+                    ]
+                )
             )
+            .order_by("grade_order")
+            .values("grade")[:1]
+        )
+        athlete_last_edited = (
+            HistoricalAthlete.objects.filter(reference_id=OuterRef("pk"))
+            .order_by()
+            .values("reference_id")
+            .annotate(last_edited=Max("history_date"))
+            .values("last_edited")
+        )
+        lift_last_edited = (
+            HistoricalLift.objects.filter(athlete=OuterRef("pk"))
+            .order_by()
+            .values("athlete")
+            .annotate(last_edited=Max("history_date"))
+            .values("last_edited")
+        )
+        recent_lifts = (
+            Lift.objects.for_serializer()
+            .with_placing_subquery()
+            .order_by("athlete_id", "-competition__date_start")
+            .distinct("athlete_id")
+        )
+        return self.annotate(
+            lifts_count=Count("lift"),
+            current_grade=Subquery(current_grade),
+            athlete_last_edited=Subquery(athlete_last_edited),
+            lift_last_edited=Subquery(lift_last_edited),
+        ).prefetch_related(
+            Prefetch("lift_set", queryset=recent_lifts, to_attr="recent_lifts")
+        )
 
-            qs = (
-                qs.annotate(
-                    search=vector,
-                    rank=rank,
-                    first_name_headline=first_name_headline,
-                    last_name_headline=last_name_headline,
-                )
-                .filter(
-                    Q(search=refined_query)
-                    | Q(first_name__trigram_similar=query)
-                    | Q(last_name__trigram_similar=query)
+    def for_export(self):
+        """Rows of `EXPORT_FIELDS` as dicts, bests aggregated in the query."""
+        return self.annotate(
+            lifts_count=Count("lift"),
+            best_total=Max("lift__total_lifted"),
+            best_sinclair=Max("lift__sinclair"),
+        ).values(*EXPORT_FIELDS)
+
+    def with_lifts(self):
+        """Prefetch all lifts as `lifts`, most recent first.
+
+        Lifts include their athlete, competition and placing, so serializing \
+                them requires no further queries. The `AthleteBest` rows are \
+                prefetched as `best_lifts`.
+        """
+        Lift = apps.get_model("api", "Lift")
+        lifts = (
+            Lift.objects.for_serializer()
+            .with_placing_subquery()
+            .order_by("-competition__date_start")
+        )
+        return self.prefetch_related(
+            Prefetch("lift_set", queryset=lifts, to_attr="lifts"),
+            Prefetch("bests", to_attr="best_lifts"),
+        )
+
+
+class AthleteManager(models.Manager.from_queryset(AthleteQuerySet)):  # type: ignore
+    """Manager for the Athlete Model."""
+
+    def match(
+        self,
+        first_name: str,
+        last_name: str,
+        yearborn: int,
+        similarity: float = 0.6,
+    ):
+        """Athlete born in `yearborn` with the most similar name.
+
+        Names are compared by trigram similarity of first and last name, \
+                averaged, so misspelt names of results sheets still match. \
+                The default does not match a different first name with the \
+                same last name.
+
+        Args:
+            first_name (str): First name.
+            last_name (str): Last name.
+            yearborn (int): Year of birth, must be equal.
+            similarity (float): Minimum similarity, between 0 and 1.
+
+        Returns:
+            Athlete | None: `None` if no name is similar enough.
+        """
+        return (
+            self.filter(yearborn=yearborn)
+            .annotate(
+                similarity=(
+                    TrigramSimilarity("first_name", first_name)
+                    + TrigramSimilarity("last_name", last_name)
                 )
-                .distinct()
-                .order_by("-rank")
+                / 2
             )
-        return qs
+            .filter(similarity__gte=similarity)
+            .order_by("-similarity")
+            .first()
+        )
@@ -1,44 +1,36 @@
 """Custom managers for Competitions model."""
 
-from django.contrib.postgres.search import (
-    SearchHeadline,
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
+from django.apps import apps
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count
+
+# columns of `for_export()`
+EXPORT_FIELDS = (
+    "reference_id",
+    "name",
+    "location",
+    "date_start",
+    "date_end",
+    "lifts_count",
+)
 
 
-class CompetitionManager(models.Manager):
-    """Manager for Competition Model."""
+class CompetitionQuerySet(models.QuerySet):
+    """QuerySet for the Competition Model."""
 
     def search(self, query=None):
-        """Search along name and location."""
-        qs = self.get_queryset()
-        if query is not None:
-            refined_query = SearchQuery(query)
-            vector = SearchVector("name", "location")
-            rank = SearchRank(vector, refined_query)
-            name_headline = SearchHeadline(
-                "name",
-                refined_query,
-            )
-            location_headline = SearchHeadline("location", refined_query)
-
-            qs = (
-                qs.annotate(
-                    search=vector,
-                    rank=rank,
-                    name_headline=name_headline,
-                    location_headline=location_headline,
-                )
-                .filter(
-                    Q(search=refined_query)
-                    | Q(name__trigram_similar=query)
-                    | Q(location__trigram_similar=query)
-                )
-                .distinct()
-                .order_by("-rank")
-            )
-        return qs
+        """Search along name and location, see `SearchDocument`."""
+        if query is None:
+            return self
+        SearchDocument = apps.get_model("api", "SearchDocument")
+        return SearchDocument.objects.search_instances(self, query)
+
+    def for_export(self):
+        """Rows of `EXPORT_FIELDS` as dicts, lifts counted in the query."""
+        return self.annotate(lifts_count=Count("lift")).values(*EXPORT_FIELDS)
+
+
+class CompetitionManager(
+    models.Manager.from_queryset(CompetitionQuerySet)  # type: ignore
+):
+    """Manager for Competition Model."""
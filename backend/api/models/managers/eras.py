@@ -0,0 +1,81 @@
+"""Custom manager for Era models."""
+
+from bisect import bisect_right
+from datetime import date, datetime
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import models
+
+# era timelines of this process by model label, with the version they were
+# loaded at, see `EraManager.timeline()`
+_timelines: dict[str, tuple[str, "EraTimeline"]] = {}
+
+
+def _as_date(value: date) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class EraTimeline:
+    """Eras ordered by `date_start`.
+
+    Each era lasts until the `date_start` of the next one, the latest era is \
+            current.
+    """
+
+    def __init__(self, eras):
+        self.eras = sorted(eras, key=lambda era: era.date_start)
+        self.starts = [era.date_start for era in self.eras]
+
+    def resolve(self, value: date):
+        """Era containing `value`, `None` if before the first era."""
+        idx = bisect_right(self.starts, _as_date(value))
+        return self.eras[idx - 1] if idx > 0 else None
+
+    def date_end(self, date_start: date) -> date | None:
+        """`date_start` of the era after `date_start`, `None` if current."""
+        idx = bisect_right(self.starts, _as_date(date_start))
+        return self.starts[idx] if idx < len(self.starts) else None
+
+
+class EraManager(models.Manager):
+    """Manager for Era Models.
+
+    The timeline of eras is cached per process, so resolving an era does not \
+            query the database. Changes to eras bump a version in the Django \
+            cache (see `api.signals`), which reloads the timeline of every \
+            process on its next lookup.
+    """
+
+    def _version_key(self) -> str:
+        return f"era_timeline_version_{self.model._meta.label_lower}"
+
+    def invalidate_timeline(self) -> None:
+        """Reload the timeline on the next lookup, call when eras change."""
+        cache.set(self._version_key(), uuid4().hex, timeout=None)
+
+    def timeline(self) -> EraTimeline:
+        """Cached timeline of eras, loaded when the version changed."""
+        version = cache.get(self._version_key())
+        if version is None:
+            cache.add(self._version_key(), uuid4().hex, timeout=None)
+            version = cache.get(self._version_key())
+        label = self.model._meta.label_lower
+        cached_version, timeline = _timelines.get(label, (None, None))
+        if timeline is None or cached_version != version:
+            timeline = EraTimeline(self.get_queryset())
+            _timelines[label] = (version, timeline)
+        return timeline
+
+    def resolve_era(self, value: date):
+        """Era containing the date `value`.
+
+        Eras are shared by the process, do not modify them.
+
+        Args:
+            value (date): Date within the era (e.g. competition start).
+
+        Returns:
+            Era | None: `None` if `value` is before the first era.
+        """
+        return self.timeline().resolve(value)
@@ -1,70 +1,435 @@
 """Custom managers for Lift model."""
 
-from django.contrib.postgres.search import (
-    SearchHeadline,
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
+from django.apps import apps
 from django.db import models
-from django.db.models import Q
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import (
+    Cast,
+    Coalesce,
+    Replace,
+    RowNumber,
+    Substr,
+)
 
+from ..history import buffered_history, instance_diff
+from ..utils import calculate_sinclair_many, grade_many
+from .rankings import lift_age_categories, ranking_values
 
-class LiftManager(models.Manager):
-    """Lift Manager for Lift Model."""
+ATTEMPTS = ("first", "second", "third")
 
-    def ordered_filter(self, *args, **kwargs):
-        """Order lift by weight category specifics.
+RESULT_FIELDS = [
+    "best_snatch",
+    "best_cnj",
+    "total_lifted",
+    "sinclair",
+    "grade",
+]
+
+# fields read by `LiftSerializer`, follows relations with `__`
+SERIALIZER_FIELDS = (
+    "reference_id",
+    "lottery_number",
+    "athlete",
+    "athlete__first_name",
+    "athlete__last_name",
+    "athlete__yearborn",
+    "competition",
+    "competition__name",
+    "competition__date_start",
+    *[
+        f"{lift_type}_{attempt}{suffix}"
+        for lift_type in ("snatch", "cnj")
+        for attempt in ATTEMPTS
+        for suffix in ("", "_weight")
+    ],
+    *RESULT_FIELDS,
+    "bodyweight",
+    "weight_category",
+    # not serialized, but read by the history record on update and delete
+    "weight_class",
+    "team",
+    "session_number",
+)
+
+# columns of `for_export()`, follows relations with `__`
+EXPORT_FIELDS = (
+    "reference_id",
+    "competition",
+    "competition__name",
+    "competition__date_start",
+    "athlete",
+    "athlete__first_name",
+    "athlete__last_name",
+    "athlete__yearborn",
+    "lottery_number",
+    "session_number",
+    "team",
+    "bodyweight",
+    "weight_category",
+    *[
+        f"{lift_type}_{attempt}{suffix}"
+        for lift_type in ("snatch", "cnj")
+        for attempt in ATTEMPTS
+        for suffix in ("", "_weight")
+    ],
+    *RESULT_FIELDS,
+    "placing_rank",
+)
+
+
+def _best_attempt(lift_type: str) -> Case:
+    """SQL equivalent of `best_lift()` attempt for `lift_type`.
+
+    The attempt is the first good lift matching the stored best weight, `0` \
+            if no lift was made.
+    """
+    return Case(
+        *[
+            When(
+                **{
+                    f"{lift_type}_{attempt}": "LIFT",
+                    f"{lift_type}_{attempt}_weight": F(f"best_{lift_type}"),
+                    f"best_{lift_type}__gt": 0,
+                },
+                then=Value(idx),
+            )
+            for idx, attempt in enumerate(ATTEMPTS, start=1)
+        ],
+        default=Value(0),
+    )
+
+
+class LiftQuerySet(models.QuerySet):
+    """QuerySet for the Lift Model."""
+
+    def with_placing(self):
+        """Annotate `placing_rank` for each lift in its weight category.
+
+        How placing is determined in weightlifting:
+        1. Best total
+        2. Lowest clean and jerk
+        3. Least number of attempts
+        4. Lowest lottery number
+
+        The ranking is a window over the rows of this queryset, so filter on \
+                whole competitions (e.g. `competition=...`) only, filtering \
+                out other lifts in a weight category will change the rank.
+        """
+        return self.annotate(
+            best_cnj_attempt=_best_attempt("cnj"),
+            placing_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F("competition"), F("weight_category")],
+                order_by=[
+                    F("total_lifted").desc(),
+                    F("best_cnj").asc(),
+                    F("best_cnj_attempt").asc(),
+                    F("lottery_number").asc(),
+                ],
+            ),
+        )
+
+    def with_placing_subquery(self):
+        """Annotate `placing_rank` by counting the lifts placed ahead.
 
-        1. Weightclasses
-        2. Super-heavies
-        3. Female before male
+        Same ranking as `with_placing()`, but each lift is ranked against its \
+                whole weight category with a correlated subquery, so it is \
+                correct for any filter (e.g. all lifts by an athlete).
         """
-        kwargs.get("competition")
-        query = super().filter(*args, **kwargs)
+        ahead = (
+            self.model.objects.filter(
+                competition=OuterRef("competition"),
+                weight_category=OuterRef("weight_category"),
+                total_lifted__gt=0,
+            )
+            .annotate(best_cnj_attempt=_best_attempt("cnj"))
+            .filter(
+                Q(total_lifted__gt=OuterRef("total_lifted"))
+                | Q(
+                    total_lifted=OuterRef("total_lifted"),
+                    best_cnj__lt=OuterRef("best_cnj"),
+                )
+                | Q(
+                    total_lifted=OuterRef("total_lifted"),
+                    best_cnj=OuterRef("best_cnj"),
+                    best_cnj_attempt__lt=OuterRef("best_cnj_attempt"),
+                )
+                | Q(
+                    total_lifted=OuterRef("total_lifted"),
+                    best_cnj=OuterRef("best_cnj"),
+                    best_cnj_attempt=OuterRef("best_cnj_attempt"),
+                    lottery_number__lt=OuterRef("lottery_number"),
+                )
+            )
+            .order_by()
+            .values("competition")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.annotate(best_cnj_attempt=_best_attempt("cnj")).annotate(
+            placing_rank=Coalesce(Subquery(ahead), 0) + 1
+        )
 
-        # order on int values for weight classes (i.e. not string)
-        query = sorted(  # type: ignore
-            query, key=lambda q: int(q.weight_category[1:].replace("+", ""))
+    def for_serializer(self):
+        """Load only what `LiftSerializer` reads, in the same query.
+
+        Athlete and competition are joined, only the columns read are \
+                loaded. Combine with `with_placing()` \
+                or `with_placing_subquery()` to avoid a query per `placing`.
+        """
+        return self.select_related("athlete", "competition").only(
+            *SERIALIZER_FIELDS
         )
-        # ordering super heavies
-        query = sorted(query, key=lambda q: "+" in q.weight_category)  # type: ignore
-        # order female before male
-        query = sorted(query, key=lambda q: q.weight_category[0], reverse=True)  # type: ignore
 
-        return query
+    def for_export(self):
+        """Rows of `EXPORT_FIELDS` as dicts, oldest competition first.
 
-    def search(self, query=None):
-        """Search along name and location."""
-        qs = self.get_queryset()
-        if query is not None:
-            refined_query = SearchQuery(query)
-            vector = SearchVector(
-                "athlete__first_name",
-                "athlete__last_name",
+        Annotate `placing_rank` first with `with_placing()` or \
+                `with_placing_subquery()`. Iterate with `iterator()`, the \
+                stored results need no calculation.
+        """
+        return self.order_by(
+            "competition__date_start",
+            "competition",
+            *self.model._meta.ordering,
+        ).values(*EXPORT_FIELDS)
+
+    def refresh_results(self, batch_size: int = 500) -> int:
+        """Recalculate stored results for the lifts in this queryset.
+
+        Use after `update()`, `bulk_update()`, `bulk_create()` or data \
+                migrations, which bypass `Lift.save()`.
+
+        Args:
+            batch_size (int): Lifts fetched and updated per query.
+
+        Returns:
+            int: Number of lifts refreshed.
+        """
+        lifts = []
+        refreshed = 0
+        for lift in self.select_related("athlete", "competition").iterator(
+            chunk_size=batch_size
+        ):
+            lift.update_results()
+            lifts.append(lift)
+            if len(lifts) == batch_size:
+                refreshed += self.model.objects.bulk_update(
+                    lifts, RESULT_FIELDS
+                )
+                lifts = []
+        if lifts:
+            refreshed += self.model.objects.bulk_update(lifts, RESULT_FIELDS)
+        return refreshed
+
+    def refresh_grades(self) -> int:
+        """Regrade the lifts in this queryset from their stored totals.
+
+        Faster than `refresh_results()` when only the grading standards \
+                changed, lifts are graded with `grade_many()` and updated \
+                with one query per grade.
+
+        Returns:
+            int: Number of lifts regraded.
+        """
+        pks, totals, weight_categories = [], [], []
+        for pk, total, weight_category in self.values_list(
+            "pk", "total_lifted", "weight_category"
+        ).iterator():
+            pks.append(pk)
+            totals.append(total)
+            weight_categories.append(weight_category)
+        by_grade: dict[str | None, list] = {}
+        for pk, grade in zip(pks, grade_many(totals, weight_categories)):
+            by_grade.setdefault(grade, []).append(pk)
+        return sum(
+            self.model.objects.filter(pk__in=grade_pks).update(grade=grade)
+            for grade, grade_pks in by_grade.items()
+        )
+
+    def refresh_sinclairs(self, batch_size: int = 500) -> int:
+        """Recalculate the sinclair of the lifts in this queryset.
+
+        Faster than `refresh_results()` when only the sinclair changed, \
+                lifts are calculated with `calculate_sinclair_many()` from \
+                their stored totals.
+
+        Args:
+            batch_size (int): Lifts updated per query.
+
+        Returns:
+            int: Number of lifts refreshed.
+        """
+        rows = list(
+            self.values_list(
+                "pk",
+                "bodyweight",
+                "total_lifted",
+                "weight_category",
+                "competition__date_start__year",
             )
-            rank = SearchRank(vector, refined_query)
-            first_name_headline = SearchHeadline(
-                "athlete__first_name",
-                refined_query,
+        )
+        sinclairs = calculate_sinclair_many(
+            bodyweights=[row[1] for row in rows],
+            totals=[row[2] for row in rows],
+            sexes=[row[3][:1] for row in rows],
+            lift_years=[row[4] for row in rows],
+        )
+        lifts = [
+            self.model(pk=pk, sinclair=sinclair)
+            for (pk, *_), sinclair in zip(rows, sinclairs)
+        ]
+        return self.model.objects.bulk_update(
+            lifts, ["sinclair"], batch_size=batch_size
+        )
+
+    def ordered_filter(self, *args, **kwargs):
+        """Order lift by weight category specifics.
+
+        1. Female before male
+        2. Super-heavies after weightclasses
+        3. Weightclasses by weight (i.e. not string)
+
+        Ties keep the `Meta.ordering`. Sort keys come from the linked \
+                `weight_class`, or are parsed from `weight_category` for \
+                lifts outside of the weight category eras.
+        """
+        return (
+            self.filter(*args, **kwargs)
+            .annotate(
+                weight_category_sex=Coalesce(
+                    "weight_class__sex", Substr("weight_category", 1, 1)
+                ),
+                weight_category_is_plus=Coalesce(
+                    "weight_class__is_plus",
+                    Case(
+                        When(weight_category__contains="+", then=Value(True)),
+                        default=Value(False),
+                    ),
+                ),
+                weight_category_weight=Coalesce(
+                    "weight_class__weight",
+                    Cast(
+                        Replace(
+                            Substr("weight_category", 2),
+                            Value("+"),
+                            Value(""),
+                        ),
+                        IntegerField(),
+                    ),
+                ),
             )
-            last_name_headline = SearchHeadline(
-                "athlete__last_name", refined_query
+            .order_by(
+                F("weight_category_sex").desc(),
+                "weight_category_is_plus",
+                "weight_category_weight",
+                *self.model._meta.ordering,
             )
+        )
 
-            qs = (
-                qs.annotate(
-                    search=vector,
-                    rank=rank,
-                    first_name_headline=first_name_headline,
-                    last_name_headline=last_name_headline,
-                )
-                .filter(
-                    Q(search=refined_query)
-                    | Q(athlete__first_name__trigram_similar=query)
-                    | Q(athlete__last_name__trigram_similar=query)
+
+class LiftManager(models.Manager.from_queryset(LiftQuerySet)):  # type: ignore
+    """Lift Manager for Lift Model."""
+
+    def create_many(
+        self,
+        lifts,
+        user=None,
+        remote_addr=None,
+        batch_size: int = 500,
+        athlete_bests: bool = True,
+    ) -> list:
+        """Bulk `save()` of new, already validated lifts.
+
+        Results are calculated in memory, then lifts, their historical \
+                records and audit log entries are created with one query per \
+                batch, in one transaction. Search documents, rankings and \
+                athlete bests are refreshed for all lifts at once. No \
+                `post_save` is sent, expire caches of the caller.
+
+        Args:
+            lifts (list[Lift]): Unsaved lifts, with their athlete, \
+                    competition and `weight_class` set.
+            user (User | None): History user and audit log actor.
+            remote_addr (str | None): Address recorded in the audit log.
+            batch_size (int): Rows created per query.
+            athlete_bests (bool): Refresh the bests of the athletes, skip \
+                    when importing in parallel and refresh them once after.
+
+        Returns:
+            list[Lift]: The created lifts.
+        """
+        AthleteBest = apps.get_model("api", "AthleteBest")
+        LogEntry = apps.get_model("auditlog", "LogEntry")
+        Ranking = apps.get_model("api", "Ranking")
+        SearchDocument = apps.get_model("api", "SearchDocument")
+        for lift in lifts:
+            lift.update_results()
+        with buffered_history(batch_size=batch_size) as history:
+            lifts = self.bulk_create(lifts, batch_size=batch_size)
+            # reverse relations of new lifts are empty, do not query them
+            fields = [field.name for field in self.model._meta.fields]
+            for lift in lifts:
+                history.add_record(lift, "+", user=user)
+                history.add_log_entry(
+                    lift,
+                    LogEntry.Action.CREATE,
+                    instance_diff(None, lift, fields),
+                    actor=user,
+                    remote_addr=remote_addr,
                 )
-                .distinct()
-                .order_by("-rank")
+            SearchDocument.objects.create_many(lifts, batch_size=batch_size)
+            Ranking.objects.bulk_create(
+                [
+                    Ranking(**values)
+                    for lift in lifts
+                    for values in ranking_values(lift)
+                ],
+                batch_size=batch_size,
             )
-        return qs
+            if athlete_bests:
+                AthleteBest.objects.refresh(
+                    (lift.athlete_id, age_category)
+                    for lift in lifts
+                    for age_category in lift_age_categories(lift)
+                )
+        return lifts
+
+    def refresh_derived(self, pk) -> None:
+        """Refresh the search document, rankings and athlete bests of a lift.
+
+        Called once the transaction of `Lift.save()` commits. Skipped when \
+                the lift was deleted meanwhile, `post_delete` refreshes them.
+
+        Args:
+            pk: Primary key of the saved lift.
+        """
+        AthleteBest = apps.get_model("api", "AthleteBest")
+        Ranking = apps.get_model("api", "Ranking")
+        SearchDocument = apps.get_model("api", "SearchDocument")
+        lifts = self.filter(pk=pk)
+        lift = lifts.select_related("athlete", "competition").first()
+        if lift is None:
+            return
+        SearchDocument.objects.refresh(lift)
+        Ranking.objects.refresh(lifts)
+        AthleteBest.objects.refresh_lift(lift)
+
+    def search(self, query=None):
+        """Search along the athlete names, see `SearchDocument`."""
+        qs = self.get_queryset()
+        if query is None:
+            return qs
+        SearchDocument = apps.get_model("api", "SearchDocument")
+        return SearchDocument.objects.search_instances(qs, query)
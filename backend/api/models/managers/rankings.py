@@ -0,0 +1,106 @@
+"""Custom manager for Ranking model."""
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from ..utils import age_category
+
+# discipline and the result field of `Lift` it is ranked by
+DISCIPLINES = {
+    "snatch": "best_snatch",
+    "cnj": "best_cnj",
+    "total": "total_lifted",
+    "sinclair": "sinclair",
+}
+
+
+def lift_age_categories(lift) -> list[str]:
+    """Age categories of the athlete at the lift, e.g. `["junior", "senior"]`.
+
+    Names of `AgeCategories` without `is_`, none if the age is invalid.
+    """
+    try:
+        flags = age_category(
+            yearborn=lift.athlete.yearborn,
+            competition_year=lift.competition.date_start.year,
+        )
+    except ValidationError:
+        return []
+    return [name.removeprefix("is_") for name, flag in flags.items() if flag]
+
+
+def ranking_values(lift) -> list[dict]:
+    """Ranking rows of `lift`, one per discipline with a result.
+
+    Reads the athlete and competition of the lift, select them with it.
+    """
+    if not lift.weight_category:
+        return []
+    age_categories = lift_age_categories(lift)
+    return [
+        {
+            "lift_id": lift.pk,
+            "athlete_id": lift.athlete_id,
+            "competition_id": lift.competition_id,
+            "discipline": discipline,
+            "value": getattr(lift, field),
+            "sex": lift.weight_category[0],
+            "weight_category": lift.weight_category,
+            "year": lift.competition.date_start.year,
+            "age_categories": age_categories,
+        }
+        for discipline, field in DISCIPLINES.items()
+        if getattr(lift, field) > 0
+    ]
+
+
+class RankingManager(models.Manager):
+    """Manager for the Ranking Model."""
+
+    def refresh(self, lifts) -> int:
+        """Recreate the ranking rows of `lifts`.
+
+        Args:
+            lifts (QuerySet[Lift]): Lifts whose results, athlete or \
+                    competition changed.
+
+        Returns:
+            int: Number of rows created.
+        """
+        rankings = [
+            self.model(**values)
+            for lift in lifts.select_related("athlete", "competition")
+            for values in ranking_values(lift)
+        ]
+        with transaction.atomic():
+            self.filter(lift__in=lifts).delete()
+            return len(self.bulk_create(rankings))
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        """Recreate every ranking row.
+
+        Use after `update()`, `bulk_update()`, `bulk_create()` or data \
+                migrations, which bypass `save()`.
+
+        Args:
+            batch_size (int): Lifts fetched and rows created per query.
+
+        Returns:
+            int: Number of rows created.
+        """
+        Lift = apps.get_model("api", "Lift")
+        lifts = Lift.objects.select_related("athlete", "competition")
+        created = 0
+        with transaction.atomic():
+            self.all().delete()
+            rankings = []
+            for lift in lifts.iterator(chunk_size=batch_size):
+                rankings += [
+                    self.model(**values) for values in ranking_values(lift)
+                ]
+                if len(rankings) >= batch_size:
+                    created += len(self.bulk_create(rankings))
+                    rankings = []
+            created += len(self.bulk_create(rankings))
+        return created
@@ -0,0 +1,175 @@
+"""Custom manager for SearchDocument model."""
+
+from django.apps import apps
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import models
+from django.db.models import F, OuterRef, Prefetch, Q, Subquery, Value
+
+# fields indexed for each searchable model, follows relations with `__`
+# the headline highlights the document text joined from these fields
+SEARCH_FIELDS = {
+    "athlete": ("first_name", "last_name"),
+    "competition": ("name", "location"),
+    "lift": ("athlete__first_name", "athlete__last_name"),
+}
+
+
+def document_text(instance: models.Model) -> str:
+    """Text of the search document of `instance`."""
+    values = []
+    for field in SEARCH_FIELDS[instance._meta.model_name]:
+        value = instance
+        for attribute in field.split("__"):
+            value = getattr(value, attribute)
+        if value:
+            values.append(str(value))
+    return " ".join(values)
+
+
+class SearchDocumentManager(models.Manager):
+    """Manager for the SearchDocument Model."""
+
+    def matches(self, query):
+        """Documents matching `query`, annotated with their `rank`."""
+        refined_query = SearchQuery(query)
+        return self.annotate(
+            rank=SearchRank(F("vector"), refined_query)
+        ).filter(Q(vector=refined_query) | Q(text__trigram_word_similar=query))
+
+    def search(self, query=None):
+        """Search athletes, competitions and lifts in one ranked query."""
+        if query is None:
+            return self.none()
+        Athlete = apps.get_model("api", "Athlete")
+        Lift = apps.get_model("api", "Lift")
+        return (
+            self.matches(query)
+            .select_related("competition")
+            .prefetch_related(
+                Prefetch("athlete", queryset=Athlete.objects.with_summary()),
+                Prefetch(
+                    "lift",
+                    queryset=Lift.objects.for_serializer().with_placing_subquery(),
+                ),
+            )
+            .order_by("-rank", "pk")
+        )
+
+    def search_instances(self, queryset, query):
+        """Instances of `queryset` whose documents match `query`, by rank.
+
+        Args:
+            queryset (QuerySet): Athletes, competitions or lifts.
+            query (str): search query.
+        """
+        rank = (
+            self.matches(query)
+            .filter(**{queryset.model._meta.model_name: OuterRef("pk")})
+            .values("rank")[:1]
+        )
+        return (
+            queryset.annotate(rank=Subquery(rank))
+            .filter(rank__isnull=False)
+            .order_by("-rank")
+        )
+
+    def add_headlines(self, documents, query):
+        """Set the `headline` of `documents` with a single query.
+
+        Only call this for the documents returned (e.g. a page of `search()`), \
+                generating headlines is expensive.
+
+        Args:
+            documents (list[SearchDocument]): documents to highlight.
+            query (str): search query to highlight.
+
+        Returns:
+            list[SearchDocument]: `documents`
+        """
+        headlines = dict(
+            self.filter(pk__in=[document.pk for document in documents])
+            .annotate(headline=SearchHeadline("text", SearchQuery(query)))
+            .values_list("pk", "headline")
+        )
+        for document in documents:
+            document.headline = headlines[document.pk]
+        return documents
+
+    def refresh(self, instance: models.Model) -> None:
+        """Create or update the search document of `instance`.
+
+        Lifts are indexed by athlete name, so refreshing an athlete also \
+                refreshes the documents of their lifts.
+        """
+        model_name = instance._meta.model_name
+        text = document_text(instance)
+        self.update_or_create(
+            **{model_name: instance},
+            defaults={"text": text, "vector": SearchVector(Value(text))},
+        )
+        if model_name == "athlete":
+            self.filter(lift__athlete=instance).update(
+                text=text, vector=SearchVector(Value(text))
+            )
+
+    def create_many(self, instances, batch_size: int = 500) -> int:
+        """Create the search documents of new `instances`, e.g. bulk created.
+
+        Args:
+            instances (list[models.Model]): Instances of one model, with the \
+                    relations their `SEARCH_FIELDS` follow loaded.
+            batch_size (int): Documents created per query.
+
+        Returns:
+            int: Number of documents created.
+        """
+        documents = self.bulk_create(
+            [
+                self.model(
+                    **{instance._meta.model_name: instance},
+                    text=document_text(instance),
+                )
+                for instance in instances
+            ],
+            batch_size=batch_size,
+        )
+        self.filter(pk__in=[document.pk for document in documents]).update(
+            vector=SearchVector("text")
+        )
+        return len(documents)
+
+    def rebuild(self, batch_size: int = 500) -> int:
+        """Recreate every search document.
+
+        Use after `update()`, `bulk_update()`, `bulk_create()` or data \
+                migrations, which bypass `save()`.
+
+        Args:
+            batch_size (int): Documents fetched and created per query.
+
+        Returns:
+            int: Number of documents created.
+        """
+        self.all().delete()
+        created = 0
+        for model_name, fields in SEARCH_FIELDS.items():
+            model = self.model._meta.get_field(model_name).related_model
+            relations = {
+                field.rsplit("__", 1)[0] for field in fields if "__" in field
+            }
+            documents = [
+                self.model(
+                    **{model_name: instance}, text=document_text(instance)
+                )
+                for instance in model.objects.select_related(
+                    *relations
+                ).iterator(chunk_size=batch_size)
+            ]
+            created += len(self.bulk_create(documents, batch_size=batch_size))
+        self.update(vector=SearchVector("text"))
+        return created
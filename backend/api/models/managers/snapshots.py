@@ -0,0 +1,144 @@
+"""Custom manager for CompetitionSnapshot model.
+
+Snapshots are expired by the `post_save`/`post_delete` receivers in \
+        `api.signals` and rebuilt once the transaction commits, by \
+        `COMPETITION_SNAPSHOT_WORKERS` threads of each process.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from api.models.caches import invalidation_suppressed
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+# competitions waiting for a thread, not scheduled twice
+_pending: set[str] = set()
+_lock = threading.Lock()
+
+
+class CompetitionSnapshotManager(models.Manager):
+    """Manager for the CompetitionSnapshot Model."""
+
+    def expire(
+        self, competitions, create: bool = True, rebuild: bool = True
+    ) -> list:
+        """Bump the version of the snapshots of `competitions`.
+
+        Args:
+            competitions (Iterable): Primary keys of the competitions, \
+                    or a flat `values_list()` of them.
+            create (bool): Create missing snapshots stale. Not on delete, \
+                    the competition may be deleted with its lifts.
+            rebuild (bool): Rebuild them in the background once the \
+                    transaction commits, see `schedule()`.
+
+        Returns:
+            list: Primary keys of the competitions, none within \
+                    `suppressed_invalidation()`.
+        """
+        pks = list({str(pk) for pk in competitions})
+        if not pks or invalidation_suppressed():
+            return []
+        with transaction.atomic():
+            self.filter(competition__in=pks).update(version=F("version") + 1)
+            if create:
+                self.bulk_create(
+                    [self.model(competition_id=pk) for pk in pks],
+                    ignore_conflicts=True,
+                )
+            if rebuild:
+                transaction.on_commit(partial(self.schedule, pks))
+        return pks
+
+    def expire_all(self) -> int:
+        """Bump the version of every snapshot, e.g. after an era changed.
+
+        Use after `update()`, `bulk_update()` or data migrations of lifts, \
+                which bypass `save()`. Snapshots are rebuilt when retrieved.
+        """
+        return self.update(version=F("version") + 1)
+
+    def store(self, competition, version: int, data: dict) -> bool:
+        """Store `data` built from `version` of the snapshot.
+
+        Returns:
+            bool: False if the version was bumped meanwhile, `data` is \
+                    discarded then.
+        """
+        return bool(
+            self.filter(competition=competition, version=version).update(
+                data=data, built_version=version, built_at=timezone.now()
+            )
+        )
+
+    def build(self, pk) -> bool:
+        """Serialize the competition `pk` into its snapshot.
+
+        Returns:
+            bool: Whether the snapshot was stored, not if it or the \
+                    competition is missing, or it was expired meanwhile.
+        """
+        # the serializers import the models
+        from rest_framework.utils.encoders import JSONEncoder
+
+        from api.serializers import CompetitionDetailSerializer
+
+        version = (
+            self.filter(competition=pk)
+            .values_list("version", flat=True)
+            .first()
+        )
+        Competition = apps.get_model("api", "Competition")
+        competition = Competition.objects.filter(pk=pk).first()
+        if version is None or competition is None:
+            return False
+        # urls relative to the host, see `api.views.snapshots.absolute_urls()`
+        data = CompetitionDetailSerializer(
+            competition, context={"request": None}
+        ).data
+        # as rendered, e.g. dates of the history
+        data = json.loads(json.dumps(data, cls=JSONEncoder))
+        return self.store(pk, version, data)
+
+    def _build_many(self, pks) -> None:
+        try:
+            for pk in pks:
+                with _lock:
+                    _pending.discard(pk)
+                try:
+                    self.build(pk)
+                except Exception:
+                    # left stale, served live until it is expired again
+                    logger.exception("Building snapshot of %s failed.", pk)
+        finally:
+            connection.close()
+
+    def schedule(self, pks) -> None:
+        """Rebuild the snapshots of the competitions `pks` in the background."""
+        global _executor
+        pks = [str(pk) for pk in pks]
+        if settings.COMPETITION_SNAPSHOT_WORKERS == 0:
+            for pk in pks:
+                self.build(pk)
+            return
+        with _lock:
+            pks = [pk for pk in pks if pk not in _pending]
+            _pending.update(pks)
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.COMPETITION_SNAPSHOT_WORKERS,
+                    thread_name_prefix="snapshot",
+                )
+        if pks:
+            _executor.submit(self._build_many, pks)
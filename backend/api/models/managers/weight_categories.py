@@ -0,0 +1,63 @@
+"""Custom manager for WeightCategory model."""
+
+from django.apps import apps
+from django.db import models
+
+from ..utils import parse_weight_category
+
+
+class WeightCategoryManager(models.Manager):
+    """Manager for the WeightCategory Model."""
+
+    def resolve(self, name: str, date):
+        """Weight category `name` in the era at `date`.
+
+        Args:
+            name (str): Weight category (e.g. "M109+").
+            date (date): Date the weight category applies (e.g. competition \
+                    start).
+
+        Raises:
+            WeightCategory.DoesNotExist: the era has no such weight category.
+
+        Returns:
+            WeightCategory | None: `None` if no era starts before `date`.
+        """
+        WeightCategoryEra = apps.get_model("api", "WeightCategoryEra")
+        era = WeightCategoryEra.objects.resolve_era(date)
+        if era is None:
+            return None
+        sex, weight, is_plus = parse_weight_category(name)
+        return self.get(era=era, sex=sex, weight=weight, is_plus=is_plus)
+
+    def resolve_many(self, names, date) -> dict:
+        """Weight categories `names` in the era at `date`, in one query.
+
+        Args:
+            names (Iterable[str]): Weight categories (e.g. "M109+").
+            date (date): Date the weight categories apply (e.g. competition \
+                    start).
+
+        Returns:
+            dict[str, WeightCategory | None]: By name, names the era has no \
+                    such weight category for are missing. All `None` if no \
+                    era starts before `date`.
+        """
+        WeightCategoryEra = apps.get_model("api", "WeightCategoryEra")
+        era = WeightCategoryEra.objects.resolve_era(date)
+        if era is None:
+            return dict.fromkeys(names)
+        weight_categories = {
+            (
+                weight_category.sex,
+                weight_category.weight,
+                weight_category.is_plus,
+            ): (weight_category)
+            for weight_category in self.filter(era=era)
+        }
+        resolved = {}
+        for name in names:
+            key = parse_weight_category(name)
+            if key in weight_categories:
+                resolved[name] = weight_categories[key]
+        return resolved
@@ -0,0 +1,83 @@
+"""Ranking model."""
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+from hashid_field import HashidAutoField
+
+from config.settings import HASHID_FIELD_SALT
+
+from .managers import RankingManager
+from .support.weight_categories import SEX_CHOICES
+
+DISCIPLINE_CHOICES = [
+    ("snatch", "Snatch"),
+    ("cnj", "Clean and Jerk"),
+    ("total", "Total"),
+    ("sinclair", "Sinclair"),
+]
+
+
+class Ranking(models.Model):
+    """Ranking summary of a lift.
+
+    One row per lift and discipline with a result, denormalised from the \
+            lift, its athlete and competition, so `RankingAPIView` filters \
+            and orders rankings on this table alone. The view picks the \
+            best row of each athlete after filtering, e.g. their best of a \
+            year. Kept current by the `save()` of lifts, athletes and \
+            competitions.
+    """
+
+    reference_id = HashidAutoField(
+        primary_key=True,
+        salt=f"rankingmodel_reference_id_{HASHID_FIELD_SALT}",
+    )
+    lift = models.ForeignKey(
+        "api.Lift", related_name="rankings", on_delete=models.CASCADE
+    )
+    athlete = models.ForeignKey("api.Athlete", on_delete=models.CASCADE)
+    competition = models.ForeignKey(
+        "api.Competition", on_delete=models.CASCADE
+    )
+    discipline = models.CharField(max_length=8, choices=DISCIPLINE_CHOICES)
+    value = models.DecimalField(max_digits=7, decimal_places=3)
+    sex = models.CharField(max_length=1, choices=SEX_CHOICES)
+    weight_category = models.CharField(max_length=5)
+    year = models.IntegerField()
+    # e.g. ["junior", "senior"], names of `AgeCategories` without `is_`
+    age_categories = ArrayField(models.CharField(max_length=16), default=list)
+
+    objects = RankingManager()
+
+    class Meta:
+        ordering = ["-value"]
+        indexes = [
+            models.Index(
+                fields=["discipline", "-value", "reference_id"],
+                name="ranking_discipline_idx",
+            ),
+            models.Index(
+                fields=["discipline", "sex", "year", "-value"],
+                name="ranking_sex_year_idx",
+            ),
+            models.Index(
+                fields=["discipline", "weight_category", "year", "-value"],
+                name="ranking_weight_category_idx",
+            ),
+            # best ranking of each athlete, see `RankingAPIView`
+            models.Index(
+                fields=["discipline", "athlete", "-value"],
+                name="ranking_athlete_idx",
+            ),
+            GinIndex(fields=["age_categories"], name="ranking_age_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lift", "discipline"],
+                name="ranking_lift_discipline_unique_combination",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_discipline_display()}: {self.value}"
@@ -0,0 +1,76 @@
+"""Search document model."""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from hashid_field import HashidAutoField
+
+from config.settings import HASHID_FIELD_SALT
+
+from .managers import SearchDocumentManager
+
+
+class SearchDocument(models.Model):
+    """Search document.
+
+    One row per athlete, competition and lift with its searchable text, so \
+            `SearchAPIView` ranks and paginates all results in one query. \
+            Kept current by the `save()` of the indexed models.
+    """
+
+    reference_id = HashidAutoField(
+        primary_key=True,
+        salt=f"searchdocumentmodel_reference_id_{HASHID_FIELD_SALT}",
+    )
+    athlete = models.OneToOneField(
+        "api.Athlete", null=True, blank=True, on_delete=models.CASCADE
+    )
+    competition = models.OneToOneField(
+        "api.Competition", null=True, blank=True, on_delete=models.CASCADE
+    )
+    lift = models.OneToOneField(
+        "api.Lift", null=True, blank=True, on_delete=models.CASCADE
+    )
+    text = models.TextField(blank=True)
+    vector = SearchVectorField(null=True)
+
+    objects = SearchDocumentManager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["vector"], name="searchdocument_vector_idx"),
+            GinIndex(
+                OpClass("text", name="gin_trgm_ops"),
+                name="searchdocument_text_trgm_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    models.Q(
+                        athlete__isnull=False,
+                        competition__isnull=True,
+                        lift__isnull=True,
+                    )
+                    | models.Q(
+                        athlete__isnull=True,
+                        competition__isnull=False,
+                        lift__isnull=True,
+                    )
+                    | models.Q(
+                        athlete__isnull=True,
+                        competition__isnull=True,
+                        lift__isnull=False,
+                    )
+                ),
+                name="searchdocument_single_instance",
+            ),
+        ]
+
+    @property
+    def instance(self) -> models.Model:
+        """The athlete, competition or lift this document indexes."""
+        return self.athlete or self.competition or self.lift
+
+    def __str__(self) -> str:
+        return self.text
@@ -0,0 +1,44 @@
+"""Competition snapshot model."""
+
+from django.db import models
+from hashid_field import HashidAutoField
+
+from config.settings import HASHID_FIELD_SALT
+
+from .managers import CompetitionSnapshotManager
+
+
+class CompetitionSnapshot(models.Model):
+    """Stored detail response of a competition, with its results.
+
+    `version` is bumped whenever the competition, its lifts or their \
+            athletes change, `data` is current while it was built from the \
+            latest version. Rebuilt in the background, see \
+            `CompetitionSnapshotManager`.
+    """
+
+    reference_id = HashidAutoField(
+        primary_key=True,
+        salt=f"competitionsnapshotmodel_reference_id_{HASHID_FIELD_SALT}",
+    )
+    competition = models.OneToOneField(
+        "api.Competition", related_name="snapshot", on_delete=models.CASCADE
+    )
+    version = models.PositiveIntegerField(default=1)
+    built_version = models.PositiveIntegerField(default=0)
+    # `CompetitionDetailSerializer` data, with urls relative to the host
+    data = models.JSONField(null=True)
+    built_at = models.DateTimeField(null=True)
+
+    objects = CompetitionSnapshotManager()
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the competition changed since `data` was built."""
+        return self.built_version != self.version
+
+    def __str__(self) -> str:
+        competition = CompetitionSnapshot.competition.field.value_from_object(
+            self
+        )
+        return f"{competition} v{self.version}"
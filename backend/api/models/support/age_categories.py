@@ -18,12 +18,12 @@ Masters age categories:
 """
 
 from auditlog.models import AuditlogHistoryField
-from auditlog.registry import auditlog
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from hashid_field import HashidAutoField
 
+from api.models.history import auditlog
 from api.models.support.base_era import BaseEra
 from config.settings import HASHID_FIELD_SALT
 
@@ -3,12 +3,12 @@
 This is used to determine when the validation of another model should be \
         enacted (e.g. grading, weight categories).
 """
-from datetime import datetime
+from datetime import date
 
 from django.db import models
-from django.utils.functional import cached_property
 from hashid_field import HashidAutoField
 
+from api.models.managers import EraManager
 from config.settings import HASHID_FIELD_SALT
 
 
@@ -30,43 +30,31 @@ class BaseEra(models.Model):
     date_start = models.DateField(blank=True, unique=True)
     description = models.CharField(max_length=128, null=True, blank=True)
 
-    @cached_property
+    objects = EraManager()
+
+    @property
     def is_current(self) -> bool:
         """Return if the era is current.
 
         Returns:
             (bool): True if the era is current.
         """
-        return (
-            self.__class__.objects.latest("date_start").reference_id
-            == self.reference_id
-        )
+        return self.pk is not None and self.date_end is None
 
-    @cached_property
-    def date_end(self) -> datetime | None:
+    @property
+    def date_end(self) -> date | None:
         """Provide date end for an era.
 
         This is determined by the `date_start` of the more recent era. If the \
-                current era is the most recent, then `None` is returned.
+                current era is the most recent, then `None` is returned. \
+                Looked up in the cached timeline of eras, see `EraManager`.
 
         Returns:
-            (datetime|None): The end date of the era or `None` if current.
+            (date|None): The end date of the era or `None` if current.
         """
-        if self.is_current:
+        if self.date_start is None:
             return None
-        eras = [
-            era.reference_id
-            for era in list(
-                self.__class__.objects.all().order_by("date_start")
-            )
-        ]
-        current_era_idx = eras.index(self.reference_id)  # idx on the era list
-        next_era_idx = eras[current_era_idx + 1]
-        return (
-            self.__class__.objects.filter(reference_id=next_era_idx)
-            .get()
-            .date_start
-        )
+        return self.__class__.objects.timeline().date_end(self.date_start)
 
     class Meta:
         """Settings to model."""
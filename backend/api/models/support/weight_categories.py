@@ -1,12 +1,13 @@
 """Weight Categories"""
 
 from auditlog.models import AuditlogHistoryField
-from auditlog.registry import auditlog
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from hashid_field import HashidAutoField
 
+from api.models.history import auditlog
+from api.models.managers import WeightCategoryManager
 from api.models.support.base_era import BaseEra
 from config.settings import HASHID_FIELD_SALT
 
@@ -46,15 +47,25 @@ class WeightCategory(models.Model):
 
     history = AuditlogHistoryField(pk_indexable=False)
 
+    objects = WeightCategoryManager()
+
     class Meta:
         """Model settings."""
 
         verbose_name_plural = "Weight categories"
 
         constraints = [
+            # plus categories share the weight of the heaviest category
             models.UniqueConstraint(
-                fields=["era", "sex", "weight"],
-                name="era_sex_weight_unique_combination",
+                fields=["era", "sex", "weight", "is_plus"],
+                name="era_sex_weight_plus_unique_combination",
+            ),
+        ]
+        indexes = [
+            # lift ordering: female first, super-heavies last, by weight
+            models.Index(
+                fields=["-sex", "is_plus", "weight"],
+                name="weight_category_order_idx",
             ),
         ]
 
@@ -7,14 +7,19 @@ from .choices import (
     OLD_1998_2018_FEMALE_WEIGHT_CATEGORIES,
     OLD_1998_2018_MALE_WEIGHT_CATEGORIES,
 )
-from .grading import determine_grade
+from .grading import determine_grade, grade_many
 from .helpers import (
     age_category,
     best_lift,
     calculate_sinclair,
+    calculate_sinclair_many,
+    lift_results,
     ranking_suffixer,
+    total_lifted,
     validate_attempts,
 )
+from .sinclair import SINCLAIR_ERAS, sinclair_coefficient, sinclair_era
+from .weight_categories import parse_weight_category
 
 __all__ = [
     "CURRENT_MALE_WEIGHT_CATEGORIES",
@@ -29,5 +34,13 @@ __all__ = [
     "ranking_suffixer",
     "validate_attempts",
     "calculate_sinclair",
+    "calculate_sinclair_many",
+    "SINCLAIR_ERAS",
+    "sinclair_coefficient",
+    "sinclair_era",
     "determine_grade",
+    "grade_many",
+    "lift_results",
+    "total_lifted",
+    "parse_weight_category",
 ]
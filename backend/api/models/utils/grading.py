@@ -1,4 +1,12 @@
-"""Determine grade for a lift."""
+"""Determine grade for a lift.
+
+`STANDARDS` are compiled on import into ascending thresholds per weight \
+        category, so a grade is a bisect.
+"""
+
+from bisect import bisect_right
+from typing import Iterable
+
 STANDARDS = {
     "M49": {
         "international": None,
@@ -215,6 +223,36 @@ STANDARDS = {
 }
 
 
+def compile_standards(
+    standards: dict[str, dict[str, int | None]]
+) -> dict[str, tuple[list[int], list[str]]]:
+    """Compile grading standards into sorted threshold arrays.
+
+    Args:
+        standards (dict): Minimum total of each grade, by weight category, \
+                best grade first.
+
+    Returns:
+        (dict): Ascending thresholds and their grades, by weight category.
+    """
+    compiled = {}
+    for weight_category, grades in standards.items():
+        # the best grade wins when thresholds are equal, so it sorts last
+        thresholds = sorted(
+            (minimum, -idx, grade.title())
+            for idx, (grade, minimum) in enumerate(grades.items())
+            if minimum is not None
+        )
+        compiled[weight_category] = (
+            [minimum for minimum, _, _ in thresholds],
+            [grade for _, _, grade in thresholds],
+        )
+    return compiled
+
+
+COMPILED_STANDARDS = compile_standards(STANDARDS)
+
+
 def determine_grade(total_lifted: int, weight_category: str) -> str:
     """Provide the grade for a particular lift.
 
@@ -225,9 +263,27 @@ def determine_grade(total_lifted: int, weight_category: str) -> str:
     Returns:
         (str): The grade.
     """
-    grades = STANDARDS.get(weight_category)
-    if grades is not None:
-        for k, v in grades.items():
-            if v is not None and total_lifted >= v:
-                return k.title()
-    return None
+    compiled = COMPILED_STANDARDS.get(weight_category)
+    if compiled is None:
+        return None
+    thresholds, grades = compiled
+    idx = bisect_right(thresholds, total_lifted)
+    return grades[idx - 1] if idx > 0 else None
+
+
+def grade_many(
+    totals: Iterable[int], weight_categories: Iterable[str]
+) -> list[str | None]:
+    """Grades of many lifts, see `determine_grade()`.
+
+    Args:
+        totals (Iterable[int]): The total lifted of each lift.
+        weight_categories (Iterable[str]): The weight class of each lift.
+
+    Returns:
+        (list[str | None]): The grade of each lift, in order.
+    """
+    return [
+        determine_grade(total_lifted=total, weight_category=weight_category)
+        for total, weight_category in zip(totals, weight_categories)
+    ]
@@ -1,11 +1,13 @@
 """Contains helper functions for the models."""
-import math
 from datetime import datetime
 from decimal import Decimal
+from typing import Iterable
 
 from django.core.exceptions import ValidationError
 
-from .types import AgeCategories, LiftT
+from .grading import determine_grade
+from .sinclair import sinclair_coefficient
+from .types import AgeCategories, LiftResults, LiftT
 
 
 def ranking_suffixer(rank: int) -> str:
@@ -57,6 +59,27 @@ def best_lift(lifts: dict[str, LiftT]) -> tuple[str, int]:
     return best_lift_attempt, best_lift
 
 
+def total_lifted(snatches: dict[str, LiftT], cnjs: dict[str, LiftT]) -> int:
+    """Give total lifted.
+
+    An athlete must make at least one snatch and one clean and jerk to total.
+
+    Args:
+        snatches (dict[str, LiftT]): Snatch attempts.
+        cnjs (dict[str, LiftT]): Clean and jerk attempts.
+
+    Returns:
+        int: Best snatch and best clean and jerk, or 0 if no total.
+    """
+    snatch_made = any(
+        [lift["lift_status"] == "LIFT" for lift in snatches.values()]
+    )
+    cnj_made = any([lift["lift_status"] == "LIFT" for lift in cnjs.values()])
+    if all([snatch_made, cnj_made]):
+        return best_lift(snatches)[1] + best_lift(cnjs)[1]
+    return 0
+
+
 def validate_attempts(attempts: dict[str, LiftT], lift_type: str):
     """Validate attempts.
 
@@ -168,47 +191,106 @@ def calculate_sinclair(
     bodyweight: Decimal,
     total_lifted: int,
     weight_category: str,
-    yearborn: int,
-    lift_year: int,
+    yearborn: int | None,
+    lift_year: int | None,
 ) -> Decimal:
     """Calculate the sinclair for a lift.
 
+    Constants are those of the Olympic cycle of `lift_year`, see \
+            `api.models.utils.sinclair`.
+
     Args:
         bodyweight (Decimal):  Bodyweight of athlete for particular lift.
         total_lifted (int): Total lifted for lift.
         weight_category (str): Athlete's weight category for particular lift.
-        yearborn (int): Athlete's birth year.
-        lift_year (int): The year the lift took place (competition).
+        yearborn (int | None): Athlete's birth year.
+        lift_year (int | None): The year the lift took place (competition), \
+                `None` for the current Olympic cycle.
 
     Returns:
         Decimal: Sinclair rounded to 3 decimal places.
     """
-    SINCLAIR_CONSTANTS = {
-        "M": {"a": Decimal(0.751945030), "b": Decimal(175.508)},
-        "W": {"a": Decimal(0.783497476), "b": Decimal(153.655)},
-    }
+    coefficient = sinclair_coefficient(
+        sex=weight_category[0], bodyweight=bodyweight, lift_year=lift_year
+    )
+    sinclair_total = total_lifted * coefficient
+    return round(sinclair_total, 3)
 
-    AGE_CORRECTION = Decimal(1)
 
-    # TODO:
-    # sinclair change at every olympic cycle
-    # also age adjusted?
-    if yearborn:
-        pass
+def calculate_sinclair_many(
+    bodyweights: Iterable[Decimal],
+    totals: Iterable[int],
+    sexes: Iterable[str],
+    lift_years: Iterable[int | None] | None = None,
+) -> list[Decimal]:
+    """Calculate the sinclair for many lifts at once.
+
+    Same as `calculate_sinclair()` for each lift, the coefficients are \
+            cached per sex, bodyweight and era, see `sinclair_coefficient()`.
+
+    Args:
+        bodyweights (Iterable[Decimal]): Bodyweight of athlete for each lift.
+        totals (Iterable[int]): Total lifted for each lift.
+        sexes (Iterable[str]): "M" or "W" for each lift, the first letter \
+                of the weight category.
+        lift_years (Iterable[int | None] | None): The year of each lift, \
+                `None` for the current Olympic cycle.
+
+    Returns:
+        list[Decimal]: Sinclair of each lift rounded to 3 decimal places.
+    """
+    bodyweights, totals = list(bodyweights), list(totals)
+    if lift_years is None:
+        lift_years = [None] * len(bodyweights)
+    return [
+        calculate_sinclair(
+            bodyweight=bodyweight,
+            total_lifted=total,
+            weight_category=sex,
+            yearborn=None,
+            lift_year=lift_year,
+        )
+        for bodyweight, total, sex, lift_year in zip(
+            bodyweights, totals, sexes, lift_years
+        )
+    ]
 
-    if lift_year:
-        pass
 
-    sex = weight_category[0]
-    a = SINCLAIR_CONSTANTS[sex]["a"]
-    b = SINCLAIR_CONSTANTS[sex]["b"]
+def lift_results(
+    snatches: dict[str, LiftT],
+    cnjs: dict[str, LiftT],
+    bodyweight: Decimal,
+    weight_category: str,
+    yearborn: int,
+    lift_year: int,
+) -> LiftResults:
+    """Calculate the results stored on a lift.
 
-    if bodyweight <= b:
-        x = Decimal(math.log10(Decimal(bodyweight) / b))
-        ax2 = x**2 * a
-        sinclair_coefficient = Decimal(10) ** ax2
-    else:
-        sinclair_coefficient = Decimal(1)
+    Args:
+        snatches (dict[str, LiftT]): Snatch attempts.
+        cnjs (dict[str, LiftT]): Clean and jerk attempts.
+        bodyweight (Decimal):  Bodyweight of athlete for particular lift.
+        weight_category (str): Athlete's weight category for particular lift.
+        yearborn (int): Athlete's birth year.
+        lift_year (int): The year the lift took place (competition).
 
-    sinclair_total = total_lifted * sinclair_coefficient * AGE_CORRECTION
-    return round(sinclair_total, 3)
+    Returns:
+        LiftResults: Best lifts, total, sinclair and grade.
+    """
+    total = total_lifted(snatches=snatches, cnjs=cnjs)
+    return {
+        "best_snatch": best_lift(snatches)[1],
+        "best_cnj": best_lift(cnjs)[1],
+        "total_lifted": total,
+        "sinclair": calculate_sinclair(
+            bodyweight=bodyweight,
+            total_lifted=total,
+            weight_category=weight_category,
+            yearborn=yearborn,
+            lift_year=lift_year,
+        ),
+        "grade": determine_grade(
+            total_lifted=total,
+            weight_category=weight_category,
+        ),
+    }
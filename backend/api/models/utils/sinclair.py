@@ -0,0 +1,109 @@
+"""Sinclair coefficients for each Olympic cycle.
+
+The IWF updates the Sinclair constants after every Olympic Games. Like \
+        `BaseEra`, an era applies from its `date_start` until the \
+        `date_start` of the next one, the latest era is current.
+
+Coefficient: `10 ** (a * log10(bodyweight / b) ** 2)` for bodyweights up to \
+        `b`, otherwise `1`.
+"""
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class SinclairConstants(NamedTuple):
+    a: Decimal
+    b: Decimal
+
+
+@dataclass(frozen=True)
+class SinclairEra:
+    """Sinclair constants by sex, from `date_start` until the next era."""
+
+    date_start: date
+    constants: dict[str, SinclairConstants]
+
+
+SINCLAIR_ERAS = (
+    SinclairEra(
+        date_start=date(2009, 1, 1),
+        constants={
+            "M": SinclairConstants(Decimal(0.784780654), Decimal(173.961)),
+            "W": SinclairConstants(Decimal(1.056683941), Decimal(125.441)),
+        },
+    ),
+    SinclairEra(
+        date_start=date(2013, 1, 1),
+        constants={
+            "M": SinclairConstants(Decimal(0.794358141), Decimal(174.393)),
+            "W": SinclairConstants(Decimal(0.897260740), Decimal(148.026)),
+        },
+    ),
+    SinclairEra(
+        date_start=date(2017, 1, 1),
+        constants={
+            "M": SinclairConstants(Decimal(0.751945030), Decimal(175.508)),
+            "W": SinclairConstants(Decimal(0.783497476), Decimal(153.655)),
+        },
+    ),
+    SinclairEra(
+        date_start=date(2021, 1, 1),
+        constants={
+            "M": SinclairConstants(Decimal(0.722762521), Decimal(193.609)),
+            "W": SinclairConstants(Decimal(0.787004341), Decimal(153.757)),
+        },
+    ),
+)
+
+_ERA_YEARS = [era.date_start.year for era in SINCLAIR_ERAS]
+
+
+def sinclair_era_index(lift_year: int | None) -> int:
+    """Index in `SINCLAIR_ERAS` of the era of a lift, see `sinclair_era()`."""
+    if lift_year is None:
+        return len(SINCLAIR_ERAS) - 1
+    return max(bisect_right(_ERA_YEARS, lift_year) - 1, 0)
+
+
+def sinclair_era(lift_year: int | None) -> SinclairEra:
+    """Sinclair era of a lift.
+
+    Args:
+        lift_year (int | None): The year the lift took place (competition), \
+                `None` for the current era.
+
+    Returns:
+        SinclairEra: Lifts before the first era use the first era.
+    """
+    return SINCLAIR_ERAS[sinclair_era_index(lift_year)]
+
+
+@lru_cache(maxsize=4096)
+def _coefficient(sex: str, bodyweight: Decimal, era_idx: int) -> Decimal:
+    a, b = SINCLAIR_ERAS[era_idx].constants[sex]
+    if bodyweight <= b:
+        x = Decimal(math.log10(Decimal(bodyweight) / b))
+        return Decimal(10) ** (x**2 * a)
+    return Decimal(1)
+
+
+def sinclair_coefficient(
+    sex: str, bodyweight: Decimal, lift_year: int | None
+) -> Decimal:
+    """Sinclair coefficient, cached per sex, bodyweight and era.
+
+    Args:
+        sex (str): "M" or "W".
+        bodyweight (Decimal): Bodyweight of athlete for particular lift.
+        lift_year (int | None): The year the lift took place (competition).
+
+    Returns:
+        Decimal: The coefficient the total is multiplied by.
+    """
+    return _coefficient(sex, bodyweight, sinclair_era_index(lift_year))
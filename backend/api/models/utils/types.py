@@ -1,4 +1,5 @@
 """Custom types."""
+from decimal import Decimal
 from typing import TypedDict
 
 # custom types
@@ -9,6 +10,14 @@ class LiftT(TypedDict):
     weight: int
 
 
+class LiftResults(TypedDict):
+    best_snatch: int
+    best_cnj: int
+    total_lifted: int
+    sinclair: Decimal
+    grade: str | None
+
+
 class LiftPlacing(TypedDict):
     total_lifted: int
     best_cnj_weight: tuple[str, int]
@@ -0,0 +1,17 @@
+"""Weight category helpers."""
+
+
+def parse_weight_category(name: str) -> tuple[str, int, bool]:
+    """Split a weight category name into its parts.
+
+    Args:
+        name (str): Weight category (e.g. "M109+").
+
+    Returns:
+        tuple[str, int, bool]: sex, weight and whether it is a plus category.
+
+    Example:
+        >>> parse_weight_category("M109+")
+        ('M', 109, True)
+    """
+    return name[0], int(name[1:].replace("+", "")), name.endswith("+")
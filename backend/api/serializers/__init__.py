@@ -1,6 +1,7 @@
 from .athletes import AthleteDetailSerializer, AthleteSerializer
 from .competitions import CompetitionDetailSerializer, CompetitionSerializer
-from .lifts import LiftSerializer
+from .lifts import LiftBulkSerializer, LiftSerializer
+from .rankings import RankingSerializer
 from .search import SearchSerializer
 
 __all__ = [
@@ -9,5 +10,7 @@ __all__ = [
     "CompetitionSerializer",
     "CompetitionDetailSerializer",
     "LiftSerializer",
+    "LiftBulkSerializer",
     "SearchSerializer",
+    "RankingSerializer",
 ]
@@ -1,14 +1,9 @@
 """Athete Serializers."""
 
-from collections import defaultdict
-from datetime import datetime
-
-from django.db.models import F
-from django.db.models.functions import ExtractYear
 from hashid_field.rest import HashidSerializerCharField
 from rest_framework import serializers
 
-from api.models import Athlete, Lift
+from api.models import Athlete
 from api.models.utils.types import AgeCategories
 
 from .lifts import LiftSerializer
@@ -32,45 +27,43 @@ class AthleteSerializer(serializers.ModelSerializer):
     athlete_last_edited = serializers.SerializerMethodField(read_only=True)
     lift_last_edited = serializers.SerializerMethodField(read_only=True)
 
+    def to_representation(self, instance):
+        """Use the summary annotations from `Athlete.objects.with_summary()`.
+
+        Raises:
+            ValueError: `instance` is not annotated, fetching it here \
+                    would query once per athlete.
+        """
+        if not hasattr(instance, "lifts_count"):
+            raise ValueError(
+                "Fetch athletes with `Athlete.objects.with_summary()`."
+            )
+        return super().to_representation(instance)
+
     def get_lifts_count(self, athlete):
         """Provide count of lifts by athlete."""
-        return Lift.objects.filter(athlete=athlete).count()
+        return athlete.lifts_count
 
     def get_current_grade(self, athlete):
         """Provide grade of the lift by the athlete."""
-        query = (
-            Lift.objects.annotate(
-                competition_year=ExtractYear(F("competition__date_start"))
-            )
-            .filter(athlete=athlete)
-            .filter(competition_year=datetime.now().year)
-        )
-        if len(query) == 0:
-            return None
-        SORT = ("Elite", "International", "A", "B", "C", "D", "E", None)
-        grades = [(lift.grade, SORT.index(lift.grade)) for lift in query]
-        best_grade = sorted(grades, key=lambda x: x[1])
-        return best_grade[0][0]
+        return athlete.current_grade
 
     def get_recent_lift(self, athlete):
         """Provide most recent lift for athlete."""
-        query = Lift.objects.filter(athlete=athlete).order_by(
-            "-competition__date_start"
-        )[:1]
         return LiftSerializer(
-            query, many=True, read_only=True, context=self.context
+            athlete.recent_lifts,
+            many=True,
+            read_only=True,
+            context=self.context,
         ).data
 
     def get_athlete_last_edited(self, athlete):
         """Provide when athlete was last edited."""
-        if athlete.history_record.all():
-            return athlete.history_record.latest().history_date
+        return athlete.athlete_last_edited
 
     def get_lift_last_edited(self, athlete):
         """Provide when lifts for an athlete was last edited."""
-        lifts = Lift.history_record.filter(athlete=athlete)
-        if lifts:
-            return lifts.latest().history_date
+        return athlete.lift_last_edited
 
     class Meta:
         """Athelte serializer settings."""
@@ -103,23 +96,35 @@ class AthleteDetailSerializer(AthleteSerializer):
     best_lifts = serializers.SerializerMethodField(read_only=True)
     best_sinclair = serializers.SerializerMethodField(read_only=True)
 
-    def get_lift_set(self, athlete):
-        """Obtain all lifts by this athlete."""
-        query = Lift.objects.filter(athlete=athlete).order_by(
-            "-competition__date_start"
-        )
-        return LiftSerializer(
-            query, many=True, read_only=True, context=self.context
-        ).data
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lift_summaries: dict = {}
 
-    def get_age_categories_competed(self, athlete) -> AgeCategories:
-        """Provide all age categories.
+    def to_representation(self, instance):
+        """Use the lifts prefetched by `Athlete.objects.with_lifts()`."""
+        if not hasattr(instance, "lifts"):
+            raise ValueError(
+                "Fetch athletes with `Athlete.objects.with_lifts()`."
+            )
+        return super().to_representation(instance)
 
-        This will be age categories athlete has been in for their entire \
-                career. Will create dictionary with age_categories being True \
-                is participated.
-                """
-        all_age_categories: AgeCategories = {
+    def _lift_summary(self, athlete) -> dict:
+        """Summarise all lifts by this athlete in a single pass.
+
+        Each lift is serialized once, the best lifts for every age category, \
+                weight category and discipline are read from the bests \
+                prefetched by `Athlete.objects.with_lifts()`.
+        """
+        if athlete.pk in self._lift_summaries:
+            return self._lift_summaries[athlete.pk]
+
+        lift_set = LiftSerializer(
+            athlete.lifts, many=True, read_only=True, context=self.context
+        ).data
+        lift_data = {
+            int(lift.pk): data for lift, data in zip(athlete.lifts, lift_set)
+        }
+        age_categories_competed: AgeCategories = {
             "is_youth": False,
             "is_junior": False,
             "is_senior": False,
@@ -133,89 +138,56 @@ class AthleteDetailSerializer(AthleteSerializer):
             "is_master_65_69": False,
             "is_master_70": False,
         }
-        for lift in Lift.objects.filter(athlete=athlete):
-            age_categories = lift.age_categories
-            for k, v in age_categories.items():
-                if v:
-                    all_age_categories[k] = v  # type: ignore
-        return all_age_categories
+        best_lifts: dict = {"snatch": {}, "cnj": {}, "total": {}}
+        best_sinclair: dict = {}
+
+        for best in athlete.best_lifts:
+            age_category = f"is_{best.age_category}"
+            age_categories_competed[age_category] = True  # type: ignore
+            if best.discipline == "sinclair":
+                best_sinclair[age_category] = lift_data[int(best.lift_id)]
+            else:
+                best_lifts[best.discipline].setdefault(age_category, {})[
+                    best.weight_category
+                ] = lift_data[int(best.lift_id)]
+
+        summary = {
+            "lift_set": lift_set,
+            "age_categories_competed": age_categories_competed,
+            "weight_categories_competed": sorted(
+                {lift.weight_category for lift in athlete.lifts}
+            ),
+            "best_lifts": best_lifts,
+            "best_sinclair": best_sinclair,
+        }
+        self._lift_summaries[athlete.pk] = summary
+        return summary
+
+    def get_lift_set(self, athlete):
+        """Obtain all lifts by this athlete."""
+        return self._lift_summary(athlete)["lift_set"]
+
+    def get_age_categories_competed(self, athlete) -> AgeCategories:
+        """Provide all age categories.
+
+        This will be age categories athlete has been in for their entire \
+                career. Will create dictionary with age_categories being True \
+                is participated.
+                """
+        return self._lift_summary(athlete)["age_categories_competed"]
 
     def get_weight_categories_competed(self, athlete):
         """Provide weight categories for an athlete."""
-        unique_weight_categories = []
-        lifts = Lift.objects.filter(athlete=athlete)
-        for lift in lifts:
-            if lift.weight_category not in unique_weight_categories:
-                unique_weight_categories.append(lift.weight_category)
-        return unique_weight_categories
-
-    def _best_lift(self, lifts, sort_key):
-        best_lift = LiftSerializer(
-            sorted(
-                lifts,
-                key=sort_key,
-            )[-1],
-            read_only=True,
-            context=self.context,
-        ).data
-        return best_lift
+        return self._lift_summary(athlete)["weight_categories_competed"]
 
     def get_best_lifts(self, athlete) -> dict:
-        """Provide the best snatch for the an athlete for a given weight \
-                categories."""
-        age_categories = self.get_age_categories_competed(athlete=athlete)
-        weight_categories = self.get_weight_categories_competed(
-            athlete=athlete
-        )
-        lifts = Lift.objects.filter(athlete=athlete)
-
-        order_bys = [
-            ("snatch", lambda lift: lift.best_snatch_weight[1]),
-            ("cnj", lambda lift: lift.best_cnj_weight[1]),
-            ("total", lambda lift: lift.total_lifted),
-        ]
-
-        lift_by_age_weight_category: dict = defaultdict(dict)
-        for order_by, sort_key in order_bys:
-            lift_by_age_weight_category[order_by] = defaultdict(dict)
-            for age_category, is_true in age_categories.items():
-                if is_true:
-                    for weight_category in weight_categories:
-                        clean_lifts = [
-                            lift
-                            for lift in lifts
-                            if lift.weight_category == weight_category
-                            and lift.age_categories[age_category]  # type: ignore
-                        ]
-                        if len(clean_lifts) == 0:
-                            break
-                        lift_by_age_weight_category[order_by][
-                            age_category
-                        ].update(
-                            {
-                                weight_category: self._best_lift(
-                                    clean_lifts, sort_key
-                                )
-                            }
-                        )
-        return lift_by_age_weight_category
+        """Provide the best snatch, clean and jerk and total for an athlete \
+                for each age and weight category."""
+        return self._lift_summary(athlete)["best_lifts"]
 
     def get_best_sinclair(self, athlete):
-        """Provide the best total for the an athlete for weight categories."""
-        age_categories = self.get_age_categories_competed(athlete=athlete)
-        sinclair_by_age_categories: dict = defaultdict(dict)
-        lifts = Lift.objects.filter(athlete=athlete)
-        for age_category, is_true in age_categories.items():
-            if is_true:
-                clean_lifts = [
-                    lift for lift in lifts if lift.age_categories[age_category]  # type: ignore
-                ]
-                if len(clean_lifts) == 0:
-                    break
-                sinclair_by_age_categories[age_category] = self._best_lift(
-                    clean_lifts, lambda lift: lift.sinclair
-                )
-        return sinclair_by_age_categories
+        """Provide the best sinclair for an athlete for each age category."""
+        return self._lift_summary(athlete)["best_sinclair"]
 
     class Meta(AthleteSerializer.Meta):
         """Serializer settings."""
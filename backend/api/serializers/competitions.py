@@ -34,9 +34,11 @@ class CompetitionSerializer(serializers.ModelSerializer):
 
         def _randomize(sex):
             lifts = list(
-                Lift.objects.filter(competition=competition).filter(
-                    weight_category__startswith=sex
+                Lift.objects.filter(
+                    competition=competition, weight_category__startswith=sex
                 )
+                .for_serializer()
+                .with_placing_subquery()
             )
             if len(lifts) == 0:
                 return []
@@ -87,7 +89,12 @@ class CompetitionDetailSerializer(CompetitionSerializer):
 
     def get_lift_set(self, competition):
         """Require to ensure lifts are in custom order due to weight classes."""
-        query = Lift.objects.ordered_filter(**{"competition": competition})
+        query = (
+            Lift.objects.filter(competition=competition)
+            .for_serializer()
+            .with_placing()
+            .ordered_filter()
+        )
         return LiftSerializer(
             query, many=True, read_only=True, context=self.context
         ).data
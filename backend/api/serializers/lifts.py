@@ -1,11 +1,42 @@
 """Lift Serializers."""
 
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from hashid_field.rest import HashidSerializerCharField
 from rest_framework import permissions, serializers
 from rest_framework.validators import UniqueTogetherValidator
 from rest_framework_nested.relations import NestedHyperlinkedIdentityField
 
-from api.models import Athlete, Competition, Lift
+from api.models import Athlete, Competition, Lift, WeightCategory
+from api.models.managers.lifts import SERIALIZER_FIELDS
+from api.models.utils import validate_attempts
+
+
+def check_loaded(lift: Lift) -> None:
+    """Raise if serializing `lift` would lazily load a field or relation."""
+    for field in SERIALIZER_FIELDS:
+        instance = lift
+        *relations, name = field.split("__")
+        for relation in relations:
+            related = instance._meta.get_field(relation)
+            cached = isinstance(related, models.ForeignKey) and (
+                related.is_cached(instance)
+            )
+            if not cached:
+                break
+            instance = getattr(instance, relation)
+        else:
+            concrete = instance._meta.get_field(name)
+            if (
+                isinstance(concrete, models.Field)
+                and concrete.attname not in instance.get_deferred_fields()
+            ):
+                continue
+        raise ImproperlyConfigured(
+            f"Serializing lift {lift.pk} lazily loads `{field}`, "
+            "use `Lift.objects.for_serializer()`."
+        )
 
 
 class LiftSerializer(serializers.ModelSerializer):
@@ -55,6 +86,18 @@ class LiftSerializer(serializers.ModelSerializer):
         source="competition.date_start",
         read_only=True,
     )
+    sinclair = serializers.DecimalField(
+        max_digits=7,
+        decimal_places=3,
+        coerce_to_string=False,
+        read_only=True,
+    )
+
+    def to_representation(self, instance):
+        """In debug mode raise instead of lazily loading."""
+        if settings.DEBUG:
+            check_loaded(instance)
+        return super().to_representation(instance)
 
     class Meta:
         model = Lift
@@ -106,3 +149,139 @@ class LiftSerializer(serializers.ModelSerializer):
                 message="Athlete can only have one lift in a competition",
             ),
         ]
+
+
+class LiftBulkListSerializer(serializers.ListSerializer):
+    """Lifts of a bulk upload to `context["competition"]`.
+
+    Athletes, weight categories and uniqueness are checked for all lifts at \
+            once, uniqueness by comparing sets of the lifts already in the \
+            competition and the uploaded ones.
+    """
+
+    def to_internal_value(self, data):
+        lifts = super().to_internal_value(data)
+        competition = self.context["competition"]
+        athletes = {
+            int(athlete.pk): athlete
+            for athlete in Athlete.objects.filter(
+                pk__in={lift["athlete"] for lift in lifts}
+            )
+        }
+        weight_classes = WeightCategory.objects.resolve_many(
+            {lift["weight_category"] for lift in lifts} - {""},
+            competition.date_start,
+        )
+        athletes_taken = set()
+        lotteries_taken = set()
+        for athlete, weight_category, lottery_number in Lift.objects.filter(
+            competition=competition
+        ).values_list("athlete", "weight_category", "lottery_number"):
+            athletes_taken.add(int(athlete))
+            lotteries_taken.add((weight_category, lottery_number))
+
+        errors = []
+        for lift in lifts:
+            lift_errors = {}
+            non_field_errors = []
+            athlete = athletes.get(int(lift["athlete"]))
+            if athlete is None:
+                lift_errors["athlete"] = [
+                    f"Invalid pk \"{lift['athlete']}\" - object does not exist."
+                ]
+            elif int(athlete.pk) in athletes_taken:
+                non_field_errors.append(
+                    "Athlete can only have one lift in a competition"
+                )
+            else:
+                athletes_taken.add(int(athlete.pk))
+                lift["athlete"] = athlete
+            lottery = (lift["weight_category"], lift["lottery_number"])
+            if lottery in lotteries_taken:
+                non_field_errors.append(
+                    "Only one lottery number per weight category"
+                )
+            lotteries_taken.add(lottery)
+            if lift["weight_category"]:
+                if lift["weight_category"] in weight_classes:
+                    lift["weight_class"] = weight_classes[
+                        lift["weight_category"]
+                    ]
+                else:
+                    non_field_errors.append("Weightclass from wrong era.")
+            if non_field_errors:
+                lift_errors["non_field_errors"] = non_field_errors
+            errors.append(lift_errors)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return lifts
+
+    def create(self, validated_data):
+        request = self.context["request"]
+        user = request.user if request.user.is_authenticated else None
+        return Lift.objects.create_many(
+            [
+                Lift(competition=self.context["competition"], **lift)
+                for lift in validated_data
+            ],
+            user=user,
+            remote_addr=request.META.get("REMOTE_ADDR"),
+        )
+
+
+class LiftBulkSerializer(serializers.ModelSerializer):
+    """Lift of a bulk upload, see `LiftBulkListSerializer`.
+
+    Validated without queries, the competition is given by the url.
+    """
+
+    athlete = HashidSerializerCharField(
+        source_field="api.Athlete.reference_id",
+    )
+
+    def validate(self, attrs):
+        """Attempts must progress, as in `Lift.clean()`."""
+        lift = Lift(
+            **{
+                field: value
+                for field, value in attrs.items()
+                if field != "athlete"
+            }
+        )
+        errors = validate_attempts(attempts=lift.snatches, lift_type="snatch")
+        errors.extend(
+            validate_attempts(attempts=lift.cnjs, lift_type="clean and jerk")
+        )
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    class Meta:
+        model = Lift
+        list_serializer_class = LiftBulkListSerializer
+        fields = (
+            "lottery_number",
+            "athlete",
+            "snatch_first",
+            "snatch_first_weight",
+            "snatch_second",
+            "snatch_second_weight",
+            "snatch_third",
+            "snatch_third_weight",
+            "cnj_first",
+            "cnj_first_weight",
+            "cnj_second",
+            "cnj_second_weight",
+            "cnj_third",
+            "cnj_third_weight",
+            "bodyweight",
+            "weight_category",
+            "team",
+            "session_number",
+        )
+        # uniqueness is checked for all lifts by `LiftBulkListSerializer`
+        validators: list = []
+        extra_kwargs = {
+            "lottery_number": {"required": True},
+            "weight_category": {"required": True},
+        }
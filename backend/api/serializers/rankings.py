@@ -0,0 +1,61 @@
+"""Ranking serializers."""
+
+from hashid_field.rest import HashidSerializerCharField
+from rest_framework import serializers
+
+from api.models import Ranking
+
+
+class RankingSerializer(serializers.ModelSerializer):
+
+    lift = serializers.PrimaryKeyRelatedField(  # type: ignore
+        pk_field=HashidSerializerCharField(
+            source_field="api.Lift.reference_id"
+        ),
+        read_only=True,
+    )
+    athlete = serializers.PrimaryKeyRelatedField(  # type: ignore
+        pk_field=HashidSerializerCharField(
+            source_field="api.Athlete.reference_id"
+        ),
+        read_only=True,
+    )
+    athlete_name = serializers.CharField(
+        source="athlete.full_name", read_only=True
+    )
+    competition = serializers.PrimaryKeyRelatedField(  # type: ignore
+        pk_field=HashidSerializerCharField(
+            source_field="api.Competition.reference_id"
+        ),
+        read_only=True,
+    )
+    competition_name = serializers.CharField(
+        source="competition.name", read_only=True
+    )
+    competition_date_start = serializers.CharField(
+        source="competition.date_start", read_only=True
+    )
+    value = serializers.DecimalField(
+        max_digits=7,
+        decimal_places=3,
+        coerce_to_string=False,
+        read_only=True,
+    )
+
+    class Meta:
+        model = Ranking
+        fields = (
+            "lift",
+            "athlete",
+            "athlete_name",
+            "competition",
+            "competition_name",
+            "competition_date_start",
+            "discipline",
+            "value",
+            "sex",
+            "weight_category",
+            "year",
+            "age_categories",
+        )
+        read_only_fields = fields
@@ -23,24 +23,16 @@ class SearchSerializer(serializers.Serializer):
 
     def get_query_result_type(self, instance):
         """Give the type of result (e.g. "Athlete", "Lift", "Competition")."""
-        response = instance.__class__.__name__
+        response = instance.instance.__class__.__name__
         return response
 
     def _get_headline_attributes(self, instance):
-        headlines = [
-            getattr(instance, headline)
-            for headline in dir(instance)
-            if "headline" in headline
-        ]
-        return headlines
+        return [instance.headline]
 
     def get_query_result_headline_no_html(self, instance):
         """Return a the search headline without html.
 
-        Joins a list of attributes of the instance object containing the word \
-                'headline'
-
-        BE CAREFUL not to use 'headline' as an attribute name.
+        Headline of the search document text with tags removed.
         """
         TAG_RE = re.compile(r"<[^>]+>")
 
@@ -58,6 +50,7 @@ class SearchSerializer(serializers.Serializer):
 
     def get_query_result(self, instance):
         """Utilises serializers for combined search queryset."""
+        instance = instance.instance
         if isinstance(instance, Athlete):
             return AthleteSerializer(
                 instance, read_only=True, context=self.context
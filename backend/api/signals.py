@@ -0,0 +1,148 @@
+"""Signal receivers."""
+
+from django.db import connections
+from django.db.models.signals import post_delete, post_save, pre_migrate
+from django.dispatch import receiver
+
+from api.models import (
+    AgeCategoryEra,
+    Athlete,
+    AthleteBest,
+    Competition,
+    CompetitionSnapshot,
+    Lift,
+    WeightCategoryEra,
+)
+from api.models.caches import (
+    invalidate_counts,
+    invalidate_lift_responses,
+    invalidate_responses,
+)
+
+
+@receiver(pre_migrate)
+def install_pg_trgm(sender, using, **kwargs):
+    """Install `pg_trgm` before the tables are created.
+
+    Migration 0007 installs it, but databases created without migrations, \
+            e.g. the test database, need it for the `gin_trgm_ops` indexes.
+    """
+    if sender.name != "api":
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+
+@receiver(post_save, sender=Athlete)
+@receiver(post_delete, sender=Athlete)
+def expire_athlete_caches(sender, instance, **kwargs):
+    """Counts, the athlete and the competitions they lifted in are stale."""
+    invalidate_counts()
+    invalidate_responses("athlete", [instance.pk])
+    invalidate_responses(
+        "competition",
+        Lift.objects.filter(athlete=instance).values_list(
+            "competition", flat=True
+        ),
+        lists=False,
+    )
+
+
+@receiver(post_save, sender=Competition)
+@receiver(post_delete, sender=Competition)
+def expire_competition_caches(sender, instance, **kwargs):
+    """Counts, the competition and the athletes who lifted in it are stale."""
+    invalidate_counts()
+    invalidate_responses("competition", [instance.pk])
+    invalidate_responses(
+        "athlete",
+        Lift.objects.filter(competition=instance).values_list(
+            "athlete", flat=True
+        ),
+        lists=False,
+    )
+
+
+def _current_and_loaded(lift, attname: str) -> list:
+    """Current value of `attname` and the one `lift` was loaded with.
+
+    See `Lift.from_db()`, a lift moved to another competition or athlete \
+            changes both.
+    """
+    values = {
+        getattr(lift, attname),
+        getattr(lift, f"_loaded_{attname}", None),
+    }
+    return [value for value in values if value is not None]
+
+
+@receiver(post_save, sender=Lift)
+@receiver(post_delete, sender=Lift)
+def expire_lift_caches(sender, instance, **kwargs):
+    """Counts and the competitions of the lift, with their athletes."""
+    invalidate_counts()
+    invalidate_lift_responses(
+        _current_and_loaded(instance, "competition_id"),
+        athletes=_current_and_loaded(instance, "athlete_id"),
+    )
+
+
+@receiver(post_save, sender=AgeCategoryEra)
+@receiver(post_save, sender=WeightCategoryEra)
+@receiver(post_delete, sender=AgeCategoryEra)
+@receiver(post_delete, sender=WeightCategoryEra)
+def expire_era_timeline(sender, **kwargs):
+    """Era timelines are stale once an era changes."""
+    sender.objects.invalidate_timeline()
+
+
+@receiver(post_save, sender=AgeCategoryEra)
+@receiver(post_save, sender=WeightCategoryEra)
+@receiver(post_delete, sender=AgeCategoryEra)
+@receiver(post_delete, sender=WeightCategoryEra)
+def expire_all_snapshots(sender, **kwargs):
+    """Placings and age categories of every competition may have changed.
+
+    Snapshots are rebuilt when retrieved.
+    """
+    if not kwargs.get("raw"):
+        CompetitionSnapshot.objects.expire_all()
+
+
+@receiver(post_delete, sender=Lift)
+def refresh_athlete_bests(sender, instance, **kwargs):
+    """Bests the deleted lift held are taken over by other lifts."""
+    AthleteBest.objects.refresh_lift(instance)
+
+
+@receiver(post_save, sender=Lift)
+def expire_lift_snapshots(sender, instance, **kwargs):
+    """Snapshots of the competitions of a changed lift are stale."""
+    CompetitionSnapshot.objects.expire(
+        _current_and_loaded(instance, "competition_id")
+    )
+
+
+@receiver(post_delete, sender=Lift)
+def expire_deleted_lift_snapshot(sender, instance, **kwargs):
+    """The snapshot of the competition of a deleted lift is stale.
+
+    None is created, the competition may be deleted along with its lifts.
+    """
+    CompetitionSnapshot.objects.expire([instance.competition_id], create=False)
+
+
+@receiver(post_save, sender=Athlete)
+def expire_athlete_snapshots(sender, instance, **kwargs):
+    """Snapshots show the name and age categories of the athletes."""
+    CompetitionSnapshot.objects.expire(
+        Lift.objects.filter(athlete=instance).values_list(
+            "competition", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Competition)
+def expire_competition_snapshot(sender, instance, **kwargs):
+    """The snapshot of a changed competition is stale."""
+    CompetitionSnapshot.objects.expire([instance.pk])
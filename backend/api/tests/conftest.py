@@ -80,29 +80,34 @@ def mock_competition() -> list[Competition]:
 
 
 @pytest.fixture
-def mock_lift(mock_competition, mock_athlete) -> list[Lift]:
+def mock_lift(
+    mock_competition, mock_athlete, django_capture_on_commit_callbacks
+) -> list[Lift]:
     """Mock lift data.
 
+    Saved as committed, their rankings and athlete bests are refreshed.
+
     Returns:
         list[Lift]: list of mock lifts
     """
-    return [
-        LiftFactory(
-            competition=mock_competition[0],
-            athlete=mock_athlete[0],
-            session_number=0,
-            lottery_number=1,
-        ),
-        LiftFactory(
-            competition=mock_competition[0],
-            athlete=mock_athlete[1],
-            session_number=0,
-            lottery_number=2,
-        ),
-        LiftFactory(
-            competition=mock_competition[1],
-            athlete=mock_athlete[0],
-            session_number=0,
-            lottery_number=1,
-        ),
-    ]
+    with django_capture_on_commit_callbacks(execute=True):
+        return [
+            LiftFactory(
+                competition=mock_competition[0],
+                athlete=mock_athlete[0],
+                session_number=0,
+                lottery_number=1,
+            ),
+            LiftFactory(
+                competition=mock_competition[0],
+                athlete=mock_athlete[1],
+                session_number=0,
+                lottery_number=2,
+            ),
+            LiftFactory(
+                competition=mock_competition[1],
+                athlete=mock_athlete[0],
+                session_number=0,
+                lottery_number=1,
+            ),
+        ]
@@ -0,0 +1,141 @@
+"""Testing the response cache."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from api.models import Lift
+from api.models.caches import invalidate_all_responses
+
+pytestmark = pytest.mark.django_db
+
+
+class TestResponseCache:
+    """Testing cached `list` and `retrieve` responses."""
+
+    url = "/v1/athletes"
+
+    def test_cached_response(self, client, athlete):
+        """Repeated requests are served without queries."""
+        response = client.get(f"{self.url}/{athlete.reference_id}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header("ETag")
+        assert response.has_header("Last-Modified")
+
+        with CaptureQueriesContext(connection) as context:
+            cached_response = client.get(f"{self.url}/{athlete.reference_id}")
+        assert len(context.captured_queries) == 0
+        assert cached_response.json() == response.json()
+        assert cached_response["ETag"] == response["ETag"]
+
+    def test_query_params(self, client, athlete_factory):
+        """Pages are cached separately."""
+        athlete_factory.create_batch(3)
+        first = client.get(f"{self.url}?page_size=2").json()
+        second = client.get(f"{self.url}?page_size=2&page=2").json()
+        assert len(first["results"]) == 2
+        assert len(second["results"]) == 1
+
+    def test_invalidation(self, client, admin_client, athlete):
+        """Changes to the data expire cached responses."""
+        url = f"{self.url}/{athlete.reference_id}"
+        etag = client.get(url)["ETag"]
+        response = admin_client.patch(
+            url,
+            data={"last_name": "Edited"},
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = client.get(url)
+        assert response.json()["last_name"] == "Edited"
+        assert response["ETag"] != etag
+
+    def test_not_modified(self, client, athlete):
+        """Conditional requests for unchanged data are answered with 304."""
+        url = f"{self.url}/{athlete.reference_id}"
+        response = client.get(url)
+        etag, modified = response["ETag"], response["Last-Modified"]
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_of_history(self, client, athlete):
+        """Expired responses keep their `ETag` while the history is unchanged."""
+        url = f"{self.url}/{athlete.reference_id}"
+        etag = client.get(url)["ETag"]
+        invalidate_all_responses()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_not_modified_uncached(self, client, athlete, settings):
+        """Without a cached response only the history is queried for 304."""
+        settings.RESPONSE_CACHE_TIMEOUT = 0
+        url = f"{self.url}/{athlete.reference_id}"
+        etag = client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert all(
+            "api_historical" in query["sql"]
+            for query in context.captured_queries
+        )
+
+    def test_targeted_invalidation(self, client, athlete_factory):
+        """Changes expire the lists and the details showing them only."""
+        athlete, other = athlete_factory.create_batch(2)
+        url = f"{self.url}/{athlete.reference_id}"
+        client.get(url)
+        client.get(self.url)
+
+        other.last_name = "Edited"
+        other.save()
+        with CaptureQueriesContext(connection) as context:
+            client.get(url)
+        assert len(context.captured_queries) == 0
+        assert "Edited" in {
+            result["last_name"]
+            for result in client.get(self.url).json()["results"]
+        }
+
+    def test_lift_invalidation(self, client, mock_lift):
+        """Lifts expire the details of their competition and its athletes."""
+        lift = mock_lift[0]
+        urls = [
+            f"/v1/competitions/{lift.competition.reference_id}",
+            f"{self.url}/{mock_lift[1].athlete.reference_id}",
+        ]
+        unrelated = f"/v1/competitions/{mock_lift[2].competition.reference_id}"
+        for url in [*urls, unrelated]:
+            client.get(url)
+
+        lift.bodyweight -= 1
+        lift.save()
+        for url in urls:
+            with CaptureQueriesContext(connection) as context:
+                client.get(url)
+            assert context.captured_queries
+        with CaptureQueriesContext(connection) as context:
+            client.get(unrelated)
+        assert len(context.captured_queries) == 0
+
+    def test_moved_lift_invalidation(self, client, mock_lift):
+        """Lifts moved to another competition expire both competitions."""
+        urls = [
+            f"/v1/competitions/{mock_lift[0].competition.reference_id}",
+            f"/v1/competitions/{mock_lift[2].competition.reference_id}",
+        ]
+        for url in urls:
+            client.get(url)
+
+        lift = Lift.objects.get(pk=mock_lift[1].pk)
+        lift.competition = mock_lift[2].competition
+        lift.save()
+        for url in urls:
+            with CaptureQueriesContext(connection) as context:
+                client.get(url)
+            assert context.captured_queries
@@ -0,0 +1,363 @@
+"""Testing management commands."""
+
+import csv
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+
+from api.models import (
+    Athlete,
+    AthleteBest,
+    Competition,
+    CompetitionSnapshot,
+    Lift,
+    Ranking,
+    SearchDocument,
+)
+from api.models.caches import (
+    COUNT_VERSION_KEY,
+    count_version,
+    response_version_key,
+    response_versions,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestLiftResults:
+    """Testing `lift_results` command."""
+
+    def test_refresh(self, mock_lift):
+        """Results bypassed by `update()` are refreshed."""
+        Lift.objects.update(
+            snatch_first="DNA",
+            snatch_second="DNA",
+            snatch_third="DNA",
+        )
+        with pytest.raises(CommandError, match="stale results found"):
+            call_command("lift_results", "--verify")
+
+        call_command("lift_results")
+
+        call_command("lift_results", "--verify")
+        for lift in Lift.objects.all():
+            assert lift.best_snatch == 0
+            assert lift.total_lifted == 0
+            assert lift.sinclair == 0
+            assert lift.grade is None
+
+    def test_grades(self, mock_lift):
+        """Grades bypassed by `update()` are regraded."""
+        grades = dict(Lift.objects.values_list("pk", "grade"))
+        Lift.objects.update(grade="Stale")
+
+        call_command("lift_results", "--grades")
+
+        assert dict(Lift.objects.values_list("pk", "grade")) == grades
+        call_command("lift_results", "--verify")
+
+    def test_sinclairs(self, mock_lift):
+        """Sinclairs bypassed by `update()` are recalculated."""
+        sinclairs = dict(Lift.objects.values_list("pk", "sinclair"))
+        Lift.objects.update(sinclair=0)
+
+        call_command("lift_results", "--sinclairs")
+
+        assert dict(Lift.objects.values_list("pk", "sinclair")) == sinclairs
+        call_command("lift_results", "--verify")
+
+    def test_rankings(self, mock_lift):
+        """Rankings copy the refreshed results."""
+        Lift.objects.update(sinclair=0)
+        Ranking.objects.filter(discipline="sinclair").update(value=0)
+
+        call_command("lift_results", "--sinclairs")
+
+        rankings = Ranking.objects.filter(discipline="sinclair")
+        assert rankings.exists()
+        for ranking in rankings.select_related("lift"):
+            assert ranking.value == ranking.lift.sinclair
+            assert ranking.value > 0
+
+    def test_athlete_bests(self, mock_lift):
+        """Athlete bests copy the refreshed results."""
+        bests = set(AthleteBest.objects.values_list("lift", "value"))
+        AthleteBest.objects.update(value=0)
+
+        call_command("lift_results")
+
+        assert bests
+        assert set(AthleteBest.objects.values_list("lift", "value")) == bests
+
+    def test_expire_responses(self, client, mock_lift):
+        """Cached responses show the refreshed results."""
+        competition = mock_lift[0].competition_id
+        url = f"/v1/competitions/{competition}/lifts"
+        sinclairs = {
+            str(pk): float(sinclair)
+            for pk, sinclair in Lift.objects.filter(
+                competition=competition
+            ).values_list("pk", "sinclair")
+        }
+        Lift.objects.update(sinclair=0)
+        client.get(url)
+
+        call_command("lift_results", "--sinclairs")
+
+        assert {
+            lift["reference_id"]: lift["sinclair"]
+            for lift in client.get(url).json()
+        } == sinclairs
+
+
+class TestSearchDocuments:
+    """Testing `search_documents` command."""
+
+    def test_rebuild(self, mock_lift):
+        """Names bypassed by `update()` are indexed again."""
+        Athlete.objects.update(last_name="Renamed")
+        assert not SearchDocument.objects.search("renamed").exists()
+
+        call_command("search_documents")
+
+        assert SearchDocument.objects.count() == (
+            Athlete.objects.count()
+            + Lift.objects.count()
+            + Competition.objects.count()
+        )
+        assert SearchDocument.objects.search("renamed").count() == (
+            Athlete.objects.count() + Lift.objects.count()
+        )
+        assert Athlete.objects.search("renamed").count() == (
+            Athlete.objects.count()
+        )
+        assert Lift.objects.search("renamed").count() == Lift.objects.count()
+
+
+class TestAthleteBests:
+    """Testing `athlete_bests` command."""
+
+    def test_rebuild(self, mock_lift):
+        """Bests bypassed by `update()` are recreated."""
+        bests = set(AthleteBest.objects.values_list("lift", "discipline"))
+        AthleteBest.objects.all().delete()
+
+        call_command("athlete_bests")
+
+        assert (
+            set(AthleteBest.objects.values_list("lift", "discipline")) == bests
+        )
+
+
+class TestCompetitionSnapshots:
+    """Testing `competition_snapshots` command."""
+
+    def test_rebuild(self, mock_lift):
+        """Every competition gets a current snapshot."""
+        CompetitionSnapshot.objects.all().delete()
+
+        call_command("competition_snapshots", stdout=StringIO())
+
+        snapshots = CompetitionSnapshot.objects.all()
+        assert len(snapshots) == Competition.objects.count()
+        assert not any(snapshot.is_stale for snapshot in snapshots)
+
+
+class TestImportResults:
+    """Testing `import_results` command."""
+
+    HEADER = (
+        "competition",
+        "location",
+        "date_start",
+        "first_name",
+        "last_name",
+        "yearborn",
+        "lottery_number",
+        "bodyweight",
+        "weight_category",
+        "snatch_first",
+        "snatch_first_weight",
+        "cnj_first",
+        "cnj_first_weight",
+    )
+
+    def write_sheet(self, path, rows):
+        with path.open("w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.HEADER)
+            writer.writerows(rows)
+        return path
+
+    @pytest.fixture
+    def sheet(self, tmp_path):
+        """Two athletes at the 2021 nationals, one row is invalid."""
+        return self.write_sheet(
+            tmp_path / "2021.csv",
+            [
+                (
+                    "Nationals",
+                    "Auckland",
+                    "2021-06-01",
+                    "Jane",
+                    "Doe",
+                    1990,
+                    1,
+                    "63.50",
+                    "W64",
+                    "LIFT",
+                    80,
+                    "LIFT",
+                    100,
+                ),
+                (
+                    "Nationals",
+                    "Auckland",
+                    "2021-06-01",
+                    "Jonh",
+                    "Smith",
+                    1985,
+                    2,
+                    "95.00",
+                    "M96",
+                    "LIFT",
+                    120,
+                    "",
+                    "",
+                ),
+                (
+                    "Nationals",
+                    "Auckland",
+                    "2021-06-01",
+                    "Ann",
+                    "Other",
+                    "unknown",
+                    3,
+                    "55.00",
+                    "W55",
+                    "",
+                    "",
+                    "",
+                    "",
+                ),
+            ],
+        )
+
+    def test_import(self, sheet, settings, django_capture_on_commit_callbacks):
+        """Athletes are matched by similar names, lifts bulk created."""
+        settings.COMPETITION_SNAPSHOT_WORKERS = 0
+        john = Athlete.objects.create(
+            first_name="John", last_name="Smith", yearborn=1985
+        )
+        out = StringIO()
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command("import_results", str(sheet), stdout=out)
+        assert cache.get(COUNT_VERSION_KEY) is not None
+
+        competition = Competition.objects.get(name="Nationals")
+        lifts = Lift.objects.filter(competition=competition)
+        assert lifts.count() == 2
+        assert lifts.get(athlete=john).best_snatch == 120
+        assert lifts.get(athlete__first_name="Jane").total_lifted == 180
+        assert AthleteBest.objects.filter(athlete=john).exists()
+        assert SearchDocument.objects.filter(lift__in=lifts).count() == 2
+        output = out.getvalue()
+        assert f"{sheet}:4:" in output
+        assert "Imported 2 lifts from 1 files" in output
+
+        call_command("import_results", str(sheet), stdout=StringIO())
+        assert lifts.count() == 2
+
+    def test_invalid_lift(self, tmp_path):
+        """Invalid lifts are reported and skipped."""
+        sheet = self.write_sheet(
+            tmp_path / "invalid.csv",
+            [
+                (
+                    "Club",
+                    "",
+                    "2021-06-01",
+                    first_name,
+                    "Doe",
+                    1990,
+                    1,
+                    "63.50",
+                    "W64",
+                    "LIFT",
+                    80,
+                    "LIFT",
+                    100,
+                )
+                for first_name in ("Jane", "Mary")
+            ],
+        )
+        out = StringIO()
+        call_command("import_results", str(sheet), stdout=out)
+        assert Lift.objects.count() == 1
+        assert (
+            f"{sheet}:3: Only one lottery number per weight category"
+            in out.getvalue()
+        )
+
+    def test_dry_run(self, sheet, django_capture_on_commit_callbacks):
+        """Nothing is created nor expired in a dry run."""
+        keys = [response_version_key("athlete"), response_version_key("lift")]
+        versions = count_version(), response_versions(keys)
+        out = StringIO()
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command("import_results", str(sheet), "--dry-run", stdout=out)
+        assert (count_version(), response_versions(keys)) == versions
+        assert "Validated 2 lifts" in out.getvalue()
+        assert not Lift.objects.exists()
+        assert not Athlete.objects.exists()
+        assert not Competition.objects.exists()
+
+    def test_unknown_format(self, tmp_path):
+        """Only CSV and XLSX sheets are read."""
+        path = tmp_path / "results.txt"
+        path.write_text("")
+        with pytest.raises(CommandError):
+            call_command("import_results", str(path))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_workers(self, sheet, tmp_path):
+        """Sheets are imported by parallel processes."""
+        other = self.write_sheet(
+            tmp_path / "2022.csv",
+            [
+                (
+                    "Nationals",
+                    "Auckland",
+                    "2022-06-01",
+                    "Jane",
+                    "Doe",
+                    1990,
+                    1,
+                    "63.50",
+                    "W64",
+                    "LIFT",
+                    85,
+                    "LIFT",
+                    105,
+                )
+            ],
+        )
+        call_command(
+            "import_results",
+            str(sheet),
+            str(other),
+            "--workers=2",
+            stdout=StringIO(),
+        )
+        assert Lift.objects.count() == 3
+        assert Athlete.objects.filter(first_name="Jane").count() == 1
+        assert (
+            AthleteBest.objects.get(
+                athlete__first_name="Jane",
+                age_category="senior",
+                discipline="total",
+            ).value
+            == 190
+        )
@@ -1,6 +1,9 @@
 from datetime import datetime
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
 from api.models.athletes import MINIMUM_YEAR_FROM_BIRTH
@@ -219,3 +222,125 @@ class TestAthleteCase:
         assert result["age_categories"] == expected["age_categories"]
         assert result["current_grade"] == expected["current_grade"]
         assert result["recent_lift"] == expected["recent_lift"]
+
+    def test_list_query_count(
+        self, client, lift_factory, post2019_pre2022_competition_factory
+    ):
+        """Number of queries does not depend on the page size."""
+        for _ in range(6):
+            lift_factory(competition=post2019_pre2022_competition_factory())
+
+        def count_queries(page_size):
+            cache.clear()
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(f"{self.url}?page_size={page_size}")
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.json()["results"]) == page_size
+            return len(context.captured_queries)
+
+        assert count_queries(page_size=2) == count_queries(page_size=6)
+
+    def test_detail_query_count(
+        self,
+        client,
+        athlete_factory,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+    ):
+        """Number of queries does not depend on the number of lifts."""
+
+        def count_queries(lifts):
+            athlete = athlete_factory(yearborn=1980)
+            for _ in range(lifts):
+                lift_factory(
+                    athlete=athlete,
+                    competition=post2019_pre2022_competition_factory(),
+                )
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(f"{self.url}/{athlete.reference_id}")
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.json()["lift_set"]) == lifts
+            return len(context.captured_queries)
+
+        assert count_queries(lifts=1) == count_queries(lifts=5)
+
+    def test_cursor_pagination(self, client, athlete_factory):
+        """Cursor pages cover every athlete once, without a count."""
+        athletes = [athlete_factory() for _ in range(5)]
+        url = f"{self.url}?cursor=&page_size=2"
+        result_athlete_ids = []
+        while url is not None:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            result = response.json()
+            assert "count" not in result
+            result_athlete_ids += [
+                athlete["reference_id"] for athlete in result["results"]
+            ]
+            url = result["next"]
+        assert sorted(result_athlete_ids) == sorted(
+            str(athlete.reference_id) for athlete in athletes
+        )
+
+    @pytest.mark.parametrize("ordering", ["first_name", "-first_name"])
+    def test_cursor_ordering(self, client, athlete_factory, ordering):
+        """Cursor pages follow `?ordering=`."""
+        athletes = [athlete_factory() for _ in range(5)]
+        url = f"{self.url}?cursor=&page_size=2&ordering={ordering}"
+        names = []
+        while url is not None:
+            result = client.get(url).json()
+            names += [athlete["first_name"] for athlete in result["results"]]
+            url = result["next"]
+        assert names == sorted(
+            (athlete.first_name for athlete in athletes),
+            reverse=ordering.startswith("-"),
+        )
+
+    def test_best_lifts(
+        self,
+        client,
+        athlete_factory,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        """Bests are kept current as lifts are saved and deleted."""
+        athlete = athlete_factory(yearborn=1990)
+        with django_capture_on_commit_callbacks(execute=True):
+            lifts = [
+                lift_factory(
+                    athlete=athlete,
+                    competition=post2019_pre2022_competition_factory(),
+                    weight_category=weight_category,
+                )
+                for weight_category in ("M89", "M89", "M96")
+            ]
+
+        def best_lifts():
+            response = client.get(f"{self.url}/{athlete.reference_id}")
+            assert response.status_code == status.HTTP_200_OK
+            result = response.json()
+            expected: dict[str, dict] = {}
+            for lift in reversed(result["lift_set"]):
+                best = expected.setdefault(lift["weight_category"], lift)
+                if lift["total_lifted"] > best["total_lifted"]:
+                    expected[lift["weight_category"]] = lift
+            assert result["best_lifts"]["total"]["is_senior"] == expected
+            assert result["age_categories_competed"]["is_senior"]
+            return result
+
+        result = best_lifts()
+        assert result["weight_categories_competed"] == ["M89", "M96"]
+        for lift_type in ("snatch", "cnj"):
+            setattr(lifts[0], f"{lift_type}_first", "LIFT")
+            setattr(lifts[0], f"{lift_type}_first_weight", 400)
+            setattr(lifts[0], f"{lift_type}_second", "DNA")
+            setattr(lifts[0], f"{lift_type}_third", "DNA")
+        with django_capture_on_commit_callbacks(execute=True):
+            lifts[0].save()
+        assert best_lifts()["best_sinclair"]["is_senior"]["reference_id"] == (
+            str(lifts[0].pk)
+        )
+        lifts[0].delete()
+        best_lifts()
@@ -5,9 +5,12 @@ Competitions to retrieve, create, edit and delete.
 from contextlib import nullcontext as does_not_raise
 
 import pytest
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from rest_framework import status
 
+from api.models import CompetitionSnapshot
+
 pytestmark = pytest.mark.django_db
 
 
@@ -78,6 +81,20 @@ class TestCompetitionCase:
         result = response.json()
         assert result["count"] == len(mock_competition)
 
+    def test_search_within_dates(self, client, mock_competition):
+        """Search filters the competitions of the other filters only."""
+        date_start = mock_competition[0].date_start
+        response = client.get(
+            f"{self.url}?date_start_after={date_start}"
+            f"&date_start_before={date_start}"
+            f"&search={mock_competition[0].location}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            competition["reference_id"]
+            for competition in response.json()["results"]
+        ] == [str(mock_competition[0].reference_id)]
+
     @pytest.mark.parametrize(
         "test_input,expected",
         [
@@ -221,3 +238,159 @@ class TestCompetitionCase:
                 if lift.competition.reference_id == competition_id
             ]
         )
+
+    def test_competition_lift_placing(
+        self,
+        client,
+        post2019_pre2022_competition_factory,
+        athlete_factory,
+        lift_factory,
+    ):
+        """Placing ranks total, clean and jerk, attempt then lottery."""
+        competition = post2019_pre2022_competition_factory()
+        lifts = {
+            # (best snatch, (cnj status, cnj weight)...), lottery number
+            "2nd": ((100, [("LIFT", 120), ("NOLIFT", 125)]), 1),
+            "1st": ((101, [("LIFT", 120), ("DNA", 0)]), 2),
+            "3rd": ((100, [("NOLIFT", 120), ("LIFT", 120)]), 3),
+            "4th": ((100, [("NOLIFT", 120), ("LIFT", 120)]), 4),
+            "-": ((0, [("NOLIFT", 120), ("LIFT", 120)]), 5),
+        }
+        for placing, (
+            (snatch, ((cnj_first, cnj_first_weight), (cnj_second, weight))),
+            lottery_number,
+        ) in lifts.items():
+            lift_factory(
+                competition=competition,
+                athlete=athlete_factory(),
+                lottery_number=lottery_number,
+                snatch_first="LIFT" if snatch > 0 else "NOLIFT",
+                snatch_first_weight=snatch or 100,
+                snatch_second="DNA",
+                snatch_second_weight=0,
+                snatch_third="DNA",
+                snatch_third_weight=0,
+                cnj_first=cnj_first,
+                cnj_first_weight=cnj_first_weight,
+                cnj_second=cnj_second,
+                cnj_second_weight=weight,
+                cnj_third="DNA",
+                cnj_third_weight=0,
+                weight_category="M96",
+            )
+        response = client.get(f"{self.url}/{competition.reference_id}")
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert {
+            lift["lottery_number"]: lift["placing"]
+            for lift in result["lift_set"]
+        } == {
+            lottery_number: placing
+            for placing, (_, lottery_number) in lifts.items()
+        }
+
+    def test_competition_lift_order(
+        self,
+        client,
+        post2019_pre2022_competition_factory,
+        lift_factory,
+    ):
+        """Lifts are ordered female first, then by weight, super-heavies last."""
+        competition = post2019_pre2022_competition_factory()
+        expected = ["W49", "W55", "W87+", "M61", "M102", "M109+"]
+        for lottery_number, weight_category in enumerate(
+            ["M109+", "W55", "M102", "W87+", "M61", "W49"], start=1
+        ):
+            lift_factory(
+                competition=competition,
+                lottery_number=lottery_number,
+                weight_category=weight_category,
+            )
+        response = client.get(f"{self.url}/{competition.reference_id}")
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert [
+            lift["weight_category"] for lift in result["lift_set"]
+        ] == expected
+
+
+class TestCompetitionSnapshot:
+    """Competitions retrieved from their results snapshot."""
+
+    url = "/v1/competitions"
+
+    @pytest.fixture
+    def built_snapshot(
+        self, settings, django_capture_on_commit_callbacks, mock_lift
+    ):
+        """Snapshot of the competition of the first lift, built on commit."""
+        settings.COMPETITION_SNAPSHOT_WORKERS = 0
+        with django_capture_on_commit_callbacks(execute=True):
+            mock_lift[0].save()
+        return CompetitionSnapshot.objects.get(
+            competition=mock_lift[0].competition
+        )
+
+    def test_snapshot(self, client, built_snapshot):
+        """Snapshots are served as the live response, with absolute urls."""
+        assert not built_snapshot.is_stale
+        url = f"{self.url}/{built_snapshot.competition_id}"
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["url"].startswith("http://testserver/")
+        assert response.json()["lift_set"][0]["url"].startswith("http://")
+
+        cache.clear()
+        CompetitionSnapshot.objects.update(version=2)
+        live = client.get(url).json()
+        snapshot = response.json()
+        # sampled on every live response
+        del live["random_lifts"], snapshot["random_lifts"]
+        assert live == snapshot
+
+    def test_stale_snapshot(self, client, built_snapshot, mock_lift):
+        """Stale snapshots are served live until rebuilt."""
+        url = f"{self.url}/{built_snapshot.competition_id}"
+        CompetitionSnapshot.objects.update(data={"name": "Snapshot"})
+        assert client.get(url).json() == {"name": "Snapshot"}
+
+        cache.clear()
+        mock_lift[0].athlete.first_name = "Changed"
+        mock_lift[0].athlete.save()
+        built_snapshot.refresh_from_db()
+        assert built_snapshot.is_stale
+        result = client.get(url).json()
+        assert result["lift_set"][0]["athlete_name"].startswith("Changed")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_delete_competition(self, settings, mock_lift):
+        """Deleting a competition with lifts commits without its snapshot."""
+        settings.COMPETITION_SNAPSHOT_WORKERS = 0
+        competition = mock_lift[0].competition
+        assert CompetitionSnapshot.objects.filter(
+            competition=competition
+        ).exists()
+
+        competition.delete()
+
+        assert not CompetitionSnapshot.objects.filter(
+            competition=competition.pk
+        ).exists()
+
+    def test_rebuild_on_retrieve(
+        self,
+        client,
+        settings,
+        django_capture_on_commit_callbacks,
+        mock_competition,
+    ):
+        """Missing snapshots are built after the first retrieve."""
+        settings.COMPETITION_SNAPSHOT_WORKERS = 0
+        competition = mock_competition[0]
+        CompetitionSnapshot.objects.filter(competition=competition).delete()
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.get(f"{self.url}/{competition.reference_id}")
+        assert response.status_code == status.HTTP_200_OK
+        snapshot = CompetitionSnapshot.objects.get(competition=competition)
+        assert not snapshot.is_stale
+        assert snapshot.data["name"] == competition.name
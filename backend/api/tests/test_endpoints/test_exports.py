@@ -0,0 +1,118 @@
+"""Testing the export endpoints."""
+
+import csv
+import io
+import json
+
+import pytest
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+
+class TestExports:
+    """Export testing."""
+
+    url = "/v1/export"
+
+    def test_export_lifts_csv(self, client, mock_lift):
+        """Lifts are streamed with their results and placing."""
+        response = client.get(f"{self.url}/lifts.csv")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        rows = list(
+            csv.DictReader(
+                io.StringIO(b"".join(response.streaming_content).decode())
+            )
+        )
+        assert len(rows) == len(mock_lift)
+        by_pk = {row["reference_id"]: row for row in rows}
+        for lift in mock_lift:
+            row = by_pk[str(lift.reference_id)]
+            assert row["athlete"] == str(lift.athlete.reference_id)
+            assert int(row["total_lifted"]) == lift.total_lifted
+            assert row["sinclair"] == str(lift.sinclair)
+            assert row["grade"] == (lift.grade or "")
+            assert row["placing"] == lift.placing
+
+    def test_export_athlete_history(self, client, mock_lift):
+        """Lifts of an athlete are placed within their competition."""
+        lift = mock_lift[0]
+        response = client.get(
+            f"{self.url}/lifts.ndjson?athlete={lift.athlete.reference_id}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        assert {row["athlete"] for row in rows} == {
+            str(lift.athlete.reference_id)
+        }
+        placings = {
+            lift.reference_id: lift.placing
+            for lift in lift.athlete.lift_set.all()
+        }
+        assert {row["reference_id"]: row["placing"] for row in rows} == (
+            placings
+        )
+
+    @pytest.mark.parametrize("resource", ["athletes", "competitions"])
+    def test_export_ndjson(self, client, mock_lift, resource):
+        """Each line is a JSON object including the lifts counted."""
+        response = client.get(f"{self.url}/{resource}.ndjson")
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        assert rows
+        assert sum(row["lifts_count"] for row in rows) == len(mock_lift)
+
+    @pytest.mark.parametrize(
+        "path,accept,expected",
+        [
+            pytest.param(
+                "lifts.csv", "text/csv", status.HTTP_200_OK, id="csv"
+            ),
+            pytest.param(
+                "lifts.ndjson",
+                "application/x-ndjson, */*;q=0.5",
+                status.HTTP_200_OK,
+                id="ndjson",
+            ),
+            pytest.param(
+                "lifts.csv",
+                "application/json",
+                status.HTTP_406_NOT_ACCEPTABLE,
+                id="not_acceptable",
+            ),
+        ],
+    )
+    def test_export_accept(self, client, mock_lift, path, accept, expected):
+        """The format of the extension is negotiated with `Accept`."""
+        response = client.get(f"{self.url}/{path}", HTTP_ACCEPT=accept)
+        assert response.status_code == expected
+
+    @pytest.mark.parametrize("path", ["lifts.xml", "users.csv"])
+    def test_export_not_found(self, client, path):
+        """Unknown resources and formats are not found."""
+        response = client.get(f"{self.url}/{path}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("param", ["athlete", "competition"])
+    def test_export_lifts_invalid_filter(self, client, mock_lift, param):
+        """Malformed hashids are rejected, unknown ones not found."""
+        response = client.get(f"{self.url}/lifts.csv?{param}=zzz")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        errors = csv.DictReader(io.StringIO(response.content.decode()))
+        assert param in next(errors)
+
+        related = getattr(mock_lift[0], param)
+        pk = related.reference_id
+        related.delete()
+        response = client.get(f"{self.url}/lifts.csv?{param}={pk}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -2,13 +2,21 @@
 
 Lift retrieve, create, edit and delete.
 """
+import csv
+import io
 from contextlib import nullcontext as does_not_raise
 from decimal import Decimal
 
 import pytest
-from django.core.exceptions import ValidationError
+from auditlog.models import LogEntry
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
+from api.models import AthleteBest, Lift, Ranking, SearchDocument
+from api.serializers import LiftSerializer
+
 pytestmark = pytest.mark.django_db
 
 
@@ -79,6 +87,30 @@ class TestLift:
         result_lift_ids = [lift["reference_id"] for lift in result]
         assert set(mock_lift_ids) == set(result_lift_ids)
 
+    def test_list_cursor_pagination(self, client, mock_lift):
+        """Cursor pages keep the placing of the whole competition."""
+        competition_id = mock_lift[0].competition.reference_id
+        expected = {
+            lift["reference_id"]: lift["placing"]
+            for lift in client.get(
+                f"{self.url}/{str(competition_id)}/lifts"
+            ).json()
+        }
+        url = f"{self.url}/{str(competition_id)}/lifts?cursor=&page_size=1"
+        result = {}
+        while url is not None:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            result.update(
+                {
+                    lift["reference_id"]: lift["placing"]
+                    for lift in page["results"]
+                }
+            )
+            url = page["next"]
+        assert result == expected
+
     @pytest.mark.parametrize(
         "test_input,expected",
         [
@@ -775,3 +807,182 @@ class TestLift:
             f"{self.url}/{str(mock_lift[0].competition.reference_id)}/lifts/{str(mock_lift[0].reference_id)}",
         )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_serializer_lazy_load(self, settings, lift):
+        """In debug mode serializing raises instead of lazily loading."""
+        settings.DEBUG = True
+        with pytest.raises(ImproperlyConfigured):
+            LiftSerializer(
+                Lift.objects.get(pk=lift.pk), context={"request": None}
+            ).data
+
+        lift = (
+            Lift.objects.filter(pk=lift.pk)
+            .for_serializer()
+            .with_placing_subquery()
+            .get()
+        )
+        with CaptureQueriesContext(connection) as context:
+            LiftSerializer(lift, context={"request": None}).data
+        assert len(context.captured_queries) == 0
+
+
+class TestLiftBulk:
+    """Bulk lift creation testing."""
+
+    @pytest.fixture
+    def competition(self, post2019_pre2022_competition_factory):
+        return post2019_pre2022_competition_factory()
+
+    @pytest.fixture
+    def bulk_lifts(self, athlete_factory):
+        """Results of three athletes in M96."""
+        return [
+            {
+                "athlete": str(athlete_factory(yearborn=1990).reference_id),
+                "lottery_number": lottery_number,
+                "snatch_first": "LIFT",
+                "snatch_first_weight": 100 + lottery_number,
+                "snatch_second": "NOLIFT",
+                "snatch_second_weight": 105 + lottery_number,
+                "cnj_first": "LIFT",
+                "cnj_first_weight": 120 + lottery_number,
+                "bodyweight": "95.50",
+                "weight_category": "M96",
+            }
+            for lottery_number in range(1, 4)
+        ]
+
+    def url(self, competition):
+        return f"/v1/competitions/{competition.reference_id}/lifts/bulk"
+
+    def test_bulk_create(self, admin_client, competition, bulk_lifts):
+        """Lifts are created with their history, audit log and summaries."""
+        response = admin_client.post(
+            self.url(competition),
+            data=bulk_lifts,
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        result = response.json()
+        assert [lift["total_lifted"] for lift in result] == [222, 224, 226]
+        assert [lift["placing"] for lift in result] == ["3rd", "2nd", "1st"]
+        lifts = Lift.objects.filter(competition=competition)
+        assert lifts.count() == 3
+        assert Lift.history_record.filter(competition=competition).count() == 3
+        assert LogEntry.objects.get_for_objects(lifts).count() == 3
+        assert SearchDocument.objects.filter(lift__in=lifts).count() == 3
+        assert Ranking.objects.filter(lift__in=lifts).count() == 12
+        assert AthleteBest.objects.filter(lift__in=lifts).exists()
+        response = admin_client.get(
+            f"/v1/competitions/{competition.reference_id}/lifts"
+        )
+        assert len(response.json()) == 3
+
+    def test_bulk_create_csv(self, admin_client, competition, bulk_lifts):
+        """Lifts are read from a CSV, empty cells are defaults."""
+        content = io.StringIO()
+        writer = csv.DictWriter(content, fieldnames=list(bulk_lifts[0]))
+        writer.writeheader()
+        writer.writerows(bulk_lifts)
+        response = admin_client.post(
+            self.url(competition),
+            data=content.getvalue(),
+            content_type="text/csv",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [lift["cnj_second"] for lift in response.json()] == ["DNA"] * 3
+
+    def test_bulk_create_query_count(
+        self, admin_client, competition, bulk_lifts, athlete_factory
+    ):
+        """Queries do not grow with the number of lifts."""
+        with CaptureQueriesContext(connection) as few:
+            admin_client.post(
+                self.url(competition),
+                data=bulk_lifts[:1],
+                content_type="application/json",
+            )
+        for lift, lottery_number in zip(bulk_lifts[1:], range(10, 12)):
+            lift["lottery_number"] = lottery_number
+        bulk_lifts = bulk_lifts[1:] * 10
+        for idx, lift in enumerate(bulk_lifts):
+            bulk_lifts[idx] = {
+                **lift,
+                "athlete": str(athlete_factory(yearborn=1990).reference_id),
+                "lottery_number": 100 + idx,
+            }
+        with CaptureQueriesContext(connection) as many:
+            response = admin_client.post(
+                self.url(competition),
+                data=bulk_lifts,
+                content_type="application/json",
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        # the first upload also loads the era timeline
+        assert len(many.captured_queries) <= len(few.captured_queries)
+
+    def test_bulk_create_errors(
+        self, admin_client, competition, bulk_lifts, athlete_factory
+    ):
+        """Errors are listed per lift and no lift is created."""
+        bulk_lifts[1]["athlete"] = bulk_lifts[0]["athlete"]
+        bulk_lifts[2]["lottery_number"] = 1
+        response = admin_client.post(
+            self.url(competition),
+            data=bulk_lifts,
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == [
+            {},
+            {
+                "non_field_errors": [
+                    "Athlete can only have one lift in a competition"
+                ]
+            },
+            {
+                "non_field_errors": [
+                    "Only one lottery number per weight category"
+                ]
+            },
+        ]
+
+        bulk_lifts[1]["athlete"] = str(athlete_factory().reference_id)
+        bulk_lifts[2]["lottery_number"] = 3
+        bulk_lifts[2]["snatch_second"] = "LIFT"
+        bulk_lifts[2]["snatch_second_weight"] = 90
+        response = admin_client.post(
+            self.url(competition),
+            data=bulk_lifts,
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "GOOD lift" in response.json()[2]["non_field_errors"][0]
+        assert not Lift.objects.filter(competition=competition).exists()
+
+    def test_bulk_create_existing(
+        self, admin_client, competition, bulk_lifts, lift_factory
+    ):
+        """Lottery numbers already taken in the competition are rejected."""
+        lift_factory(
+            competition=competition, weight_category="M96", lottery_number=2
+        )
+        response = admin_client.post(
+            self.url(competition),
+            data=bulk_lifts,
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()[1]["non_field_errors"] == [
+            "Only one lottery number per weight category"
+        ]
+
+    def test_anon_bulk_create(self, client, competition, bulk_lifts):
+        """Anonymous users cannot create lifts."""
+        response = client.post(
+            self.url(competition),
+            data=bulk_lifts,
+            content_type="application/json",
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
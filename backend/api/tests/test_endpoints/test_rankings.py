@@ -0,0 +1,152 @@
+"""Testing the rankings endpoint."""
+
+from datetime import date
+
+import pytest
+from rest_framework import status
+
+from api.models import Ranking
+
+pytestmark = pytest.mark.django_db
+
+GOOD_LIFTS = {
+    "snatch_first": "LIFT",
+    "snatch_second": "DNA",
+    "snatch_third": "DNA",
+    "cnj_first": "LIFT",
+    "cnj_second": "DNA",
+    "cnj_third": "DNA",
+}
+
+
+class TestRankings:
+    """Rankings testing."""
+
+    url = "/v1/rankings"
+
+    @pytest.fixture
+    def ranked_lifts(
+        self,
+        lift_factory,
+        athlete_factory,
+        post2019_pre2022_competition_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        """Lifts with totals 100, 150 and 200, the last in W64."""
+        with django_capture_on_commit_callbacks(execute=True):
+            return [
+                lift_factory(
+                    athlete=athlete_factory(yearborn=1990),
+                    competition=post2019_pre2022_competition_factory(),
+                    snatch_first_weight=snatch,
+                    cnj_first_weight=snatch,
+                    weight_category=weight_category,
+                    **GOOD_LIFTS,
+                )
+                for snatch, weight_category in (
+                    (50, "M96"),
+                    (75, "M96"),
+                    (100, "W64"),
+                )
+            ]
+
+    def test_get_rankings(self, client, ranked_lifts):
+        """Lifts are ranked by total without a count."""
+        response = client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert "count" not in result
+        assert [item["value"] for item in result["results"]] == [200, 150, 100]
+        assert result["results"][0]["lift"] == str(ranked_lifts[2].pk)
+        assert result["results"][0]["athlete_name"] == (
+            ranked_lifts[2].athlete.full_name
+        )
+
+    @pytest.mark.parametrize(
+        "test_input,expected",
+        [
+            pytest.param("discipline=snatch", [100, 75, 50], id="snatch"),
+            pytest.param("sex=M", [150, 100], id="sex"),
+            pytest.param("weight_category=W64", [200], id="weight_category"),
+            pytest.param("age_category=senior", [200, 150, 100], id="senior"),
+            pytest.param("age_category=junior", [], id="junior"),
+            pytest.param("year=1999", [], id="year"),
+        ],
+    )
+    def test_filter_rankings(self, client, ranked_lifts, test_input, expected):
+        """Rankings are filtered on the summary table."""
+        response = client.get(f"{self.url}?{test_input}")
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            item["value"] for item in response.json()["results"]
+        ] == expected
+
+    def test_athlete_best(
+        self,
+        client,
+        ranked_lifts,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        """Athletes are ranked once, by their best lift."""
+        athlete = ranked_lifts[0].athlete
+        with django_capture_on_commit_callbacks(execute=True):
+            for snatch in (60, 40):
+                lift_factory(
+                    athlete=athlete,
+                    competition=post2019_pre2022_competition_factory(),
+                    snatch_first_weight=snatch,
+                    cnj_first_weight=snatch,
+                    weight_category="M96",
+                    **GOOD_LIFTS,
+                )
+        response = client.get(self.url)
+        assert [item["value"] for item in response.json()["results"]] == [
+            200,
+            150,
+            120,
+        ]
+        response = client.get(f"{self.url}?discipline=snatch&sex=M")
+        assert [item["value"] for item in response.json()["results"]] == [
+            75,
+            60,
+        ]
+
+    def test_invalid_discipline(self, client):
+        """Unknown disciplines are rejected."""
+        response = client.get(f"{self.url}?discipline=bench")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cursor_pagination(self, client, ranked_lifts):
+        """Cursor pages cover every ranking once."""
+        url = f"{self.url}?page_size=2"
+        values = []
+        while url is not None:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            result = response.json()
+            values += [item["value"] for item in result["results"]]
+            url = result["next"]
+        assert values == [200, 150, 100]
+
+    def test_refresh_rankings(
+        self, ranked_lifts, django_capture_on_commit_callbacks
+    ):
+        """Rankings follow changes to lifts and competitions."""
+        lift = ranked_lifts[0]
+        lift.cnj_first_weight = 80
+        with django_capture_on_commit_callbacks(execute=True):
+            lift.save()
+        assert Ranking.objects.get(lift=lift, discipline="total").value == 130
+
+        lift.competition.date_start = date(2018, 6, 1)
+        lift.competition.date_end = date(2018, 6, 1)
+        lift.competition.save()
+        assert set(
+            Ranking.objects.filter(lift=lift).values_list("year", flat=True)
+        ) == {2018}
+
+        lift.delete()
+        assert not Ranking.objects.filter(lift=lift.pk).exists()
+        assert Ranking.objects.rebuild() == Ranking.objects.count() == 8
@@ -0,0 +1,85 @@
+"""Testing buffered history and audit log records."""
+
+import pytest
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog as auditlog_registry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Athlete
+from api.models.history import auditlog, buffered_history
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBufferedHistory:
+    """Testing `buffered_history()` and `HISTORY_SYSTEMS`."""
+
+    def test_buffered_history(self, athlete_factory):
+        """Rows are created when the block exits, with fewer queries."""
+        athletes = athlete_factory.create_batch(3)
+        with CaptureQueriesContext(connection) as unbuffered:
+            for athlete in athletes:
+                athlete.first_name = f"{athlete.first_name}-unbuffered"
+                athlete.save()
+
+        with CaptureQueriesContext(connection) as buffered:
+            with buffered_history() as buffer:
+                for athlete in athletes:
+                    athlete.first_name = f"{athlete.first_name}-buffered"
+                    athlete.save()
+                assert len(buffer.records) == len(buffer.log_entries) == 3
+                assert not Athlete.history_record.filter(
+                    first_name__endswith="-buffered"
+                ).exists()
+        assert len(buffered.captured_queries) < len(
+            unbuffered.captured_queries
+        )
+
+        for athlete in athletes:
+            assert [
+                record.history_type for record in athlete.history_record.all()
+            ] == ["~", "~", "+"]
+            assert [
+                entry.action
+                for entry in LogEntry.objects.get_for_object(athlete)
+            ] == [LogEntry.Action.UPDATE] * 2 + [LogEntry.Action.CREATE]
+            assert "-buffered" in athlete.history_record.first().first_name
+
+    def test_nested_block_raises(self, athlete):
+        """Rows of a nested block that raised are dropped."""
+        pk = athlete.pk
+        with buffered_history() as buffer:
+            athlete.first_name = "Nested"
+            athlete.save()
+            with pytest.raises(ValueError):
+                with buffered_history():
+                    athlete.delete()
+                    raise ValueError
+            assert len(buffer.records) == len(buffer.log_entries) == 1
+        assert Athlete.objects.filter(pk=pk).exists()
+        assert Athlete.history_record.filter(reference_id=pk).count() == 2
+
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_history_systems(self, settings, athlete_factory, buffered):
+        """Models record their changes with the configured systems only."""
+        settings.HISTORY_SYSTEMS = {"api.Athlete": ("simple_history",)}
+        if buffered:
+            with buffered_history():
+                athlete = athlete_factory()
+        else:
+            athlete = athlete_factory()
+        assert athlete.history_record.count() == 1
+        assert not LogEntry.objects.get_for_object(athlete).exists()
+
+        settings.HISTORY_SYSTEMS = {"api.Athlete": ("auditlog",)}
+        athlete.first_name = "Changed"
+        athlete.save()
+        assert athlete.history_record.count() == 1
+        assert LogEntry.objects.get_for_object(athlete).count() == 1
+
+    def test_registry(self, athlete):
+        """Models are audited once, through the registry of `api`."""
+        assert auditlog.contains(Athlete)
+        assert not auditlog_registry.contains(Athlete)
+        assert LogEntry.objects.get_for_object(athlete).count() == 1
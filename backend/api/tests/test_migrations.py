@@ -0,0 +1,117 @@
+"""Testing the migrations, which the test database is created without.
+
+The migrations run on an empty database of their own, created and dropped \
+        by `empty_database`, the test database is left as it is.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from api.models import (
+    AgeCategoryEra,
+    CompetitionSnapshot,
+    Lift,
+    WeightCategory,
+    WeightCategoryEra,
+)
+from api.models.utils import calculate_sinclair, determine_grade
+
+
+@pytest.fixture
+def empty_database(transactional_db, settings):
+    """Connect to a new empty database, with the migrations enabled."""
+    settings.MIGRATION_MODULES = {}
+    name = connection.settings_dict["NAME"]
+    empty = f"{name}_migrations"
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP DATABASE IF EXISTS "{empty}"')
+        cursor.execute(f'CREATE DATABASE "{empty}"')
+    connection.close()
+    connection.settings_dict["NAME"] = empty
+    ContentType.objects.clear_cache()
+    yield empty
+    connection.close()
+    connection.settings_dict["NAME"] = name
+    ContentType.objects.clear_cache()
+    # loaded from the eras of the migrated database
+    AgeCategoryEra.objects.invalidate_timeline()
+    WeightCategoryEra.objects.invalidate_timeline()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP DATABASE "{empty}"')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_migrate_from_zero(empty_database):
+    """A fresh database is migrated, with the live model signals."""
+    call_command("migrate", verbosity=0)
+
+    assert AgeCategoryEra.objects.exists()
+    assert not CompetitionSnapshot.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_migrate_lift_results(empty_database):
+    """Existing lifts get their results, weight class and era sinclair."""
+    call_command(
+        "migrate", "api", "0020_historicallift_historicalathlete", verbosity=0
+    )
+    apps = (
+        MigrationExecutor(connection)
+        .loader.project_state(("api", "0020_historicallift_historicalathlete"))
+        .apps
+    )
+    athlete = apps.get_model("api", "Athlete").objects.create(
+        first_name="John", last_name="Smith", yearborn=1990
+    )
+    competition = apps.get_model("api", "Competition").objects.create(
+        name="Nationals",
+        date_start=date(2022, 3, 1),
+        date_end=date(2022, 3, 2),
+    )
+    pk = (
+        apps.get_model("api", "Lift")
+        .objects.create(
+            athlete=athlete,
+            competition=competition,
+            lottery_number=1,
+            weight_category="M89",
+            bodyweight=Decimal("88.50"),
+            snatch_first="LIFT",
+            snatch_first_weight=100,
+            snatch_second="NOLIFT",
+            snatch_second_weight=105,
+            cnj_first="LIFT",
+            cnj_first_weight=120,
+            cnj_second="LIFT",
+            cnj_second_weight=125,
+        )
+        .pk
+    )
+
+    call_command("migrate", verbosity=0)
+
+    lift = Lift.objects.get(pk=pk)
+    assert (lift.best_snatch, lift.best_cnj, lift.total_lifted) == (
+        100,
+        125,
+        225,
+    )
+    assert lift.grade == determine_grade(225, "M89")
+    assert lift.sinclair == calculate_sinclair(
+        bodyweight=lift.bodyweight,
+        total_lifted=225,
+        weight_category="M89",
+        yearborn=None,
+        lift_year=2022,
+    )
+    assert str(lift.weight_class) == str(
+        WeightCategory.objects.get(
+            era__date_start=date(2018, 11, 1), sex="M", weight=89
+        )
+    )
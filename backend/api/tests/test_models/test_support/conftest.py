@@ -1,5 +1,6 @@
 """Setting up fixtures for support models."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
@@ -44,9 +45,13 @@ class WeightCategoryMock:
 
 
 @pytest.fixture
-def mock_age_category_era(django_db_blocker) -> list[AgeCategoryEra]:
+def mock_age_category_era(
+    django_db_blocker,
+) -> Iterator[list[AgeCategoryEra]]:
     """Create age category era.
 
+    The cached era timeline is reloaded after the eras are rolled back.
+
     Returns:
         list[Era]: list of Eras.
     """
@@ -69,7 +74,8 @@ def mock_age_category_era(django_db_blocker) -> list[AgeCategoryEra]:
                     description=era.description,
                 )
             )
-    return created
+    yield created
+    AgeCategoryEra.objects.invalidate_timeline()
 
 
 @pytest.fixture
@@ -117,8 +123,13 @@ def mock_age_categories(django_db_blocker) -> list[AgeCategory]:
 
 
 @pytest.fixture
-def mock_weight_category_era(django_db_blocker) -> list[WeightCategoryEra]:
-    """Create Weight category eras."""
+def mock_weight_category_era(
+    django_db_blocker,
+) -> Iterator[list[WeightCategoryEra]]:
+    """Create Weight category eras.
+
+    The cached era timeline is reloaded after the eras are rolled back.
+    """
     eras = [
         EraMock(
             date_start=datetime(1998, 1, 1),
@@ -141,7 +152,8 @@ def mock_weight_category_era(django_db_blocker) -> list[WeightCategoryEra]:
                     description=era.description,
                 )
             )
-    return created
+    yield created
+    WeightCategoryEra.objects.invalidate_timeline()
 
 
 @pytest.fixture
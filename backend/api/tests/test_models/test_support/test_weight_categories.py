@@ -1,10 +1,12 @@
 """Testing Weight Categorey models methods and validation."""
 
+from datetime import date, datetime
 
 import pytest
+from django.core.exceptions import ValidationError
 
 # from api.models import AgeCategory, AgeCategoryEra
-from api.models import WeightCategory, WeightCategoryEra
+from api.models import Lift, WeightCategory, WeightCategoryEra
 
 pytestmark = pytest.mark.django_db
 
@@ -39,6 +41,42 @@ class TestWeightCategoryEra:
                 == f"Weight Category Era: {date_start.year} - {date_end.year}"
             )
 
+    @pytest.mark.parametrize(
+        "test_input,expected",
+        [
+            pytest.param(date(1990, 6, 1), None, id="before_eras"),
+            pytest.param(date(2010, 6, 1), 0, id="1998_2017"),
+            pytest.param(date(2017, 1, 1), 1, id="2017_start"),
+            pytest.param(datetime(2020, 6, 1), 2, id="2018_current"),
+        ],
+    )
+    def test_resolve_era(
+        self,
+        mock_weight_category_era,
+        django_assert_num_queries,
+        test_input,
+        expected,
+    ):
+        """Eras resolve from the cached timeline without queries."""
+        WeightCategoryEra.objects.resolve_era(date.today())
+        with django_assert_num_queries(0):
+            era = WeightCategoryEra.objects.resolve_era(test_input)
+        if expected is None:
+            assert era is None
+        else:
+            assert era == mock_weight_category_era[expected]
+
+    def test_timeline_invalidation(self, mock_weight_category_era):
+        """Saving or deleting an era updates the timeline."""
+        first, second, current = mock_weight_category_era
+        assert first.date_end == date(2017, 1, 1)
+        assert not first.is_current and current.is_current
+        second.delete()
+        assert first.date_end == date(2018, 1, 1)
+        era = WeightCategoryEra.objects.create(date_start=date(2022, 1, 1))
+        assert WeightCategoryEra.objects.resolve_era(date(2023, 1, 1)) == era
+        assert not current.is_current
+
 
 class TestWeightCategory:
     @pytest.mark.parametrize(
@@ -114,3 +152,79 @@ class TestWeightCategory:
     #             lower_age_bound=test_input.lower_age_bound,
     #         )
     #         assert age_category.name == test_input.name
+
+
+class TestWeightCategoryResolve:
+    @pytest.mark.parametrize(
+        "test_input,expected",
+        [
+            pytest.param(("W48", date(2010, 6, 1)), "W48", id="1998_W48"),
+            pytest.param(("W87+", date(2020, 6, 1)), "W87+", id="2018_W87+"),
+            pytest.param(("W45", date(1990, 6, 1)), None, id="before_eras"),
+        ],
+    )
+    def test_resolve(self, mock_weight_categories, test_input, expected):
+        """Weight category names resolve within the era of the date."""
+        weight_class = WeightCategory.objects.resolve(*test_input)
+        if expected is None:
+            assert weight_class is None
+        else:
+            assert str(weight_class) == expected
+
+    def test_resolve_wrong_era(self, mock_weight_categories):
+        """Weight categories from another era do not resolve."""
+        with pytest.raises(WeightCategory.DoesNotExist):
+            WeightCategory.objects.resolve("W48", date(2020, 6, 1))
+
+    def test_resolve_many(self, mock_weight_categories):
+        """Weight categories of an era resolve in one query."""
+        resolved = WeightCategory.objects.resolve_many(
+            {"W45", "W48"}, date(2020, 6, 1)
+        )
+        assert resolved == {"W45": mock_weight_categories[4]}
+        assert WeightCategory.objects.resolve_many(
+            {"W45"}, date(1990, 6, 1)
+        ) == {"W45": None}
+
+    def test_lift_weight_class(
+        self,
+        mock_weight_categories,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+    ):
+        """Lifts are linked to the weight category of their era."""
+        competition = post2019_pre2022_competition_factory()
+        lift = lift_factory(competition=competition, weight_category="W45")
+        assert lift.weight_class == mock_weight_categories[4]
+        with pytest.raises(
+            ValidationError, match="Weightclass from wrong era."
+        ):
+            lift_factory(competition=competition, weight_category="W48")
+
+    def test_lift_before_eras(
+        self, mock_weight_categories, lift_factory, competition_factory
+    ):
+        """Lifts before the first era are not validated."""
+        competition = competition_factory(date_start=datetime(1995, 6, 1))
+        lift = lift_factory(competition=competition, weight_category="W48")
+        lift.full_clean()
+        assert lift.weight_class is None
+
+    def test_legacy_lift(
+        self,
+        mock_weight_categories,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+    ):
+        """Saved lifts of a category from another era are left unlinked."""
+        competition = post2019_pre2022_competition_factory()
+        lift = lift_factory(competition=competition, weight_category="W45")
+        Lift.objects.filter(pk=lift.pk).update(weight_category="W48")
+        lift = Lift.objects.get(pk=lift.pk)
+        lift.save()
+        assert lift.weight_class is None
+        lift.weight_category = "W44"
+        with pytest.raises(
+            ValidationError, match="Weightclass from wrong era."
+        ):
+            lift.save()
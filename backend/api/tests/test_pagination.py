@@ -0,0 +1,94 @@
+"""Testing pagination counts."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from api.models import Athlete
+from api.views import pagination
+from api.views.pagination import EstimatedCountPaginator
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEstimatedCount:
+    """Testing `count` of paginated responses."""
+
+    url = "/v1/athletes"
+
+    def test_exact_count(self, client, athlete_factory):
+        """Small counts are exact and expire when athletes change."""
+        athletes = [athlete_factory() for _ in range(3)]
+        response = client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert result["count"] == 3
+        assert result["count_estimated"] is False
+
+        athletes[0].delete()
+        assert client.get(self.url).json()["count"] == 2
+        athlete_factory()
+        assert client.get(self.url).json()["count"] == 3
+
+    def test_estimated_count(self, client, athlete_factory, monkeypatch):
+        """Counts above the threshold are estimated."""
+        monkeypatch.setattr(EstimatedCountPaginator, "estimate_threshold", -1)
+        for _ in range(3):
+            athlete_factory()
+        result = client.get(f"{self.url}?page_size=2").json()
+        assert result["count_estimated"] is True
+        assert result["count"] >= 0
+
+    @pytest.mark.parametrize("estimate", [2, 100])
+    def test_estimate_corrected(
+        self, client, athlete_factory, monkeypatch, estimate
+    ):
+        """Estimates are corrected by the pages, `next` follows the rows."""
+        monkeypatch.setattr(EstimatedCountPaginator, "estimate_threshold", -1)
+        monkeypatch.setattr(
+            pagination, "estimate_count", lambda queryset: estimate
+        )
+        for _ in range(3):
+            athlete_factory()
+        result = client.get(f"{self.url}?page_size=2").json()
+        assert result["count"] == max(estimate, 3)
+        assert result["count_estimated"] is True
+        assert len(result["results"]) == 2
+
+        result = client.get(result["next"]).json()
+        assert result["count"] == 3
+        assert result["count_estimated"] is False
+        assert len(result["results"]) == 1
+        assert result["next"] is None
+        response = client.get(f"{self.url}?page_size=2&page=3")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_estimate_past_rows(self, client, athlete_factory, monkeypatch):
+        """Pages past an overestimate correct the count exactly."""
+        monkeypatch.setattr(EstimatedCountPaginator, "estimate_threshold", -1)
+        monkeypatch.setattr(pagination, "estimate_count", lambda queryset: 100)
+        athlete_factory()
+        response = client.get(f"{self.url}?page_size=2&page=3")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        result = client.get(f"{self.url}?page_size=2").json()
+        assert result["count"] == 1
+        assert result["count_estimated"] is False
+
+    @pytest.mark.parametrize("estimated", [False, True])
+    def test_cached_count(self, athlete_factory, monkeypatch, estimated):
+        """Counts, exact or estimated, are queried once until invalidated."""
+        if estimated:
+            monkeypatch.setattr(
+                EstimatedCountPaginator, "estimate_threshold", -1
+            )
+        athlete_factory()
+        queryset = Athlete.objects.all()
+        with CaptureQueriesContext(connection) as first:
+            count = EstimatedCountPaginator(queryset, 20).count
+        assert first.captured_queries
+        with CaptureQueriesContext(connection) as second:
+            paginator = EstimatedCountPaginator(queryset, 20)
+            assert paginator.count == count
+        assert paginator.count_estimated is estimated
+        assert not second.captured_queries
@@ -1,6 +1,8 @@
 """Testing search functionality - combined search."""
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
 pytestmark = pytest.mark.django_db
@@ -20,3 +22,44 @@ class TestSearch:
         assert response.status_code == status.HTTP_200_OK
         result = response.json()
         assert result["count"] >= expected
+
+    def test_search_documents(
+        self,
+        client,
+        lift_factory,
+        post2019_pre2022_competition_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        """Athletes and their lifts are found through the search documents."""
+        with django_capture_on_commit_callbacks(execute=True):
+            lift = lift_factory(
+                competition=post2019_pre2022_competition_factory()
+            )
+        lift.athlete.last_name = "Searchable"
+        lift.athlete.save()
+        response = client.get(f"{self.url}searchable")
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert result["count"] == 2
+        assert {item["query_result_type"] for item in result["results"]} == {
+            "Athlete",
+            "Lift",
+        }
+        assert (
+            "<b>Searchable</b>"
+            in result["results"][0]["query_result_headline"]
+        )
+
+    def test_search_athletes_queries(self, client, athlete_factory):
+        """Athletes are summarised without a query per athlete."""
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(f"{self.url}searchable")
+            assert response.status_code == status.HTTP_200_OK
+            return len(context.captured_queries)
+
+        athlete_factory(last_name="Searchable")
+        single = count_queries()
+        athlete_factory.create_batch(4, last_name="Searchable")
+        assert count_queries() == single
@@ -1,6 +1,7 @@
 import pytest
 
-from api.models.utils import determine_grade
+from api.models.utils import determine_grade, grade_many
+from api.models.utils.grading import STANDARDS
 
 
 @pytest.mark.parametrize(
@@ -20,3 +21,20 @@ def test_determine_grade(test_input, expected):
         )
         == expected
     )
+
+
+def test_grade_many():
+    """Grading many lifts matches the best grade reached by each."""
+
+    def scan(total_lifted, weight_category):
+        for grade, minimum in STANDARDS[weight_category].items():
+            if minimum is not None and total_lifted >= minimum:
+                return grade.title()
+        return None
+
+    weight_categories = [wc for wc in STANDARDS for _ in range(0, 400, 7)]
+    totals = [total for _ in STANDARDS for total in range(0, 400, 7)]
+    assert grade_many(totals, weight_categories) == [
+        scan(total, wc) for total, wc in zip(totals, weight_categories)
+    ]
+    assert grade_many([300], ["X99"]) == [None]
@@ -9,6 +9,7 @@ from api.models.utils import (
     age_category,
     best_lift,
     calculate_sinclair,
+    calculate_sinclair_many,
     ranking_suffixer,
 )
 
@@ -228,8 +229,61 @@ def test_age_category_error(test_input, exception):
             343.964,
             id="W49",
         ),
+        pytest.param(
+            {
+                "bodyweight": 80,
+                "total_lifted": 300,
+                "weight_category": "M81",
+                "yearborn": 1990,
+                "lift_year": 2022,
+            },
+            383.359,
+            id="M81 - 2021 cycle",
+        ),
+        pytest.param(
+            {
+                "bodyweight": 80,
+                "total_lifted": 300,
+                "weight_category": "M85",
+                "yearborn": 1990,
+                "lift_year": 2014,
+            },
+            369.92,
+            id="M85 - 2013 cycle",
+        ),
+        pytest.param(
+            {
+                "bodyweight": 64,
+                "total_lifted": 200,
+                "weight_category": "W64",
+                "yearborn": 1990,
+                "lift_year": None,
+            },
+            260.055,
+            id="W64 - current cycle",
+        ),
     ],
 )
 def test_calculate_sinclair(test_input, expected):
     """Calculate sinclair."""
     assert calculate_sinclair(**test_input) == round(D(expected), 3)
+
+
+def test_calculate_sinclair_many():
+    """Batch sinclairs match `calculate_sinclair()` exactly."""
+    bodyweights = [D(bodyweight) / 100 for bodyweight in range(3000, 20000, 7)]
+    totals = [(idx * 37) % 450 for idx in range(len(bodyweights))]
+    sexes = ["M" if idx % 2 else "W" for idx in range(len(bodyweights))]
+    lift_years = [2005 + idx % 20 for idx in range(len(bodyweights))]
+    assert calculate_sinclair_many(bodyweights, totals, sexes, lift_years) == [
+        calculate_sinclair(
+            bodyweight=bodyweight,
+            total_lifted=total,
+            weight_category=sex,
+            yearborn=None,
+            lift_year=lift_year,
+        )
+        for bodyweight, total, sex, lift_year in zip(
+            bodyweights, totals, sexes, lift_years
+        )
+    ]
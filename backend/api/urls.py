@@ -7,7 +7,9 @@ from rest_framework_nested.routers import NestedDefaultRouter
 from api.views import (
     AthleteViewSet,
     CompetitionViewSet,
+    ExportAPIView,
     LiftViewSet,
+    RankingAPIView,
     SearchAPIView,
 )
 
@@ -34,4 +36,10 @@ urlpatterns = [
     path("", include(router.urls)),
     path("", include(competitions_router.urls)),
     path("search", SearchAPIView.as_view(), name="search"),
+    path("rankings", RankingAPIView.as_view(), name="rankings"),
+    path(
+        "export/<str:resource>.<str:file_format>",
+        ExportAPIView.as_view(),
+        name="export",
+    ),
 ]
@@ -1,6 +1,8 @@
 from .athletes import AthleteViewSet
 from .competitions import CompetitionViewSet
+from .exports import ExportAPIView
 from .lifts import LiftViewSet
+from .rankings import RankingAPIView
 from .search import SearchAPIView
 
 __all__ = [
@@ -8,4 +10,6 @@ __all__ = [
     "CompetitionViewSet",
     "LiftViewSet",
     "SearchAPIView",
+    "RankingAPIView",
+    "ExportAPIView",
 ]
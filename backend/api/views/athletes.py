@@ -6,9 +6,11 @@ from drf_spectacular.utils import (
 from hashid_field import Hashid
 from rest_framework import permissions, viewsets
 
-from api.models import Athlete
+from api.models import Athlete, Lift
+from api.models.caches import response_version_key
 from api.serializers import AthleteDetailSerializer, AthleteSerializer
-from api.views.pagination import StandardSetPagination
+from api.views.cache import CachedResponseMixin
+from api.views.pagination import CursorOptionalSetPagination
 
 from .filters import AthleteFilter
 
@@ -190,9 +192,12 @@ from .filters import AthleteFilter
         ],
     ),
 )
-class AthleteViewSet(viewsets.ModelViewSet):
+class AthleteViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """`Athlete` view is paginated to `20`.
 
+    Add `?cursor=` for cursor pagination, which follows the `next` links \
+            without counting the athletes.
+
     Text search acts on `first_name` and `last_name`. Although there is a \
             notion to move on to `full_name` only.
 
@@ -211,11 +216,46 @@ class AthleteViewSet(viewsets.ModelViewSet):
     filterset_class = AthleteFilter
     ordering = ["last_name"]
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    pagination_class = StandardSetPagination
+    pagination_class = CursorOptionalSetPagination
 
     def get_queryset(self):
         """Access entire Athlete model."""
-        return Athlete.objects.all()
+        queryset = Athlete.objects.with_summary()
+        if self.action == "retrieve":
+            queryset = queryset.with_lifts()
+        return queryset
+
+    def perform_create(self, serializer):
+        """Respond with the summary of the created athlete."""
+        serializer.save()
+        serializer.instance = self.get_queryset().get(
+            pk=serializer.instance.pk
+        )
+
+    def perform_update(self, serializer):
+        """Respond with the summary of the updated athlete."""
+        self.perform_create(serializer)
+
+    def get_version_keys(self):
+        """The athlete, when retrieving an athlete."""
+        if self.action != "retrieve":
+            return super().get_version_keys()
+        return [response_version_key("athlete", self.history_pk(Athlete))]
+
+    def get_history_filters(self):
+        """The athlete and their competitions, when retrieving an athlete.
+
+        All lifts of the competitions are included, they decide the placing.
+        """
+        if self.action != "retrieve":
+            return super().get_history_filters()
+        pk = self.history_pk(Athlete)
+        competitions = Lift.objects.filter(athlete=pk).values("competition")
+        return {
+            "athlete": {"reference_id": int(pk)},
+            "competition": {"reference_id__in": competitions},
+            "lift": {"competition__in": competitions},
+        }
 
     def get_serializer_class(self):
         """Get serializer for Athlete.
@@ -0,0 +1,138 @@
+"""Response cache for read-only views."""
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag, urlencode
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+
+from api.models.caches import response_version_key, response_versions
+
+CACHED_MODELS = ("athlete", "competition", "lift")
+
+if TYPE_CHECKING:
+    # the views it is mixed into, `ListAPIView` has no `retrieve`
+    _ViewBase = viewsets.ReadOnlyModelViewSet
+else:
+    _ViewBase = object
+
+
+def last_modified(history_filters):
+    """Latest `history_date` in the filtered history of each model.
+
+    Args:
+        history_filters (dict[str, dict]): filter kwargs by model name.
+    """
+    dates = [
+        apps.get_model("api", f"Historical{model_name}")
+        .objects.filter(**filters)
+        .aggregate(last_modified=Max("history_date"))
+        .get("last_modified")
+        for model_name, filters in history_filters.items()
+    ]
+    dates = [date for date in dates if date is not None]
+    return max(dates, default=None)
+
+
+class CachedResponseMixin(_ViewBase):
+    """Cache `list` and `retrieve` responses until what they show changes.
+
+    Responses are cached per url, including query params and page, and per \
+            version of `get_version_keys()`. The versions are bumped by the \
+            `post_save`/`post_delete` receivers in `api.signals`. `ETag` \
+            and `Last-Modified` come from the history of `cache_models`, so \
+            `If-None-Match` and `If-Modified-Since` are answered with \
+            `304 Not Modified` before serializing.
+
+    A local memory cache is per process, configure `REDIS_URL` when running \
+            several workers.
+    """
+
+    cache_models = CACHED_MODELS
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_history_filters(self):
+        """Filters on the history of each model `Last-Modified` is taken from.
+
+        Defaults to the whole history of `cache_models`, views narrow it down \
+                to the requested resource.
+        """
+        return {model_name: {} for model_name in self.cache_models}
+
+    def get_version_keys(self):
+        """Keys of the versions the cached response expires with.
+
+        Defaults to the lists of `cache_models`, views narrow it down to the \
+                requested resource, see `api.models.caches`.
+        """
+        return [
+            response_version_key(model_name)
+            for model_name in self.cache_models
+        ]
+
+    def history_pk(self, model, kwarg="pk"):
+        """Primary key of `model` in the url, `ValidationError` if invalid."""
+        return model._meta.pk.to_python(self.kwargs[kwarg])
+
+    def response_cache_key(self, request) -> str:
+        """Key of the url and the current versions of `get_version_keys()`."""
+        versions = response_versions(self.get_version_keys())
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        url = f"{request.build_absolute_uri(request.path)}?{query}"
+        signature = f"{url}{versions}"
+        return f"response_{hashlib.md5(signature.encode()).hexdigest()}"
+
+    def cached_response(self, action, request, *args, **kwargs):
+        try:
+            key = self.response_cache_key(request)
+            cached = cache.get(key)
+            if cached is None:
+                modified = last_modified(self.get_history_filters())
+        except ValidationError:
+            # invalid primary key, left to the action to respond
+            return action(request, *args, **kwargs)
+        if cached is None:
+            # of the history only, the versions of the key are server state
+            etag = quote_etag(hashlib.md5(str(modified).encode()).hexdigest())
+        else:
+            etag, modified = cached["etag"], cached["last_modified"]
+
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=modified and int(modified.timestamp()),
+        )
+        if not_modified is not None:
+            return self._set_conditional_headers(not_modified, etag, modified)
+
+        if cached is None:
+            response = action(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cached = {
+                "data": response.data,
+                "etag": etag,
+                "last_modified": modified,
+            }
+            cache.set(key, cached, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+        return self._set_conditional_headers(
+            Response(cached["data"]), etag, modified
+        )
+
+    def _set_conditional_headers(self, response, etag, modified):
+        response["ETag"] = etag
+        if modified is not None:
+            response["Last-Modified"] = http_date(modified.timestamp())
+        return response
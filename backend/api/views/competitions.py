@@ -1,30 +1,69 @@
 """Viewset for competitions."""
 
 from rest_framework import viewsets
+from rest_framework.response import Response
 
 from api.models import Competition
+from api.models.caches import response_version_key
 from api.serializers import CompetitionDetailSerializer, CompetitionSerializer
-from api.views.pagination import StandardSetPagination
+from api.views.cache import CachedResponseMixin
+from api.views.pagination import CursorOptionalSetPagination
+from api.views.snapshots import snapshot_data
 
 from .filters import CompetitionFilter
 
 
-class CompetitionViewSet(viewsets.ModelViewSet):
+class CompetitionViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     # Competition
 
     - List of Competitions.
-    - Paginated.
+    - Paginated, add `?cursor=` for cursor pagination without a count.
+    - A competition with its results is served from a stored snapshot, \
+            computed live while the snapshot is rebuilt.
 
     """
 
     filterset_class = CompetitionFilter
     ordering = ["-date_start"]
-    pagination_class = StandardSetPagination
+    pagination_class = CursorOptionalSetPagination
 
     def get_queryset(self):
+        if self.action == "retrieve":
+            return Competition.objects.select_related("snapshot")
         return Competition.objects.all()
 
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            self.retrieve_snapshot, request, *args, **kwargs
+        )
+
+    def retrieve_snapshot(self, request, *args, **kwargs):
+        """The competition from its snapshot, serialized while it is stale."""
+        instance = self.get_object()
+        data = snapshot_data(instance, request)
+        if data is None:
+            data = self.get_serializer(instance).data
+        return Response(data)
+
+    def get_version_keys(self):
+        """The competition, when retrieving a competition."""
+        if self.action != "retrieve":
+            return super().get_version_keys()
+        return [
+            response_version_key("competition", self.history_pk(Competition))
+        ]
+
+    def get_history_filters(self):
+        """The competition and its lifts, when retrieving a competition."""
+        if self.action != "retrieve":
+            return super().get_history_filters()
+        pk = self.history_pk(Competition)
+        return {
+            "competition": {"reference_id": int(pk)},
+            "lift": {"competition": pk},
+        }
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return CompetitionDetailSerializer
@@ -0,0 +1,115 @@
+"""Streaming exports."""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.views import APIView
+
+from api.models import Athlete, Competition, Lift
+from api.models.managers.athletes import EXPORT_FIELDS as ATHLETE_FIELDS
+from api.models.managers.competitions import (
+    EXPORT_FIELDS as COMPETITION_FIELDS,
+)
+from api.models.managers.lifts import EXPORT_FIELDS as LIFT_FIELDS
+from api.models.utils import ranking_suffixer
+
+from .renderers import CSVRenderer, NDJSONRenderer
+
+# rows fetched per round trip of the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+
+def related_pk(params, model):
+    """Primary key of the `model` given in `params`, e.g. `?athlete=`.
+
+    Raises:
+        ValidationError: The value is not a valid hashid (400).
+        NotFound: No such object (404).
+    """
+    name = model._meta.model_name
+    try:
+        pk = model._meta.pk.to_python(params[name])
+    except DjangoValidationError as exc:
+        raise ValidationError({name: exc.messages})
+    if not model.objects.filter(pk=pk).exists():
+        raise NotFound(f"No {name} {params[name]}.")
+    return pk
+
+
+def lift_rows(params):
+    """Lifts, of `?competition=` and `?athlete=` if given, with placing."""
+    queryset = Lift.objects.all()
+    if "competition" in params:
+        queryset = queryset.filter(competition=related_pk(params, Competition))
+    if "athlete" in params:
+        # the window would only rank the athlete's lifts against each other
+        queryset = queryset.filter(
+            athlete=related_pk(params, Athlete)
+        ).with_placing_subquery()
+    else:
+        queryset = queryset.with_placing()
+    fields = [field for field in LIFT_FIELDS if field != "placing_rank"]
+    fields.append("placing")
+    rows = queryset.for_export().iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return fields, (
+        {
+            **row,
+            "placing": ranking_suffixer(row["placing_rank"])
+            if row["total_lifted"]
+            else "-",
+        }
+        for row in rows
+    )
+
+
+def athlete_rows(params):
+    """Athletes with their number of lifts and bests."""
+    rows = Athlete.objects.for_export().iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return ATHLETE_FIELDS, rows
+
+
+def competition_rows(params):
+    """Competitions with their number of lifts."""
+    rows = Competition.objects.for_export().iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+    return COMPETITION_FIELDS, rows
+
+
+EXPORTS = {
+    "lifts": lift_rows,
+    "athletes": athlete_rows,
+    "competitions": competition_rows,
+}
+
+
+class ExportAPIView(APIView):
+    """
+    # Export
+
+    - `export/<lifts|athletes|competitions>.<csv|ndjson>`
+    - Lifts include total, sinclair, grade and placing, filter them by \
+            `?competition=` or `?athlete=` for results or athlete histories.
+    - Streamed from a server-side cursor, not paginated nor cached.
+    - `Accept` must admit the format, errors are rendered in it too.
+
+    """
+
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+
+    def get_format_suffix(self, **kwargs):
+        """Negotiate the renderer of the extension, e.g. `csv`."""
+        return kwargs.get("file_format")
+
+    def get(self, request, resource, file_format):
+        if resource not in EXPORTS:
+            raise NotFound()
+        fields, rows = EXPORTS[resource](request.query_params)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(fields, rows), content_type=renderer.media_type
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{resource}.{file_format}"'
+        return response
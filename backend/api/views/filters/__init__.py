@@ -2,5 +2,6 @@
 
 from .athletes import AthleteFilter
 from .competitions import CompetitionFilter
+from .rankings import RankingFilter
 
-__all__ = ["CompetitionFilter", "AthleteFilter"]
+__all__ = ["CompetitionFilter", "AthleteFilter", "RankingFilter"]
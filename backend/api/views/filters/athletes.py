@@ -13,7 +13,7 @@ class AthleteFilter(filters.FilterSet):
     )
 
     def search_filter(self, queryset, name, value):
-        return Athlete.objects.search(query=value)
+        return queryset.search(query=value)
 
     class Meta:
         model = Athlete
@@ -11,7 +11,7 @@ class CompetitionFilter(filters.FilterSet):
     ordering = filters.OrderingFilter(fields=(("date_start", "date"),))
 
     def search_filter(self, queryset, name, value):
-        return Competition.objects.search(query=value)
+        return queryset.search(query=value)
 
     class Meta:
         model = Competition
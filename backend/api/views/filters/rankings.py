@@ -0,0 +1,36 @@
+"""Ranking custom filtering."""
+
+from django_filters import rest_framework as filters
+
+from api.models import Ranking
+from api.models.rankings import DISCIPLINE_CHOICES
+from api.models.utils.types import AgeCategories
+
+AGE_CATEGORY_CHOICES = [
+    (name.removeprefix("is_"), name.removeprefix("is_").replace("_", " "))
+    for name in AgeCategories.__annotations__
+]
+
+
+class RankingFilter(filters.FilterSet):
+    discipline = filters.ChoiceFilter(
+        choices=DISCIPLINE_CHOICES, label="Discipline, defaults to total"
+    )
+    age_category = filters.ChoiceFilter(
+        choices=AGE_CATEGORY_CHOICES,
+        method="age_category_filter",
+        label="Age category",
+    )
+
+    def age_category_filter(self, queryset, name, value):
+        return queryset.filter(age_categories__contains=[value])
+
+    class Meta:
+        model = Ranking
+        fields = [
+            "discipline",
+            "sex",
+            "weight_category",
+            "year",
+            "age_category",
+        ]
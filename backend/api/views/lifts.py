@@ -1,21 +1,102 @@
 """Lift viewset."""
 
-from rest_framework import viewsets
+from django.shortcuts import get_object_or_404
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
 
-from api.models import Lift
-from api.serializers import LiftSerializer
+from api.models import Competition, CompetitionSnapshot, Lift
+from api.models.caches import (
+    invalidate_counts,
+    invalidate_lift_responses,
+    response_version_key,
+)
+from api.serializers import LiftBulkSerializer, LiftSerializer
+from api.views.cache import CachedResponseMixin
+from api.views.pagination import LiftSetPagination
+from api.views.parsers import CSVParser
 
 
-class LiftViewSet(viewsets.ModelViewSet):
+class LiftViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     # Lift
 
+    - Not paginated, unless `?page_size=` or `?cursor=` is given.
+    - `POST bulk` creates the lifts of a whole competition at once, from \
+            a JSON list or a CSV with a header of the lift fields.
+
     """
 
+    pagination_class = LiftSetPagination
+
     def get_queryset(self):
-        return Lift.objects.filter(
+        queryset = Lift.objects.filter(
             competition=self.kwargs["competitions_pk"],
-        )
+        ).for_serializer()
+        if self.action == "list":
+            # placing is ranked across the whole competition, so only
+            # annotate when the queryset is not narrowed to a single lift
+            if LiftSetPagination.use_cursor(self.request):
+                # the cursor position filters out lifts the window would rank
+                queryset = queryset.with_placing_subquery()
+            else:
+                queryset = queryset.with_placing()
+        return queryset
+
+    def get_version_keys(self):
+        """The competition, its lifts are shown in its detail too."""
+        pk = self.history_pk(Competition, kwarg="competitions_pk")
+        return [response_version_key("competition", pk)]
+
+    def get_history_filters(self):
+        """The competition and its lifts, they decide the placing."""
+        pk = self.history_pk(Competition, kwarg="competitions_pk")
+        return {
+            "competition": {"reference_id": int(pk)},
+            "lift": {"competition": pk},
+        }
 
     def get_serializer_class(self):
+        if self.action == "bulk":
+            return LiftBulkSerializer
         return LiftSerializer
+
+    @action(
+        detail=False,
+        methods=["post"],
+        parser_classes=[JSONParser, CSVParser],
+    )
+    def bulk(self, request, competitions_pk=None):
+        """Create many lifts in one transaction, all or none are created.
+
+        Errors are listed in the order of the uploaded lifts.
+        """
+        competition = get_object_or_404(Competition, pk=competitions_pk)
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            context={
+                **self.get_serializer_context(),
+                "competition": competition,
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        created = {int(lift.pk) for lift in serializer.save()}
+        # `bulk_create()` sends no `post_save` to expire them
+        invalidate_counts()
+        invalidate_lift_responses([competition.pk])
+        CompetitionSnapshot.objects.expire([competition.pk])
+        lifts = [
+            lift
+            for lift in Lift.objects.filter(competition=competition)
+            .for_serializer()
+            .with_placing()
+            if int(lift.pk) in created
+        ]
+        return Response(
+            LiftSerializer(
+                lifts, many=True, context=self.get_serializer_context()
+            ).data,
+            status=status.HTTP_201_CREATED,
+        )
@@ -1,21 +1,222 @@
 """Custom pagination for views."""
 
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
+from api.models.caches import count_version
+
+COUNT_CACHE_TIMEOUT = 60 * 60
+
+
+def estimate_count(queryset) -> int:
+    """Planner estimate of the number of rows in `queryset`.
+
+    Unfiltered querysets use the table's `reltuples` statistic, others the \
+            row estimate of the query plan.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.is_sliced:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # -1 for tables never vacuumed or analyzed
+            if row is not None and row[0] >= 0:
+                return int(row[0])
+        sql, params = query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_cache_key(queryset) -> str:
+    """Cache key of the count of `queryset`, until `invalidate_counts()`."""
+    sql, params = queryset.query.sql_with_params()
+    version = count_version()
+    signature = hashlib.md5(f"{sql}{params}".encode()).hexdigest()
+    return f"pagination_count_{version}_{signature}"
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator counting querysets by estimate when they are large.
+
+    Counts are estimated above `estimate_threshold` rows, otherwise exact. \
+            Either is cached until `invalidate_counts()`, `count_estimated` \
+            tells which one was used. Pages of an estimated count fetch one \
+            row more, so `next` is linked only if there are more rows. A \
+            page past the rows corrects the cached count to the rows found.
+    """
+
+    estimate_threshold = 10_000
+    count_estimated = False
+    _count: int | None = None
+
+    @property
+    def count(self) -> int:
+        if self._count is None:
+            if not hasattr(self.object_list, "query"):
+                self._count = super().count
+                return self._count
+            key = count_cache_key(self.object_list)
+            cached = cache.get(key)
+            if cached is None:
+                estimate = estimate_count(self.object_list)
+                if estimate > self.estimate_threshold:
+                    cached = (estimate, True)
+                else:
+                    cached = (super().count, False)
+                cache.set(key, cached, timeout=COUNT_CACHE_TIMEOUT)
+            self._count, self.count_estimated = cached
+        return self._count
+
+    def correct_count(self, count: int, estimated: bool = False) -> None:
+        """Cache `count` instead of the estimate."""
+        self._count, self.count_estimated = count, estimated
+        # cached from the estimate
+        self.__dict__.pop("num_pages", None)
+        cache.set(
+            count_cache_key(self.object_list),
+            (count, estimated),
+            timeout=COUNT_CACHE_TIMEOUT,
+        )
+
+    def page(self, number):
+        """Page `number`, the count corrected if it was estimated wrong."""
+        try:
+            number = self.validate_number(number)
+        except EmptyPage:
+            # pages after an underestimate may have rows
+            number = int(number)
+            if not self.count_estimated or number < 1:
+                raise
+        if not self.count_estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if len(rows) > self.per_page:
+            if bottom + len(rows) > self.count:
+                self.correct_count(bottom + len(rows), estimated=True)
+        elif rows or number == 1:
+            self.correct_count(bottom + len(rows))
+        else:
+            # past the rows, how far is unknown
+            self.correct_count(super().count)
+            number = self.validate_number(number)
+        return Page(rows[: self.per_page], number, self)
+
 
 class StandardSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 10_000
+    django_paginator_class = EstimatedCountPaginator
 
     def get_paginated_response(self, data):
         return Response(
             {
                 "count": self.page.paginator.count,
+                # not set by other paginator classes
+                "count_estimated": getattr(
+                    self.page.paginator, "count_estimated", False
+                ),
                 "next": self.get_next_link(),
                 "previous": self.get_previous_link(),
                 "per_page": self.page.paginator.per_page,
                 "results": data,
             }
         )
+
+
+class StandardCursorPagination(CursorPagination):
+    """Cursor pagination in the order of the queryset.
+
+    Pages are fetched by position rather than offset and there is no \
+            `count`, so every page costs the same. The position is of the \
+            first field ordered by, e.g. of `?ordering=`.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 1_000
+
+    def get_ordering(self, request, queryset, view):
+        """Ordering of `queryset` with the primary key to break ties.
+
+        `Meta.ordering` unless the queryset is ordered, e.g. by the \
+                `OrderingFilter` of the filterset.
+
+        Raises:
+            ValidationError: The queryset is ordered by expressions (400).
+        """
+        ordering = tuple(queryset.query.order_by) or tuple(
+            queryset.model._meta.ordering
+        )
+        if not all(isinstance(field, str) for field in ordering):
+            raise ValidationError(
+                {self.cursor_query_param: "Not supported with this ordering."}
+            )
+        if ordering[-1:] not in (("pk",), ("-pk",)):
+            ordering += ("pk",)
+        return ordering
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "per_page": self.page_size,
+                "results": data,
+            }
+        )
+
+
+class CursorOptionalSetPagination(StandardSetPagination):
+    """`StandardSetPagination`, or `StandardCursorPagination` with `?cursor=`.
+
+    Use an empty `cursor` for the first page, then follow `next`.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_paginator = None
+
+    @classmethod
+    def use_cursor(cls, request) -> bool:
+        return cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.use_cursor(request):
+            return super().paginate_queryset(queryset, request, view)
+        self.cursor_paginator = StandardCursorPagination()
+        return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is None:
+            return super().get_paginated_response(data)
+        return self.cursor_paginator.get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        cursor_parameters = [
+            parameter
+            for parameter in StandardCursorPagination().get_schema_operation_parameters(
+                view
+            )
+            if parameter["name"] == self.cursor_query_param
+        ]
+        return (
+            super().get_schema_operation_parameters(view) + cursor_parameters
+        )
+
+
+class LiftSetPagination(CursorOptionalSetPagination):
+    """Lifts are not paginated unless `page_size` or `cursor` is given."""
+
+    page_size = None
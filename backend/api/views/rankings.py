@@ -0,0 +1,58 @@
+"""Rankings view."""
+
+from rest_framework.generics import ListAPIView
+
+from api.models import Ranking
+from api.serializers import RankingSerializer
+
+from .cache import CachedResponseMixin
+from .filters import RankingFilter
+from .pagination import StandardCursorPagination
+
+
+class RankingAPIView(CachedResponseMixin, ListAPIView):
+    """
+    # Rankings
+
+    - Lifts ranked by `discipline`: `snatch`, `cnj`, `total` (default) or \
+            `sinclair`.
+    - The best lift of each athlete among the filtered lifts, the first if \
+            tied.
+    - Filter by `sex`, `weight_category`, `year` and `age_category` (e.g. \
+            `junior`, `master_35_39`).
+    - Cursor paginated, follow `next`.
+
+    """
+
+    filterset_class = RankingFilter
+    pagination_class = StandardCursorPagination
+
+    def get_queryset(self):
+        queryset = Ranking.objects.select_related(
+            "athlete", "competition"
+        ).defer(
+            "athlete__yearborn",
+            "competition__location",
+            "competition__date_end",
+        )
+        if not self.request.query_params.get("discipline"):
+            queryset = queryset.filter(discipline="total")
+        return queryset
+
+    def filter_queryset(self, queryset):
+        """Best ranking of each athlete among the filtered ones.
+
+        Picked with `DISTINCT ON` in a subquery, the rankings are still \
+                ordered by value for the cursor.
+        """
+        best = (
+            super()
+            .filter_queryset(queryset)
+            .order_by("athlete_id", "-value", "year", "pk")
+            .distinct("athlete_id")
+            .values("pk")
+        )
+        return queryset.filter(pk__in=best)
+
+    def get_serializer_class(self):
+        return RankingSerializer
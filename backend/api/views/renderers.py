@@ -0,0 +1,84 @@
+"""Response renderers."""
+
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from hashid_field import Hashid
+from rest_framework.renderers import BaseRenderer
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    """Also encode hashids."""
+
+    def default(self, o):
+        if isinstance(o, Hashid):
+            return str(o)
+        return super().default(o)
+
+
+class Echo:
+    """File-like object returning what is written, for `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
+def as_rows(data) -> tuple[list, list]:
+    """Fields and rows of `data`, a dict (e.g. an error) or a list of them."""
+    rows = data if isinstance(data, list) else [data]
+    fields = list(dict.fromkeys(field for row in rows for field in row))
+    return fields, [
+        {
+            field: " ".join(map(str, value))
+            if isinstance(value, list)
+            else value
+            for field, value in row.items()
+        }
+        for row in rows
+    ]
+
+
+class CSVRenderer(BaseRenderer):
+    """Render rows as CSV with a header row.
+
+    Exports are streamed by `stream()`, responses such as errors rendered.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def stream(self, fields, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([row.get(field, "") for field in fields])
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return "".join(self.stream(*as_rows(data))).encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Render rows as JSON objects, one per line.
+
+    Exports are streamed by `stream()`, responses such as errors rendered.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def stream(self, fields, rows):
+        for row in rows:
+            yield json.dumps(
+                {field: row[field] for field in fields}, cls=ExportJSONEncoder
+            ) + "\n"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return "".join(
+            json.dumps(row, cls=ExportJSONEncoder) + "\n" for row in rows
+        ).encode(self.charset)
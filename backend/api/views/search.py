@@ -1,40 +1,30 @@
 """Search viewset."""
 
-from itertools import chain
-
 from rest_framework.generics import ListAPIView
 
-from api.models import Athlete, Competition, Lift
+from api.models import SearchDocument
 from api.serializers import SearchSerializer
 
+from .cache import CachedResponseMixin
 from .pagination import StandardSetPagination
 
 
-class SearchAPIView(ListAPIView):
+class SearchAPIView(CachedResponseMixin, ListAPIView):
     """The search viewset allows search along the `Competition` and `Athlete` models."""
 
     pagination_class = StandardSetPagination
 
     def get_queryset(self):
-
-        request = self.request
-        query = request.GET.get("q", None)
-
-        if query is not None:
-            qs_chain = chain(
-                Athlete.objects.search(query),
-                Competition.objects.search(query),
-                Lift.objects.search(query),
-            )
-
-            qs = sorted(
-                qs_chain,
-                key=lambda instance: instance.rank,
-                reverse=True,
-            )
-            self.count = len(qs)
-            return qs
-        return Athlete.objects.none()
+        query = self.request.GET.get("q", None)
+        return SearchDocument.objects.search(query)
+
+    def paginate_queryset(self, queryset):
+        """Generate headlines for the returned page only."""
+        page = super().paginate_queryset(queryset)
+        query = self.request.GET.get("q", None)
+        if page is not None and query is not None:
+            SearchDocument.objects.add_headlines(page, query)
+        return page
 
     def get_serializer_class(self):
         return SearchSerializer
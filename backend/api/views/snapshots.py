@@ -0,0 +1,47 @@
+"""Competition snapshots in responses.
+
+The detail response of a competition serializes every lift with its placing, \
+        sinclair, grade and age categories. `CompetitionViewSet` serves the \
+        stored `CompetitionSnapshot` instead, and computes the response live \
+        while the snapshot is stale. They are rebuilt by \
+        `CompetitionSnapshotManager`.
+"""
+
+from api.models import CompetitionSnapshot
+
+
+def absolute_urls(data, request):
+    """Copy of `data` with the relative `url`s built on the request host."""
+    if isinstance(data, list):
+        return [absolute_urls(item, request) for item in data]
+    if isinstance(data, dict):
+        return {
+            key: request.build_absolute_uri(value)
+            if key == "url" and isinstance(value, str)
+            else absolute_urls(value, request)
+            for key, value in data.items()
+        }
+    return data
+
+
+def snapshot_data(competition, request) -> dict | None:
+    """Detail response data of `competition` from its snapshot.
+
+    A missing or stale snapshot is rebuilt in the background.
+
+    Args:
+        competition (Competition): Competition selected with its snapshot.
+        request (Request): Request the urls are built on.
+
+    Returns:
+        dict | None: None while the snapshot is missing or stale.
+    """
+    try:
+        snapshot = competition.snapshot
+    except CompetitionSnapshot.DoesNotExist:
+        CompetitionSnapshot.objects.expire([competition.pk])
+        return None
+    if snapshot.is_stale:
+        CompetitionSnapshot.objects.schedule([competition.pk])
+        return None
+    return absolute_urls(snapshot.data, request)
@@ -217,6 +217,31 @@ else:
         }
     }
 
+# Cache
+
+if os.getenv("REDIS_URL", "") != "":
+    # shared by the workers, required with more than one
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+        }
+    }
+else:
+    # local - per process
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# seconds an API response is cached, changes to the data expire it sooner
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 60 * 60))
+# threads rebuilding competition snapshots, 0 rebuilds them on commit
+COMPETITION_SNAPSHOT_WORKERS = int(
+    os.getenv("COMPETITION_SNAPSHOT_WORKERS", 2)
+)
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -258,6 +283,17 @@ INTERNAL_IPS = ["127.0.0.1"]
 
 # Auditlog
 AUDITLOG_INCLUDE_ALL_MODELS = True
+# the models of `api` are audited through `api.models.history.auditlog`, which
+# honours `HISTORY_SYSTEMS` below
+AUDITLOG_EXCLUDE_TRACKING_MODELS = ("api",)
+
+
+# History
+# systems recording the changes of a model by label, e.g.
+# {"api.Lift": ("simple_history",)}, unlisted models of `api` use both
+# `Last-Modified` of cached responses is read from simple history, keep it
+# for athletes, competitions and lifts
+HISTORY_SYSTEMS: dict[str, tuple[str, ...]] = {}
 
 
 # Static files (CSS, JavaScript, Images)